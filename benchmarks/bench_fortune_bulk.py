@@ -0,0 +1,88 @@
+"""
+운세 일괄 계산 벤치마크 (LLM 미사용)
+- calculate_fortune 반복 호출 vs calculate_fortunes_bulk (numpy / 순수 파이썬)
+- 결과가 단일 경로와 완전히 같은지도 함께 확인
+
+실행: python benchmarks/bench_fortune_bulk.py [--profiles 5000]
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import sys
+import time
+from datetime import date, datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.conf import settings  # noqa: E402
+
+from fortune import services  # noqa: E402
+from fortune.services import FortuneCalculator  # noqa: E402
+
+
+def make_profiles(count, seed=0):
+    picker = random.Random(seed)
+    profiles = []
+    for i in range(count):
+        birth_date = date.fromordinal(picker.randint(date(1950, 1, 1).toordinal(), date(2010, 12, 28).toordinal()))
+        profiles.append({
+            'birth_date': birth_date,
+            'gender': picker.choice(['M', 'F']),
+            'birth_time': datetime(2000, 1, 1, picker.randint(0, 23)) if picker.random() < 0.5 else None,
+            'calendar_type': 'lunar' if picker.random() < 0.1 else 'solar',
+            'mbti': picker.choice([None, 'INTJ', 'ENFP']),
+            'user_id': i + 1,
+        })
+    return profiles
+
+
+def timed(label, func, count):
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+    print(f"{label:<32} {elapsed:7.3f}s  {count / elapsed:9.0f} profiles/s")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--profiles', type=int, default=5000)
+    args = parser.parse_args()
+
+    # LLM 호출 없이 기본 텍스트 생성 경로만 측정
+    settings.OPENAI_API_KEY = ''
+    day = date.today()
+    calc = FortuneCalculator()
+    profiles = make_profiles(args.profiles)
+
+    # 사주/음력 변환 캐시 워밍업 (두 경로 모두 같은 조건에서 측정)
+    with contextlib.redirect_stdout(io.StringIO()):
+        calc.calculate_fortunes_bulk(profiles, day)
+
+    single = timed('calculate_fortune x N', lambda: [calc.calculate_fortune(**p, today=day) for p in profiles], len(profiles))
+    bulk = timed('calculate_fortunes_bulk (numpy)', lambda: calc.calculate_fortunes_bulk(profiles, day), len(profiles))
+
+    numpy_module, services.np = services.np, None
+    try:
+        fallback = timed('calculate_fortunes_bulk (python)', lambda: calc.calculate_fortunes_bulk(profiles, day), len(profiles))
+    finally:
+        services.np = numpy_module
+
+    expected = json.dumps(single, ensure_ascii=False)
+    assert json.dumps(bulk, ensure_ascii=False) == expected, 'numpy 일괄 계산 결과 불일치'
+    assert json.dumps(fallback, ensure_ascii=False) == expected, '순수 파이썬 일괄 계산 결과 불일치'
+    print('결과 일치 확인 완료')
+
+
+if __name__ == '__main__':
+    main()
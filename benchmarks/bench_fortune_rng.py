@@ -0,0 +1,90 @@
+"""
+운세 점수 난수 생성 방식 비교 벤치마크
+- 기존: 전역 random.seed(md5) 후 random.randint
+- 변경: 호출마다 random.Random(md5) 생성 후 rng.randint
+
+실행: python benchmarks/bench_fortune_rng.py [--iterations 20000]
+"""
+import argparse
+import hashlib
+import os
+import random
+import sys
+import time
+from datetime import date
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+
+import django  # noqa: E402
+
+django.setup()
+
+from fortune.services import FortuneCalculator  # noqa: E402
+
+DRAWS = [(55, 90), (-10, 15), (-15, 20), (-10, 10), (-10, 15), (-10, 10)]
+
+
+def _seed(today, birth_date, gender):
+    seed_string = f"{today.isoformat()}-{birth_date.isoformat()}-{gender}"
+    return int(hashlib.md5(seed_string.encode()).hexdigest(), 16)
+
+
+def global_seed_draws(today, birth_date, gender):
+    random.seed(_seed(today, birth_date, gender))
+    return [random.randint(a, b) for a, b in DRAWS]
+
+
+def local_rng_draws(today, birth_date, gender):
+    rng = random.Random(_seed(today, birth_date, gender))
+    return [rng.randint(a, b) for a, b in DRAWS]
+
+
+def bench(label, func, profiles, today):
+    start = time.perf_counter()
+    for birth_date, gender in profiles:
+        func(today, birth_date, gender)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {elapsed / len(profiles) * 1e6:8.2f} us/request")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--iterations', type=int, default=20000)
+    args = parser.parse_args()
+
+    today = date.today()
+    picker = random.Random(0)
+    profiles = [
+        (date.fromordinal(picker.randint(date(1950, 1, 1).toordinal(), date(2010, 12, 31).toordinal())),
+         picker.choice(['M', 'F']))
+        for _ in range(args.iterations)
+    ]
+
+    # 같은 시드에서 두 방식의 결과가 동일한지 먼저 확인
+    for birth_date, gender in profiles[:1000]:
+        assert global_seed_draws(today, birth_date, gender) == local_rng_draws(today, birth_date, gender)
+
+    print(f"profiles: {len(profiles)}")
+    bench('global random.seed', global_seed_draws, profiles, today)
+    bench('per-call random.Random', local_rng_draws, profiles, today)
+
+    calc = FortuneCalculator()
+    saju_cache = {}
+
+    def full_scores(today, birth_date, gender):
+        saju = saju_cache.get(birth_date)
+        if saju is None:
+            saju = saju_cache[birth_date] = calc._calculate_saju(birth_date)
+        rng = calc._seeded_rng(f"{today.isoformat()}-{birth_date.isoformat()}-{gender}")
+        return calc._calculate_all_fortunes(birth_date, today, saju, rng)
+
+    for birth_date, gender in profiles:
+        full_scores(today, birth_date, gender)  # 사주 계산 워밍업
+    bench('_calculate_all_fortunes', full_scores, profiles, today)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+"""
+아이템 이미지 주요 색상 추출 벤치마크 (ItemAnalyzer.extract_colors)
+- 기존: list(img.getdata()) + 픽셀별 양자화 + Counter
+- 개선: numpy 로 픽셀 버퍼 전체 양자화 + bincount
+- 두 방식의 결과가 같은지도 확인
+
+--images 로 JPEG/PNG 폴더 지정 (없으면 임시 폴더에 합성 샘플 JPEG 생성)
+
+실행 예)
+  python benchmarks/bench_item_colors.py --images media/items --repeat 5
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+
+import django  # noqa: E402
+
+django.setup()
+
+from PIL import Image, ImageDraw, ImageFilter  # noqa: E402
+
+from items.item_analyzer import ItemAnalyzer  # noqa: E402
+
+IMAGE_SUFFIXES = {'.jpg', '.jpeg', '.png'}
+
+
+def make_samples(folder, count, seed):
+    """옷/소품 사진 비슷한 합성 샘플 (배경 + 색 도형 + 노이즈, 800x1000 JPEG)"""
+    picker = random.Random(seed)
+    for i in range(count):
+        background = tuple(picker.randint(180, 255) for _ in range(3))
+        img = Image.new('RGB', (800, 1000), background)
+        draw = ImageDraw.Draw(img)
+        for _ in range(picker.randint(3, 8)):
+            x, y = picker.randint(0, 600), picker.randint(0, 800)
+            color = tuple(picker.randint(0, 255) for _ in range(3))
+            draw.ellipse((x, y, x + picker.randint(80, 400), y + picker.randint(80, 400)), fill=color)
+        img = img.filter(ImageFilter.GaussianBlur(3))
+        img.save(os.path.join(folder, f'sample_{i:03d}.jpg'), quality=85)
+
+
+def load_thumbnails(folder):
+    """analyze_image 와 같은 전처리 (RGB, 200x200 썸네일)"""
+    images = []
+    for path in sorted(Path(folder).iterdir()):
+        if path.suffix.lower() in IMAGE_SUFFIXES:
+            img = Image.open(path)
+            if img.mode != 'RGB':
+                img = img.convert('RGB')
+            img.thumbnail((200, 200))
+            images.append(img)
+    return images
+
+
+def timed(func, images, repeat):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for img in images:
+            func(img)
+    return (time.perf_counter() - started) / (repeat * len(images)) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description='아이템 색상 추출 벤치마크')
+    parser.add_argument('--images', help='JPEG/PNG 폴더 (없으면 합성 샘플 사용)')
+    parser.add_argument('--samples', type=int, default=50, help='합성 샘플 수')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    analyzer = ItemAnalyzer()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        folder = args.images
+        if not folder:
+            make_samples(tmp_dir, args.samples, args.seed)
+            folder = tmp_dir
+        images = load_thumbnails(folder)
+
+    if not images:
+        raise SystemExit(f'이미지가 없습니다: {folder}')
+
+    mismatches = sum(
+        analyzer.extract_colors(img) != analyzer._extract_colors_python(img) for img in images
+    )
+    pixels = sum(img.width * img.height for img in images) / len(images)
+    print(f'이미지 {len(images)}개 (평균 {pixels:.0f} 픽셀), 반복 {args.repeat}회, 결과 불일치 {mismatches}개\n')
+
+    legacy = timed(analyzer._extract_colors_python, images, args.repeat)
+    vectorized = timed(analyzer.extract_colors, images, args.repeat)
+    print(f'{"기존 (getdata + Counter)":<28} {legacy:>8.2f} ms/이미지')
+    print(f'{"numpy (bincount)":<28} {vectorized:>8.2f} ms/이미지')
+    print(f'\n{legacy / vectorized:.0f}배')
+
+
+if __name__ == '__main__':
+    main()
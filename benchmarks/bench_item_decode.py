@@ -0,0 +1,144 @@
+"""
+아이템 이미지 디코딩 벤치마크 (analyze_image 전처리)
+- 기존: Image.open -> convert('RGB') (원본 해상도 전체 디코딩) -> thumbnail
+- 개선: ItemAnalyzer.open_thumbnail (JPEG draft 축소 디코딩 -> thumbnail -> RGB 변환)
+- 방식별로 별도 프로세스에서 실행해 지연 시간과 최대 메모리(VmHWM) 비교, 주요 색상 일치율 확인
+
+--images 로 폰 사진 폴더 지정 (없으면 임시 폴더에 12MP(4032x3024) 합성 JPEG 생성)
+합성 샘플은 컬러(YCbCr), 흑백, CMYK JPEG 을 번갈아 생성 - 컬러 JPEG 은 기존에도 convert 를 건너뛰어
+thumbnail 의 draft 가 적용되므로, 차이는 흑백/CMYK(스캔/편집 앱 저장본) 에서 남
+
+실행 예)
+  python benchmarks/bench_item_decode.py --images ~/phone_photos
+"""
+import argparse
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+
+import django  # noqa: E402
+
+django.setup()
+
+from PIL import Image, ImageDraw, ImageFilter  # noqa: E402
+
+from items.item_analyzer import ItemAnalyzer  # noqa: E402
+
+IMAGE_SUFFIXES = {'.jpg', '.jpeg'}
+SAMPLE_MODES = ('RGB', 'L', 'CMYK')
+
+
+def make_samples(folder, count, seed):
+    """폰 사진 크기 합성 JPEG (4032x3024, 배경 + 색 도형 + 블러, 컬러/흑백/CMYK 번갈아)"""
+    picker = random.Random(seed)
+    for i in range(count):
+        mode = SAMPLE_MODES[i % len(SAMPLE_MODES)]
+        img = Image.new('RGB', (4032, 3024), tuple(picker.randint(150, 255) for _ in range(3)))
+        draw = ImageDraw.Draw(img)
+        for _ in range(picker.randint(3, 8)):
+            x, y = picker.randint(0, 3000), picker.randint(0, 2000)
+            color = tuple(picker.randint(0, 255) for _ in range(3))
+            draw.ellipse((x, y, x + picker.randint(400, 2000), y + picker.randint(400, 2000)), fill=color)
+        img = img.filter(ImageFilter.GaussianBlur(4)).convert(mode)
+        img.save(os.path.join(folder, f'phone_{i:03d}_{mode}.jpg'), quality=90)
+
+
+def peak_rss_kb():
+    """프로세스 최대 RSS (KB) - ru_maxrss 는 fork/exec 시 부모 값을 물려받으므로 /proc 의 VmHWM 우선"""
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def legacy_thumbnail(path):
+    """기존 analyze_image 전처리"""
+    img = Image.open(path)
+    if img.mode != 'RGB':
+        img = img.convert('RGB')
+    img.thumbnail((200, 200))
+    return img
+
+
+def run_child(mode, paths):
+    """한 방식으로 모든 이미지 처리 -> 지연 시간/최대 메모리/주요 색상 (JSON 출력)"""
+    analyzer = ItemAnalyzer()
+    load = legacy_thumbnail if mode == 'legacy' else analyzer.open_thumbnail
+    baseline_kb = peak_rss_kb()
+
+    latencies, dominant = {}, []
+    for path in paths:
+        with Image.open(path) as source:
+            source_mode = source.mode
+        started = time.perf_counter()
+        img = load(path)
+        colors = analyzer.extract_colors(img)
+        latencies.setdefault(source_mode, []).append((time.perf_counter() - started) * 1000)
+        dominant.append(analyzer.get_color_name(colors[0]['rgb']) if colors else None)
+
+    print(json.dumps({
+        'avg_ms': {mode: sum(values) / len(values) for mode, values in latencies.items()},
+        'peak_rss_delta_mb': (peak_rss_kb() - baseline_kb) / 1024,
+        'dominant': dominant,
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='아이템 이미지 디코딩 벤치마크')
+    parser.add_argument('--images', help='JPEG 폴더 (없으면 12MP 합성 샘플 사용)')
+    parser.add_argument('--samples', type=int, default=10, help='합성 샘플 수')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--child', choices=['legacy', 'draft'], help=argparse.SUPPRESS)
+    parser.add_argument('paths', nargs='*', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child, args.paths)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        folder = args.images
+        if not folder:
+            print(f'합성 12MP JPEG {args.samples}개 생성 중...')
+            make_samples(tmp_dir, args.samples, args.seed)
+            folder = tmp_dir
+        paths = [str(p) for p in sorted(Path(folder).iterdir()) if p.suffix.lower() in IMAGE_SUFFIXES]
+        if not paths:
+            raise SystemExit(f'JPEG 이미지가 없습니다: {folder}')
+
+        with Image.open(paths[0]) as first:
+            print(f'이미지 {len(paths)}개 (첫 이미지 {first.size[0]}x{first.size[1]})\n')
+
+        results = {}
+        for mode in ('legacy', 'draft'):
+            output = subprocess.run(
+                [sys.executable, __file__, '--child', mode, *paths],
+                check=True, capture_output=True, text=True,
+            ).stdout
+            results[mode] = json.loads(output.strip().splitlines()[-1])
+
+    modes = list(results['legacy']['avg_ms'])
+    print(f'{"방식":<10}' + ''.join(f'{mode + " ms":>12}' for mode in modes) + f'{"최대 RSS 증가 MB":>20}')
+    for name, row in results.items():
+        print(f'{name:<10}' + ''.join(f'{row["avg_ms"][mode]:>12.1f}' for mode in modes)
+              + f'{row["peak_rss_delta_mb"]:>20.1f}')
+
+    same = sum(a == b for a, b in zip(results['legacy']['dominant'], results['draft']['dominant']))
+    print(f'\n주요 색상 일치 {same}/{len(paths)}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+"""
+요청 경로 로깅 비용 벤치마크 (운세 계산 + 운세 요약)
+- sync-debug : 예전 print 처럼 모든 디버그 메시지를 요청 스레드에서 바로 출력
+- info       : 기본 설정 (APP_LOG_LEVEL=INFO, 디버그 메시지는 포맷도 하지 않음)
+- async-debug: 디버그까지 출력하되 QueueConsoleHandler 로 출력 스레드에 넘김 (LOG_ASYNC)
+출력 대상은 쓰기마다 --write-delay-ms 만큼 막히는 스트림 (gunicorn stdout 파이프/로그 수집기 지연 흉내)
+
+실행 예)
+  python benchmarks/bench_logging.py --requests 300 --write-delay-ms 0.2
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.test import override_settings  # noqa: E402
+
+from core.log_handlers import QueueConsoleHandler  # noqa: E402
+from fortune.services import FortuneCalculator  # noqa: E402
+from recommendations.api_views import summarize_fortune_with_llm  # noqa: E402
+
+APP_LOGGERS = ('fortune', 'recommendations', 'items', 'users', 'core')
+
+
+class SlowStream:
+    """쓰기마다 지연되는 출력 스트림"""
+
+    def __init__(self, delay):
+        self.delay = delay
+        self.writes = 0
+
+    def write(self, text):
+        self.writes += 1
+        time.sleep(self.delay)
+
+    def flush(self):
+        pass
+
+
+def configure(mode, stream):
+    handler = QueueConsoleHandler(stream=stream) if mode == 'async-debug' else logging.StreamHandler(stream)
+    handler.setFormatter(logging.Formatter('{levelname} {asctime} {name} {message}', style='{'))
+    for name in APP_LOGGERS:
+        logger = logging.getLogger(name)
+        logger.handlers = [handler]
+        logger.setLevel(logging.INFO if mode == 'info' else logging.DEBUG)
+        logger.propagate = False
+    return handler
+
+
+def run(requests, day):
+    """요청 하나 = 운세 계산(음력 사용자 포함, LLM 키 없음 -> 기본 텍스트) + 운세 요약"""
+    calculator = FortuneCalculator()
+    latencies = []
+    for i in range(requests):
+        birth_date = date(1970, 1, 1) + timedelta(days=i * 37 % 15000)
+        started = time.perf_counter()
+        fortune = calculator.calculate_fortune(
+            birth_date=birth_date, gender='MF'[i % 2], calendar_type='lunar' if i % 3 == 0 else 'solar',
+            mbti='INFP', user_id=i, today=day
+        )
+        summarize_fortune_with_llm(fortune['fortune_texts'].get('total', ''), fortune['zodiac_sign'], i)
+        latencies.append((time.perf_counter() - started) * 1000)
+    latencies.sort()
+    return sum(latencies) / len(latencies), latencies[int(len(latencies) * 0.95) - 1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='요청 경로 로깅 비용 벤치마크')
+    parser.add_argument('--requests', type=int, default=300)
+    parser.add_argument('--write-delay-ms', type=float, default=0.2, help='출력 한 번당 지연 (ms)')
+    args = parser.parse_args()
+
+    day = date(2025, 6, 1)
+    results = {}
+    # 운세 텍스트 LLM 호출/요약 LLM 호출 없이 (키 없음 경로) 순수 계산 + 로깅만 측정
+    with override_settings(OPENAI_API_KEY='', GMS_API_KEY=''):
+        run(20, day)  # 사주/음력 변환 캐시 워밍업
+        for mode in ('sync-debug', 'info', 'async-debug'):
+            stream = SlowStream(args.write_delay_ms / 1000)
+            handler = configure(mode, stream)
+            avg_ms, p95_ms = run(args.requests, day)
+            handler.close()
+            results[mode] = (avg_ms, p95_ms, stream.writes / args.requests)
+
+    print(f'요청 {args.requests}회, 출력 지연 {args.write_delay_ms}ms/회\n')
+    print(f'{"방식":<14}{"평균 ms":>10}{"p95 ms":>10}{"출력/요청":>12}')
+    for mode, (avg_ms, p95_ms, writes) in results.items():
+        print(f'{mode:<14}{avg_ms:>10.2f}{p95_ms:>10.2f}{writes:>12.1f}')
+    baseline = results['sync-debug'][0]
+    print(f'\ninfo 대비 {baseline / results["info"][0]:.1f}배, async-debug 대비 {baseline / results["async-debug"][0]:.1f}배')
+
+
+if __name__ == '__main__':
+    main()
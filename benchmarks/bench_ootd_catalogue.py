@@ -0,0 +1,113 @@
+"""
+OOTD 추천 생성 벤치마크 (카탈로그 인덱스 적용 전/후)
+- 기존: 카테고리마다 ootd*.json 경로 확인 + json.load 후 선형 탐색
+- 변경: 프로세스 전역 카탈로그 + (성별, 카테고리)별 min_temp 정렬 인덱스
+
+실행: python benchmarks/bench_ootd_catalogue.py [--iterations 2000]
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import sys
+import time
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.conf import settings  # noqa: E402
+
+from recommendations import api_views  # noqa: E402
+from recommendations.api_views import OOTDRecommendationAPIView  # noqa: E402
+
+
+def old_load_ootd_data(gender=None):
+    """변경 전 load_ootd_data (호출마다 파일 읽기)"""
+    if gender == 'M':
+        filenames = ['ootd_male.json', 'ootd.json']
+    elif gender == 'F':
+        filenames = ['ootd_female.json', 'ootd.json']
+    else:
+        filenames = ['ootd.json']
+
+    for filename in filenames:
+        possible_paths = [
+            os.path.join(settings.BASE_DIR, filename),
+            os.path.join(settings.BASE_DIR, 'data', filename),
+        ]
+        for json_path in possible_paths:
+            if os.path.exists(json_path):
+                try:
+                    with open(json_path, 'r', encoding='utf-8') as f:
+                        return json.load(f)
+                except Exception:
+                    pass
+    return []
+
+
+def old_get_clothes_by_temp_and_category(temp, category, weather_condition="맑음", gender=None):
+    """변경 전 get_clothes_by_temp_and_category (선형 탐색)"""
+    ootd_data = old_load_ootd_data(gender)
+    matching_clothes = []
+    for item in ootd_data:
+        if item.get('category') != category:
+            continue
+        min_temp = item.get('min_temp', -50)
+        max_temp = item.get('max_temp', 50)
+        weather_conditions = item.get('weather_conditions', [])
+        if min_temp <= temp <= max_temp:
+            if not weather_conditions or weather_condition in weather_conditions:
+                matching_clothes.append(item)
+    return matching_clothes
+
+
+def make_cases(count, seed=0):
+    picker = random.Random(seed)
+    return [
+        (
+            {'temp': picker.uniform(-10, 35), 'description': picker.choice(['맑음', '구름많음', '흐림', '비', '눈'])},
+            picker.sample(['빨간색', '파란색', '노란색', '흰색', '검은색'], 3),
+            picker.choice(['M', 'F', None]),
+        )
+        for _ in range(count)
+    ]
+
+
+def run(view, cases):
+    random.seed(0)
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        results = [view._generate_ootd(weather, colors, gender) for weather, colors, gender in cases]
+        elapsed = time.perf_counter() - start
+    return elapsed, results
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--iterations', type=int, default=2000)
+    args = parser.parse_args()
+
+    view = OOTDRecommendationAPIView()
+    cases = make_cases(args.iterations)
+
+    with mock.patch.object(api_views, 'get_clothes_by_temp_and_category', old_get_clothes_by_temp_and_category):
+        old_elapsed, old_results = run(view, cases)
+    run(view, cases[:10])  # 카탈로그 로드
+    new_elapsed, new_results = run(view, cases)
+
+    print(f'_generate_ootd x{args.iterations}')
+    print(f'  기존 (매번 파일 로드): {old_elapsed * 1000:8.1f} ms  ({old_elapsed / args.iterations * 1e6:7.1f} us/회)')
+    print(f'  카탈로그 인덱스     : {new_elapsed * 1000:8.1f} ms  ({new_elapsed / args.iterations * 1e6:7.1f} us/회)')
+    print(f'  속도 향상: {old_elapsed / new_elapsed:.1f}x, 결과 동일: {old_results == new_results}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+"""
+기상청 단기예보 파싱 벤치마크 (녹화한 300행 getVilageFcst 응답 사용)
+- 기존: OOTD/날씨 API 가 각자 item 목록을 dict 로 묶고 키를 여러 번 정렬
+- 개선: ParsedForecast 한 번 파싱 후 snapshot, 같은 발표분은 WeatherService 가 파싱 결과 재사용
+
+실행 예)
+  python benchmarks/bench_weather_parse.py --iterations 2000
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+
+import django  # noqa: E402
+
+django.setup()
+
+from recommendations import kma  # noqa: E402
+from recommendations.weather import ParsedForecast, WeatherService  # noqa: E402
+
+FIXTURE_PATH = Path(__file__).resolve().parent / 'fixtures' / 'kma_vilage_fcst_300.json'
+
+
+def legacy_parse(items, now):
+    """기존 뷰의 파싱 부분 (엔드포인트마다 한 번씩 실행되던 코드)"""
+    weather_by_time = {}
+    for item in items:
+        key = f"{item['fcstDate']}_{item['fcstTime']}"
+        if key not in weather_by_time:
+            weather_by_time[key] = {}
+        weather_by_time[key][item['category']] = item['fcstValue']
+
+    current_key = None
+    current_time_str = now.strftime('%Y%m%d_%H00')
+    for key in sorted(weather_by_time.keys()):
+        if key >= current_time_str:
+            current_key = key
+            break
+    if not current_key and weather_by_time:
+        current_key = sorted(weather_by_time.keys())[0]
+    current_data = weather_by_time.get(current_key, {})
+
+    today_str = now.strftime('%Y%m%d')
+    today_temps = []
+    for key, values in weather_by_time.items():
+        if key.startswith(today_str) and 'TMP' in values:
+            try:
+                today_temps.append(float(values['TMP']))
+            except ValueError:
+                pass
+    temp = float(current_data.get('TMP', 15))
+
+    sorted_keys = sorted(weather_by_time.keys())
+    start_idx = 0
+    for i, key in enumerate(sorted_keys):
+        if key >= current_time_str:
+            start_idx = i
+            break
+    hourly = [weather_by_time[key] for key in sorted_keys[start_idx:start_idx + 12]]
+    return temp, max(today_temps), min(today_temps), hourly
+
+
+def timed(label, func, iterations):
+    started = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    per_call_us = (time.perf_counter() - started) / iterations * 1e6
+    print(f'{label:<36} {per_call_us:>9.1f} µs')
+    return per_call_us
+
+
+def main():
+    parser = argparse.ArgumentParser(description='기상청 예보 파싱 벤치마크')
+    parser.add_argument('--iterations', type=int, default=2000)
+    args = parser.parse_args()
+
+    with open(FIXTURE_PATH, encoding='utf-8') as f:
+        items = json.load(f)['response']['body']['items']['item']
+    now = kma.KST.localize(datetime(2025, 6, 1, 9, 0))
+    print(f'예보 {len(items)}행, 반복 {args.iterations}회 (OOTD + 날씨 API 한 쌍 기준)\n')
+
+    legacy = timed('기존 (엔드포인트별 파싱 x2)', lambda: (legacy_parse(items, now), legacy_parse(items, now)), args.iterations)
+
+    def single_pass():
+        parsed = ParsedForecast(items)
+        return parsed.snapshot(now), parsed.snapshot(now)
+
+    single = timed('한 번 파싱 + snapshot x2', single_pass, args.iterations)
+
+    # 같은 발표분: 공유 캐시 조회 없이 파싱 결과 재사용
+    WeatherService.clear_parsed_cache()
+    service = WeatherService('bench')
+    with mock.patch.object(kma, 'get_forecast', return_value=(kma.base_slot(now), items)):
+        service.snapshot(36.3621, 127.3565, now)
+        memo = timed('WeatherService (파싱 재사용) x2', lambda: (
+            service.snapshot(36.3621, 127.3565, now), service.snapshot(36.3621, 127.3565, now)
+        ), args.iterations)
+    WeatherService.clear_parsed_cache()
+
+    print(f'\n한 번 파싱: {legacy / single:.1f}배, 파싱 재사용: {legacy / memo:.1f}배')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,183 @@
+"""
+OpenAI 호환 가짜 LLM 서버 (부하 테스트/벤치마크용, 외부 API 호출 없음)
+- POST /v1/chat/completions (base_url 뒤의 /chat/completions 는 경로와 무관하게 처리)
+- 운세 텍스트 프롬프트에는 services 가 기대하는 키(total/money/.../scores/lucky_item)를 갖춘 JSON 응답
+- 그 외(종합운 요약 등)에는 짧은 한 문장 응답
+- 지연 시간(평균/표준편차), 오류 비율/상태 코드, 응답 없는 요청(타임아웃) 비율 설정 가능
+
+실행: python benchmarks/fake_openai_server.py --port 8765 --latency-ms 800 --jitter-ms 300 --error-rate 0.02
+연결: OPENAI_BASE_URL=http://127.0.0.1:8765/v1 OPENAI_API_KEY=fake \\
+      GMS_OPENAI_BASE_URL=http://127.0.0.1:8765/v1 GMS_API_KEY=fake python manage.py runserver
+"""
+import argparse
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+SCORE_KEYS = ['money', 'love', 'study', 'work', 'health']
+FORTUNE_KEYS = ['total'] + SCORE_KEYS
+SENTENCES = [
+    '오늘은 차분하게 하루를 시작하는 것이 좋습니다.',
+    '주변 사람들과의 대화에서 뜻밖의 도움을 얻을 수 있습니다.',
+    '작은 일에도 정성을 다하면 좋은 결과로 이어질 것입니다.',
+    '무리한 계획보다는 할 수 있는 일부터 차근차근 해 나가세요.',
+    '저녁에는 충분히 휴식을 취하며 내일을 준비하는 것이 좋습니다.',
+    '새로운 제안이 들어온다면 신중하게 검토해 보세요.',
+    '평소보다 직감이 잘 맞는 날이니 자신을 믿어도 좋습니다.',
+]
+SUMMARIES = [
+    '차분한 마음으로 중요한 결정을 내리세요',
+    '주변의 조언에 귀 기울이면 기회가 찾아옵니다',
+    '적극적인 행동이 좋은 결과로 이어질 것입니다',
+]
+
+
+class FakeLLMConfig:
+    def __init__(self, latency_ms, jitter_ms, error_rate, error_status, hang_rate, seed):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.hang_rate = hang_rate
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.counts = {'requests': 0, 'errors': 0, 'hangs': 0}
+
+    def draw(self):
+        """요청 하나의 (지연 초, 결과 종류) 결정 -> 'ok' / 'error' / 'hang'"""
+        with self._lock:
+            self.counts['requests'] += 1
+            delay = max(0.0, self._rng.gauss(self.latency_ms, self.jitter_ms)) / 1000
+            roll = self._rng.random()
+            if roll < self.hang_rate:
+                self.counts['hangs'] += 1
+                return delay, 'hang'
+            if roll < self.hang_rate + self.error_rate:
+                self.counts['errors'] += 1
+                return delay, 'error'
+            return delay, 'ok'
+
+    def choice(self, seq):
+        with self._lock:
+            return self._rng.choice(seq)
+
+    def randint(self, a, b):
+        with self._lock:
+            return self._rng.randint(a, b)
+
+
+def _quoted_item(prompt, label):
+    """프롬프트의 "아이템 '{이름}' 설명" 부분에서 아이템 이름 추출"""
+    match = re.search(label + r"[^']*'([^']+)' 설명", prompt)
+    return match.group(1) if match else '행운 아이템'
+
+
+def fortune_payload(prompt, config):
+    """운세 텍스트 프롬프트에 대한 응답 JSON"""
+    payload = {key: ' '.join(config.choice(SENTENCES) for _ in range(5)) for key in FORTUNE_KEYS}
+    scores = {key: config.randint(50, 100) for key in SCORE_KEYS}
+    scores['total'] = round(sum(scores.values()) / len(SCORE_KEYS))
+    payload['scores'] = scores
+
+    lucky_item = _quoted_item(prompt, '운세 기반 아이템')
+    zodiac_item = _quoted_item(prompt, r'별자리\([^)]*\) 아이템')
+    payload['lucky_item'] = {
+        'description': f'{lucky_item}은(는) 오늘 당신에게 좋은 기운을 전해줍니다. 대인관계에서 긍정적인 에너지를 발산합니다.',
+        'zodiac_description': f'{zodiac_item}은(는) 당신에게 특별한 행운을 가져다줍니다. 오늘 하루 긍정적인 변화가 찾아올 것입니다.',
+    }
+    return payload
+
+
+def make_handler(config):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_POST(self):
+            length = int(self.headers.get('Content-Length') or 0)
+            try:
+                body = json.loads(self.rfile.read(length) or b'{}')
+            except ValueError:
+                return self._send(400, {'error': {'message': 'invalid json'}})
+
+            if not self.path.rstrip('/').endswith('/chat/completions'):
+                return self._send(404, {'error': {'message': f'unknown path {self.path}'}})
+
+            delay, outcome = config.draw()
+            if outcome == 'hang':
+                # 클라이언트 타임아웃을 유도 (응답하지 않고 연결 유지)
+                time.sleep(3600)
+                return
+            time.sleep(delay)
+            if outcome == 'error':
+                return self._send(config.error_status, {'error': {'message': 'fake upstream error', 'type': 'server_error'}})
+
+            messages = body.get('messages') or []
+            prompt = messages[-1].get('content', '') if messages else ''
+            if '"scores"' in prompt:
+                content = json.dumps(fortune_payload(prompt, config), ensure_ascii=False)
+            else:
+                content = config.choice(SUMMARIES)
+
+            self._send(200, {
+                'id': f'chatcmpl-{uuid.uuid4().hex}',
+                'object': 'chat.completion',
+                'created': int(time.time()),
+                'model': body.get('model', 'fake-model'),
+                'choices': [{
+                    'index': 0,
+                    'message': {'role': 'assistant', 'content': content},
+                    'finish_reason': 'stop',
+                }],
+                'usage': {'prompt_tokens': len(prompt), 'completion_tokens': len(content), 'total_tokens': len(prompt) + len(content)},
+            })
+
+        def do_GET(self):
+            # 상태 확인: 지금까지 받은 요청/오류 수
+            self._send(200, config.counts)
+
+        def _send(self, status_code, payload):
+            data = json.dumps(payload, ensure_ascii=False).encode()
+            self.send_response(status_code)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description='OpenAI 호환 가짜 LLM 서버')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency-ms', type=float, default=800, help='평균 응답 지연 (ms)')
+    parser.add_argument('--jitter-ms', type=float, default=200, help='지연 표준편차 (ms)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='오류 응답 비율 (0~1)')
+    parser.add_argument('--error-status', type=int, default=503, help='오류 응답 상태 코드 (예: 429, 500, 503)')
+    parser.add_argument('--hang-rate', type=float, default=0.0, help='응답하지 않는 요청 비율 (0~1)')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    config = FakeLLMConfig(args.latency_ms, args.jitter_ms, args.error_rate, args.error_status, args.hang_rate, args.seed)
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(config))
+    server.daemon_threads = True
+    print(f'가짜 LLM 서버: http://{args.host}:{args.port}/v1 '
+          f'(지연 {args.latency_ms}±{args.jitter_ms}ms, 오류 {args.error_rate:.0%} [{args.error_status}], 무응답 {args.hang_rate:.0%})')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f'종료: {config.counts}')
+
+
+if __name__ == '__main__':
+    main()
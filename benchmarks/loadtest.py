@@ -0,0 +1,236 @@
+"""
+운세 파이프라인 부하 테스트 (실행 중인 서버 대상, 개방형 부하)
+- /api/fortune/calculate/ (POST), /api/fortune/today/ (GET), /api/recommendations/ootd/ (GET)
+- 지정한 RPS 로 요청을 예약하고, 지연 시간은 예약 시각부터 측정 (서버가 느려져도 부하가 줄지 않음)
+- 엔드포인트별 p50/p95/p99, 처리량, 상태 코드 분포 출력
+
+today/ootd 는 로그인 필요: --register 로 테스트 사용자를 만들거나 --username/--password 지정
+LLM 은 benchmarks/fake_openai_server.py 에 연결해서 실행하는 것을 권장
+
+실행 예)
+  python benchmarks/fake_openai_server.py --latency-ms 800 &
+  OPENAI_BASE_URL=http://127.0.0.1:8765/v1 OPENAI_API_KEY=fake \\
+  GMS_OPENAI_BASE_URL=http://127.0.0.1:8765/v1 GMS_API_KEY=fake python manage.py runserver --noreload &
+  python benchmarks/loadtest.py --rps 20 --duration 30 --register 20 --profiles 200
+"""
+import argparse
+import json
+import random
+import threading
+import time
+import uuid
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+import requests
+
+ENDPOINTS = {
+    'calculate': ('POST', '/api/fortune/calculate/'),
+    'today': ('GET', '/api/fortune/today/'),
+    'ootd': ('GET', '/api/recommendations/ootd/'),
+}
+AUTH_ENDPOINTS = {'today', 'ootd'}
+
+
+def make_profiles(count, seed):
+    """calculate 요청 본문 (count 가 작을수록 동일 조건 캐시 적중이 많아짐)"""
+    picker = random.Random(seed)
+    profiles = []
+    for _ in range(count):
+        birth_date = date(1960, 1, 1) + timedelta(days=picker.randint(0, 365 * 50))
+        profile = {
+            'birth_date': birth_date.isoformat(),
+            'gender': picker.choice(['M', 'F']),
+            'calendar_type': 'lunar' if picker.random() < 0.1 else 'solar',
+        }
+        if picker.random() < 0.5:
+            profile['birth_time'] = f'{picker.randint(0, 23):02d}:00'
+        if picker.random() < 0.7:
+            profile['mbti'] = picker.choice(['INTJ', 'ENFP', 'ISTP', 'ESFJ'])
+        profiles.append(profile)
+    return profiles
+
+
+def register_users(base_url, count, seed):
+    """테스트 사용자 생성 후 access 토큰 목록 반환"""
+    picker = random.Random(seed)
+    run_id = uuid.uuid4().hex[:8]
+    tokens = []
+    for i in range(count):
+        birth_date = date(1960, 1, 1) + timedelta(days=picker.randint(0, 365 * 50))
+        password = f'Load-{run_id}-pw!'
+        response = requests.post(f'{base_url}/api/auth/register/', json={
+            'username': f'load_{run_id}_{i}',
+            'password': password,
+            'password2': password,
+            'last_name': '부하',
+            'first_name': f'테스트{i}',
+            'birth_date': birth_date.isoformat(),
+            'gender': picker.choice(['M', 'F']),
+            'mbti': picker.choice(['INTJ', 'ENFP', 'ISTP', 'ESFJ']),
+        }, timeout=30)
+        if response.status_code != 201:
+            raise SystemExit(f'사용자 생성 실패 ({response.status_code}): {response.text[:200]}')
+        tokens.append(response.json()['tokens']['access'])
+    return tokens
+
+
+def login(base_url, username, password):
+    response = requests.post(f'{base_url}/api/auth/login/', json={'username': username, 'password': password}, timeout=30)
+    if response.status_code != 200:
+        raise SystemExit(f'로그인 실패 ({response.status_code}): {response.text[:200]}')
+    return response.json()['access']
+
+
+def percentile(sorted_values, ratio):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(ratio * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class LoadTest:
+    def __init__(self, args, tokens, profiles):
+        self.base_url = args.base_url.rstrip('/')
+        self.timeout = args.timeout
+        self.ootd_params = {'test_temp': args.test_temp} if args.test_temp is not None else {}
+        self.tokens = tokens
+        self.profiles = profiles
+        self.picker = random.Random(args.seed)
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        self.latencies = defaultdict(list)
+        self.statuses = defaultdict(Counter)
+
+    def _session(self):
+        session = getattr(self.local, 'session', None)
+        if session is None:
+            session = self.local.session = requests.Session()
+        return session
+
+    def request(self, name, scheduled_at, token, body):
+        method, path = ENDPOINTS[name]
+        headers = {'Authorization': f'Bearer {token}'} if token else {}
+        try:
+            if method == 'POST':
+                response = self._session().post(self.base_url + path, json=body, headers=headers, timeout=self.timeout)
+            else:
+                params = self.ootd_params if name == 'ootd' else None
+                response = self._session().get(self.base_url + path, params=params, headers=headers, timeout=self.timeout)
+            outcome = response.status_code
+        except requests.Timeout:
+            outcome = 'timeout'
+        except requests.RequestException:
+            outcome = 'conn_error'
+        elapsed_ms = (time.perf_counter() - scheduled_at) * 1000
+
+        with self.lock:
+            self.latencies[name].append(elapsed_ms)
+            self.statuses[name][outcome] += 1
+
+    def run(self, endpoints, weights, rps, duration, workers):
+        """rps 로 duration 초 동안 요청 예약 -> (전체 경과 초, 예약 지연 최대 ms)"""
+        total = int(rps * duration)
+        interval = 1.0 / rps
+        max_lag_ms = 0.0
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            started = time.perf_counter()
+            for i in range(total):
+                scheduled_at = started + i * interval
+                now = time.perf_counter()
+                if scheduled_at > now:
+                    time.sleep(scheduled_at - now)
+                else:
+                    max_lag_ms = max(max_lag_ms, (now - scheduled_at) * 1000)
+
+                name = self.picker.choices(endpoints, weights)[0]
+                token = self.picker.choice(self.tokens) if self.tokens else None
+                body = self.picker.choice(self.profiles) if name == 'calculate' else None
+                executor.submit(self.request, name, scheduled_at, token, body)
+
+        return time.perf_counter() - started, max_lag_ms
+
+    def report(self, elapsed):
+        rows = {}
+        for name in sorted(self.latencies):
+            values = sorted(self.latencies[name])
+            ok = sum(count for status, count in self.statuses[name].items() if status == 200)
+            rows[name] = {
+                'requests': len(values),
+                'ok': ok,
+                'throughput_rps': round(ok / elapsed, 2),
+                'p50_ms': round(percentile(values, 0.50), 1),
+                'p95_ms': round(percentile(values, 0.95), 1),
+                'p99_ms': round(percentile(values, 0.99), 1),
+                'max_ms': round(values[-1], 1),
+                'statuses': {str(status): count for status, count in self.statuses[name].most_common()},
+            }
+        return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description='운세 파이프라인 부하 테스트')
+    parser.add_argument('--base-url', default='http://127.0.0.1:8000')
+    parser.add_argument('--rps', type=float, default=10, help='초당 요청 수 (전체)')
+    parser.add_argument('--duration', type=float, default=30, help='부하 시간 (초)')
+    parser.add_argument('--endpoints', default='calculate,today,ootd', help=f'대상 엔드포인트 ({",".join(ENDPOINTS)})')
+    parser.add_argument('--weights', help='엔드포인트별 비중 (예: 3,5,2, 기본 균등)')
+    parser.add_argument('--workers', type=int, default=64, help='동시에 진행 가능한 최대 요청 수')
+    parser.add_argument('--timeout', type=float, default=60, help='요청 타임아웃 (초)')
+    parser.add_argument('--profiles', type=int, default=100, help='calculate 에 사용할 서로 다른 입력 수')
+    parser.add_argument('--register', type=int, default=0, help='생성할 테스트 사용자 수 (today/ootd 용)')
+    parser.add_argument('--username')
+    parser.add_argument('--password')
+    parser.add_argument('--test-temp', type=float, help='ootd 에 test_temp 전달 (기온 고정)')
+    parser.add_argument('--warmup', action='store_true', help='측정 전에 calculate 입력을 한 번씩 요청해 캐시 채우기')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--json', help='결과를 JSON 파일로 저장')
+    args = parser.parse_args()
+
+    endpoints = [name.strip() for name in args.endpoints.split(',') if name.strip()]
+    unknown = [name for name in endpoints if name not in ENDPOINTS]
+    if unknown:
+        parser.error(f'알 수 없는 엔드포인트: {unknown}')
+    weights = [float(w) for w in args.weights.split(',')] if args.weights else [1.0] * len(endpoints)
+    if len(weights) != len(endpoints):
+        parser.error('--weights 개수가 --endpoints 와 같아야 합니다')
+
+    base_url = args.base_url.rstrip('/')
+    tokens = []
+    if args.register:
+        tokens = register_users(base_url, args.register, args.seed)
+    elif args.username:
+        tokens = [login(base_url, args.username, args.password or '')]
+    if AUTH_ENDPOINTS.intersection(endpoints) and not tokens:
+        parser.error('today/ootd 는 로그인이 필요합니다 (--register N 또는 --username/--password)')
+
+    profiles = make_profiles(args.profiles, args.seed)
+    test = LoadTest(args, tokens, profiles)
+
+    if args.warmup:
+        print(f'워밍업: calculate 입력 {len(profiles)}개')
+        for profile in profiles:
+            test.request('calculate', time.perf_counter(), None, profile)
+        test.latencies.clear()
+        test.statuses.clear()
+
+    print(f'부하 시작: {args.rps} rps x {args.duration}s -> {", ".join(f"{e}({w:g})" for e, w in zip(endpoints, weights))}')
+    elapsed, max_lag_ms = test.run(endpoints, weights, args.rps, args.duration, args.workers)
+    rows = test.report(elapsed)
+
+    print(f'\n경과 {elapsed:.1f}s, 예약 지연 최대 {max_lag_ms:.0f}ms')
+    print(f'{"endpoint":<10} {"req":>6} {"ok":>6} {"ok/s":>7} {"p50":>8} {"p95":>8} {"p99":>8} {"max":>8}  statuses')
+    for name, row in rows.items():
+        print(f'{name:<10} {row["requests"]:>6} {row["ok"]:>6} {row["throughput_rps"]:>7.2f} '
+              f'{row["p50_ms"]:>8.1f} {row["p95_ms"]:>8.1f} {row["p99_ms"]:>8.1f} {row["max_ms"]:>8.1f}  {row["statuses"]}')
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'args': vars(args), 'elapsed_s': round(elapsed, 2), 'endpoints': rows}, f, ensure_ascii=False, indent=2)
+        print(f'\n결과 저장: {args.json}')
+
+
+if __name__ == '__main__':
+    main()
@@ -87,6 +87,7 @@ INSTALLED_APPS = [
 AUTH_USER_MODEL = 'users.User'
 
 MIDDLEWARE = [
+    'core.middleware.ServerTimingMiddleware',  # 맨 앞: 뒤의 미들웨어 시간까지 total 에 포함
     'django.middleware.security.SecurityMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -177,6 +178,15 @@ USE_TZ = True
 # Weather API Configuration
 # 기상청 API (공공데이터포털)
 KMA_API_KEY = config('KMA_API_KEY', default='')
+KMA_FORECAST_URL = config('KMA_FORECAST_URL', default='')  # 비우면 기본 단기예보 URL
+# 단기예보 캐시: 다음 발표 후에도 이 시간 동안은 직전 예보를 바로 반환하고 백그라운드 갱신 (초)
+KMA_FORECAST_STALE_SECONDS = config('KMA_FORECAST_STALE_SECONDS', default=3 * 60 * 60, cast=int)
+# 인기 격자 예보 미리 조회 (manage.py prefetch_weather)
+KMA_HOT_CELL_WINDOW = config('KMA_HOT_CELL_WINDOW', default=24 * 60 * 60, cast=int)  # 최근 요청 기록 유지 (초)
+KMA_PREFETCH_BUDGET = config('KMA_PREFETCH_BUDGET', default=50, cast=int)  # 발표당 미리 조회할 최대 격자 수
+KMA_PREFETCH_RATE = config('KMA_PREFETCH_RATE', default=2, cast=float)  # 기상청 API 초당 호출 한도
+# 날씨 + 주소(카카오) 동시 조회 중 주소 조회 제한 시간 (초, 늦으면 캐시/기본 도시 사용, 예보는 기상청 타임아웃까지 대기)
+WEATHER_FANOUT_TIMEOUT = config('WEATHER_FANOUT_TIMEOUT', default=5, cast=float)
 # OpenWeatherMap API (백업용)
 WEATHER_API_KEY = config('WEATHER_API_KEY', default='')
 DEFAULT_LOCATION = {
@@ -288,10 +298,12 @@ CORS_ALLOW_HEADERS = [
 ]
 
 # Cache Configuration
+# 기본은 프로세스 로컬 메모리 캐시
+# 워커 간 공유가 필요하면 환경변수로 지정 (예: DatabaseCache + createcachetable, 또는 Redis)
 CACHES = {
     'default': {
-        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
-        'LOCATION': 'unique-snowflake',
+        'BACKEND': config('CACHE_BACKEND', default='django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': config('CACHE_LOCATION', default='unique-snowflake'),
         'TIMEOUT': 60 * 60 * 24,  # 24 hours
     }
 }
@@ -315,6 +327,39 @@ DEFAULT_FROM_EMAIL = config('DEFAULT_FROM_EMAIL', default='Fortune Life <noreply
 # AI Service Configuration
 OPENAI_API_KEY = config('OPENAI_API_KEY', default='')
 OPENAI_MODEL = config('OPENAI_MODEL', default='gpt-3.5-turbo')
+OPENAI_BASE_URL = config('OPENAI_BASE_URL', default='')
+
+# LLM 운세 텍스트 동시 요청 병합 (대기 시간 초과 시 기본 텍스트 사용)
+LLM_SINGLEFLIGHT_TIMEOUT = config('LLM_SINGLEFLIGHT_TIMEOUT', default=25, cast=float)  # 대기자 최대 대기 (초)
+LLM_SINGLEFLIGHT_LEASE = config('LLM_SINGLEFLIGHT_LEASE', default=90, cast=int)  # 워커 간 임대 만료 (초)
+
+# 사주 계산 결과 LRU 캐시 크기 (항목당 약 2.4KB)
+SAJU_CACHE_SIZE = config('SAJU_CACHE_SIZE', default=20000, cast=int)
+
+# 오늘의 운세 프로세스 캐시 (OOTD/메뉴/아이템 체크 공용)
+TODAY_FORTUNE_CACHE_SIZE = config('TODAY_FORTUNE_CACHE_SIZE', default=2048, cast=int)  # 사용자 수
+TODAY_FORTUNE_CACHE_TTL = config('TODAY_FORTUNE_CACHE_TTL', default=300, cast=int)  # 초 (다른 워커의 갱신 반영 주기)
+
+# 요청 단계별 시간 측정 (core/timing.py) - 켜면 해당 경로 응답에 Server-Timing 헤더, 단계별 히스토그램 집계
+TIMING_ENABLED = config('TIMING_ENABLED', default=False, cast=bool)
+TIMING_PATH_PREFIXES = config('TIMING_PATH_PREFIXES', default='/api/fortune/', cast=lambda v: tuple(p for p in v.split(',') if p))
+
+# 공용 LLM 클라이언트 (core/llm.py)
+# 프로세스(이벤트 루프)당 동시 호출 수 - gunicorn 스레드 수(Procfile --threads 8)보다 작게 두어 LLM 이 느려도 다른 요청용 스레드가 남음
+LLM_MAX_CONCURRENCY = config('LLM_MAX_CONCURRENCY', default=4, cast=int)
+LLM_TIMEOUT = config('LLM_TIMEOUT', default=30, cast=float)  # 요청 타임아웃 (초)
+LLM_QUEUE_TIMEOUT = config('LLM_QUEUE_TIMEOUT', default=10, cast=float)  # 동시 호출 자리 대기 (초)
+LLM_RETRY_BASE_DELAY = config('LLM_RETRY_BASE_DELAY', default=0.5, cast=float)  # 재시도 백오프 기준 (초)
+
+# 외부 HTTP 호출 (기상청/카카오 등) 공용 세션
+HTTP_TIMEOUT = config('HTTP_TIMEOUT', default=10, cast=float)  # 기본 타임아웃 (초)
+HTTP_MAX_RETRIES = config('HTTP_MAX_RETRIES', default=2, cast=int)  # 연결 실패/5xx/429 재시도
+HTTP_RETRY_BACKOFF = config('HTTP_RETRY_BACKOFF', default=0.3, cast=float)  # 재시도 백오프 기준 (초)
+HTTP_POOL_HOSTS = config('HTTP_POOL_HOSTS', default=10, cast=int)  # 유지할 호스트별 연결 풀 수
+HTTP_POOL_MAXSIZE = config('HTTP_POOL_MAXSIZE', default=20, cast=int)  # 호스트당 keep-alive 연결 수
+
+# OOTD/음식 카탈로그 파일 변경 확인 주기 (초)
+CATALOGUE_RELOAD_INTERVAL = config('CATALOGUE_RELOAD_INTERVAL', default=5, cast=float)
 
 # Google Cloud Gemini API (직접 연결 - 우선 사용)
 GEMINI_API_KEY = config('GEMINI_API_KEY', default='')
@@ -330,6 +375,13 @@ GMS_API_BASE_URL = config('GMS_API_BASE_URL', default='https://gms.ssafy.io/gmsa
 
 # Kakao API Key (for location services)
 KAKAO_REST_API_KEY = config('KAKAO_REST_API_KEY', default='')
+# 좌표 -> 행정동 변환 캐시 (소수점 3자리 ≈ 100m 단위로 묶음)
+GEOCODE_PRECISION = config('GEOCODE_PRECISION', default=3, cast=int)
+GEOCODE_CACHE_TTL = config('GEOCODE_CACHE_TTL', default=30 * 24 * 60 * 60, cast=int)  # 주소 찾음 (초)
+GEOCODE_NEGATIVE_TTL = config('GEOCODE_NEGATIVE_TTL', default=24 * 60 * 60, cast=int)  # 주소 없음 (초)
+GEOCODE_ERROR_TTL = config('GEOCODE_ERROR_TTL', default=60, cast=int)  # API 오류/타임아웃 (초)
+GEOCODE_SEED_RADIUS_M = config('GEOCODE_SEED_RADIUS_M', default=300, cast=float)  # 오프라인 행정동 중심점 사용 반경
+GEOCODE_SEED_TTL = config('GEOCODE_SEED_TTL', default=10 * 60, cast=int)  # 중심점 근사값 프로세스 캐시 (초)
 ANTHROPIC_API_KEY = config('ANTHROPIC_API_KEY', default='')
 ANTHROPIC_MODEL = config('ANTHROPIC_MODEL', default='claude-3-sonnet-20240229')
 
@@ -348,20 +400,25 @@ if not DEBUG:
     X_FRAME_OPTIONS = 'DENY'
 
 # Logging
+# 앱 로그 레벨 (DEBUG 로그는 기본 비활성 - 비활성 레벨은 메시지 포맷도 하지 않음)
+APP_LOG_LEVEL = config('APP_LOG_LEVEL', default='INFO')
+# True 면 콘솔 출력을 전용 스레드로 넘겨 요청 스레드가 stdout I/O 를 기다리지 않음
+LOG_ASYNC = config('LOG_ASYNC', default=False, cast=bool)
+
 LOGGING = {
     'version': 1,
     'disable_existing_loggers': False,
     'formatters': {
         'verbose': {
-            'format': '{levelname} {asctime} {module} {message}',
+            'format': '{levelname} {asctime} {name} {message}',
             'style': '{',
         },
     },
     'handlers': {
         'console': {
-            'level': 'INFO',
-            'class': 'logging.StreamHandler',
-            'formatter': 'verbose'
+            'level': 'DEBUG',
+            'formatter': 'verbose',
+            'class': 'core.log_handlers.QueueConsoleHandler' if LOG_ASYNC else 'logging.StreamHandler',
         },
     },
     'root': {
@@ -374,9 +431,9 @@ LOGGING = {
             'level': 'INFO',
             'propagate': False,
         },
-        'fortune': {
-            'handlers': ['console'],
-            'level': 'DEBUG',
+        **{
+            app: {'handlers': ['console'], 'level': APP_LOG_LEVEL, 'propagate': False}
+            for app in ('fortune', 'recommendations', 'items', 'users', 'core')
         },
     },
 }
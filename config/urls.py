@@ -6,7 +6,7 @@ from django.urls import path, include, re_path
 from django.conf import settings
 from django.conf.urls.static import static
 from rest_framework import routers
-from core.views import home, api_root, vue_app
+from core.views import home, api_root, vue_app, metrics
 
 router = routers.DefaultRouter()
 
@@ -14,6 +14,7 @@ urlpatterns = [
     path('', home, name='home'),  # 홈페이지
     path('admin/', admin.site.urls),
     path('api/', api_root, name='api-root'),  # API 루트
+    path('api/metrics/', metrics, name='api-metrics'),  # 외부 호출 통계 (관리자)
 
     # ===== REST API (Vue 프론트엔드용) =====
     path('api/auth/', include('users.api_urls')),           # 인증 API
@@ -0,0 +1,170 @@
+"""
+외부 HTTP 호출 공용 모듈 (기상청, 카카오 등)
+- 프로세스 전역 requests.Session 재사용 -> 호스트별 keep-alive 연결 풀 (TCP/TLS 연결 재사용)
+- 호스트 풀 수 HTTP_POOL_HOSTS, 호스트당 연결 수 HTTP_POOL_MAXSIZE
+- 연결 실패/5xx/429 는 지수 백오프로 재시도 (HTTP_MAX_RETRIES, GET/HEAD 만)
+- 호스트별 지연 시간/오류/재시도 통계 (http_metrics)
+"""
+import threading
+import time
+from collections import deque
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+# ===== 세션 =====
+
+_session_lock = threading.Lock()
+_sessions: Dict[int, requests.Session] = {}
+
+
+def _build_session(max_retries: int) -> requests.Session:
+    retry = Retry(
+        total=max_retries,
+        backoff_factor=_setting('HTTP_RETRY_BACKOFF', 0.3),
+        backoff_max=5,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset(['GET', 'HEAD']),
+        raise_on_status=False,  # 재시도 후에도 실패하면 마지막 응답을 그대로 반환
+    )
+    adapter = HTTPAdapter(
+        pool_connections=_setting('HTTP_POOL_HOSTS', 10),
+        pool_maxsize=_setting('HTTP_POOL_MAXSIZE', 20),
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def get_session(max_retries: Optional[int] = None) -> requests.Session:
+    """재시도 횟수별 공용 세션"""
+    if max_retries is None:
+        max_retries = _setting('HTTP_MAX_RETRIES', 2)
+    session = _sessions.get(max_retries)
+    if session is None:
+        with _session_lock:
+            session = _sessions.get(max_retries)
+            if session is None:
+                session = _sessions[max_retries] = _build_session(max_retries)
+    return session
+
+
+def close_sessions():
+    """공용 세션 닫기 (테스트/설정 변경용, 다음 호출 때 다시 생성)"""
+    with _session_lock:
+        sessions = list(_sessions.values())
+        _sessions.clear()
+    for session in sessions:
+        session.close()
+
+
+# ===== 통계 =====
+
+class _HostStats:
+    __slots__ = ('calls', 'errors', 'retries', 'total_ms', 'max_ms', 'recent_ms')
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.retries = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.recent_ms = deque(maxlen=512)
+
+
+_stats_lock = threading.Lock()
+_stats: Dict[str, _HostStats] = {}
+
+
+def _record(host: str, elapsed_ms: float, error: bool, retries: int):
+    with _stats_lock:
+        stats = _stats.get(host)
+        if stats is None:
+            stats = _stats[host] = _HostStats()
+        stats.calls += 1
+        stats.total_ms += elapsed_ms
+        stats.max_ms = max(stats.max_ms, elapsed_ms)
+        stats.recent_ms.append(elapsed_ms)
+        stats.retries += retries
+        if error:
+            stats.errors += 1
+
+
+def _percentile(sorted_values, ratio):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(ratio * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def http_metrics() -> Dict[str, dict]:
+    """호스트별 통계 (호출 수, 오류(예외/5xx)/재시도 수, 평균/최대/p50/p95 지연 ms)"""
+    with _stats_lock:
+        snapshot = {host: (stats, sorted(stats.recent_ms)) for host, stats in _stats.items()}
+        result = {}
+        for host, (stats, recent) in snapshot.items():
+            result[host] = {
+                'calls': stats.calls,
+                'errors': stats.errors,
+                'retries': stats.retries,
+                'avg_ms': round(stats.total_ms / stats.calls, 1) if stats.calls else 0.0,
+                'max_ms': round(stats.max_ms, 1),
+                'p50_ms': round(_percentile(recent, 0.5), 1),
+                'p95_ms': round(_percentile(recent, 0.95), 1),
+            }
+    return result
+
+
+def reset_http_metrics():
+    with _stats_lock:
+        _stats.clear()
+
+
+# ===== 호출 =====
+
+def request(method: str, url: str, timeout: Optional[float] = None, max_retries: Optional[int] = None, **kwargs) -> requests.Response:
+    """
+    공용 세션으로 요청 (통계 기록)
+
+    Args:
+        timeout: 초 (기본 settings.HTTP_TIMEOUT), 재시도마다 각각 적용
+        max_retries: 재시도 횟수 (기본 settings.HTTP_MAX_RETRIES)
+
+    Raises:
+        requests.RequestException: 재시도 후에도 연결/응답 실패
+    """
+    host = urlsplit(url).netloc
+    if timeout is None:
+        timeout = _setting('HTTP_TIMEOUT', 10)
+
+    started = time.perf_counter()
+    try:
+        response = get_session(max_retries).request(method, url, timeout=timeout, **kwargs)
+    except requests.RequestException:
+        _record(host, (time.perf_counter() - started) * 1000, error=True, retries=0)
+        raise
+
+    retries = getattr(response.raw, 'retries', None)
+    _record(
+        host, (time.perf_counter() - started) * 1000,
+        error=response.status_code >= 500,
+        retries=len(retries.history) if retries is not None else 0,
+    )
+    return response
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    return request('GET', url, **kwargs)
@@ -0,0 +1,239 @@
+"""
+OpenAI 호환 LLM 클라이언트 공용 모듈
+- (api_key, base_url)별로 프로세스 전역 클라이언트를 재사용 (HTTP 연결/TLS 세션 재사용)
+- 동시 호출 수 제한 (settings.LLM_MAX_CONCURRENCY), 자리가 없으면 LLMBusyError
+- 지수 백오프 + 지터 재시도 (비동기 경로는 asyncio.sleep)
+- 호출 이름별 지연 시간/오류 통계 (llm_metrics)
+"""
+import asyncio
+import json
+import random
+import threading
+import time
+import weakref
+from collections import deque
+from typing import Dict, Optional, Tuple
+
+from django.conf import settings
+
+
+class LLMBusyError(Exception):
+    """동시 호출 한도를 넘어 대기 시간 안에 자리를 얻지 못함"""
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+# ===== 클라이언트 풀 =====
+
+_client_lock = threading.Lock()
+_sync_clients: Dict[Tuple[str, Optional[str]], object] = {}
+# 비동기 클라이언트/세마포어는 이벤트 루프에 묶이므로 루프별로 보관 (루프가 사라지면 함께 정리)
+_async_state: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict]" = weakref.WeakKeyDictionary()
+_sync_semaphore: Optional[threading.BoundedSemaphore] = None
+
+
+def get_client(api_key: str, base_url: Optional[str] = None):
+    """(api_key, base_url)별 공용 OpenAI 클라이언트"""
+    key = (api_key, base_url or None)
+    client = _sync_clients.get(key)
+    if client is None:
+        from openai import OpenAI
+        with _client_lock:
+            client = _sync_clients.get(key)
+            if client is None:
+                # 재시도는 이 모듈에서 직접 처리 (SDK 내부 재시도는 지터/통계가 없으므로 비활성화)
+                client = OpenAI(
+                    api_key=api_key, base_url=base_url or None,
+                    timeout=_setting('LLM_TIMEOUT', 30), max_retries=0
+                )
+                _sync_clients[key] = client
+    return client
+
+
+def _loop_state() -> dict:
+    loop = asyncio.get_running_loop()
+    state = _async_state.get(loop)
+    if state is None:
+        state = {
+            'clients': {},
+            'semaphore': asyncio.Semaphore(_setting('LLM_MAX_CONCURRENCY', 4)),
+        }
+        _async_state[loop] = state
+    return state
+
+
+def get_async_client(api_key: str, base_url: Optional[str] = None):
+    """현재 이벤트 루프에서 사용할 공용 AsyncOpenAI 클라이언트"""
+    clients = _loop_state()['clients']
+    key = (api_key, base_url or None)
+    client = clients.get(key)
+    if client is None:
+        from openai import AsyncOpenAI
+        client = AsyncOpenAI(
+            api_key=api_key, base_url=base_url or None,
+            timeout=_setting('LLM_TIMEOUT', 30), max_retries=0
+        )
+        clients[key] = client
+    return client
+
+
+def _get_sync_semaphore() -> threading.BoundedSemaphore:
+    global _sync_semaphore
+    if _sync_semaphore is None:
+        with _client_lock:
+            if _sync_semaphore is None:
+                _sync_semaphore = threading.BoundedSemaphore(_setting('LLM_MAX_CONCURRENCY', 4))
+    return _sync_semaphore
+
+
+# ===== 통계 =====
+
+class _CallStats:
+    __slots__ = ('calls', 'errors', 'retries', 'busy', 'total_ms', 'max_ms', 'recent_ms')
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.retries = 0
+        self.busy = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.recent_ms = deque(maxlen=512)
+
+
+_stats_lock = threading.Lock()
+_stats: Dict[str, _CallStats] = {}
+
+
+def _record(name: str, elapsed_ms: Optional[float] = None, error: bool = False, retry: bool = False, busy: bool = False):
+    with _stats_lock:
+        stats = _stats.get(name)
+        if stats is None:
+            stats = _stats[name] = _CallStats()
+        if elapsed_ms is not None:
+            stats.calls += 1
+            stats.total_ms += elapsed_ms
+            stats.max_ms = max(stats.max_ms, elapsed_ms)
+            stats.recent_ms.append(elapsed_ms)
+        if error:
+            stats.errors += 1
+        if retry:
+            stats.retries += 1
+        if busy:
+            stats.busy += 1
+
+
+def _percentile(sorted_values, ratio):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(ratio * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def llm_metrics() -> Dict[str, dict]:
+    """호출 이름별 통계 (성공 호출 수, 오류/재시도/대기 초과 수, 평균/최대/p50/p95 지연 ms)"""
+    with _stats_lock:
+        snapshot = {name: (stats, sorted(stats.recent_ms)) for name, stats in _stats.items()}
+        result = {}
+        for name, (stats, recent) in snapshot.items():
+            result[name] = {
+                'calls': stats.calls,
+                'errors': stats.errors,
+                'retries': stats.retries,
+                'busy': stats.busy,
+                'avg_ms': round(stats.total_ms / stats.calls, 1) if stats.calls else 0.0,
+                'max_ms': round(stats.max_ms, 1),
+                'p50_ms': round(_percentile(recent, 0.5), 1),
+                'p95_ms': round(_percentile(recent, 0.95), 1),
+            }
+    return result
+
+
+def reset_llm_metrics():
+    with _stats_lock:
+        _stats.clear()
+
+
+# ===== 호출 =====
+
+def _backoff_delay(attempt: int) -> float:
+    """지수 백오프 + 지터 (기본 0.5s, 1s, 2s ... 에 0.5~1.5배)"""
+    base = _setting('LLM_RETRY_BASE_DELAY', 0.5)
+    return base * (2 ** attempt) * random.uniform(0.5, 1.5)
+
+
+def chat_completion(name: str, api_key: str, base_url: Optional[str] = None, max_retries: int = 1, **params) -> str:
+    """
+    chat.completions.create 호출 후 응답 텍스트 반환
+
+    Args:
+        name: 통계용 호출 이름 (예: 'fortune_text')
+        max_retries: 실패 시 재시도 횟수
+        params: model, messages 등 chat.completions.create 인자
+
+    Raises:
+        LLMBusyError: 동시 호출 한도 초과로 대기 시간 안에 시작하지 못함
+        Exception: 재시도 후에도 실패한 마지막 오류
+    """
+    semaphore = _get_sync_semaphore()
+    if not semaphore.acquire(timeout=_setting('LLM_QUEUE_TIMEOUT', 10)):
+        _record(name, busy=True)
+        raise LLMBusyError(f'LLM 동시 호출 한도 초과: {name}')
+
+    try:
+        client = get_client(api_key, base_url)
+        for attempt in range(max_retries + 1):
+            started = time.perf_counter()
+            try:
+                response = client.chat.completions.create(**params)
+                _record(name, elapsed_ms=(time.perf_counter() - started) * 1000)
+                return response.choices[0].message.content
+            except Exception:
+                _record(name, error=True)
+                if attempt >= max_retries:
+                    raise
+                _record(name, retry=True)
+                time.sleep(_backoff_delay(attempt))
+    finally:
+        semaphore.release()
+
+
+async def achat_completion(name: str, api_key: str, base_url: Optional[str] = None, max_retries: int = 1, **params) -> str:
+    """chat_completion 의 비동기 버전 (재시도 대기 중에도 이벤트 루프를 막지 않음)"""
+    semaphore = _loop_state()['semaphore']
+    try:
+        await asyncio.wait_for(semaphore.acquire(), timeout=_setting('LLM_QUEUE_TIMEOUT', 10))
+    except asyncio.TimeoutError:
+        _record(name, busy=True)
+        raise LLMBusyError(f'LLM 동시 호출 한도 초과: {name}')
+
+    try:
+        client = get_async_client(api_key, base_url)
+        for attempt in range(max_retries + 1):
+            started = time.perf_counter()
+            try:
+                response = await client.chat.completions.create(**params)
+                _record(name, elapsed_ms=(time.perf_counter() - started) * 1000)
+                return response.choices[0].message.content
+            except Exception:
+                _record(name, error=True)
+                if attempt >= max_retries:
+                    raise
+                _record(name, retry=True)
+                await asyncio.sleep(_backoff_delay(attempt))
+    finally:
+        semaphore.release()
+
+
+def parse_json_response(text: str):
+    """LLM 응답에서 마크다운 코드 블록을 제거하고 JSON 파싱"""
+    text = text.strip()
+    if text.startswith('```json'):
+        text = text[7:]
+    if text.startswith('```'):
+        text = text[3:]
+    if text.endswith('```'):
+        text = text[:-3]
+    return json.loads(text.strip())
@@ -0,0 +1,59 @@
+"""
+로그 핸들러
+- QueueConsoleHandler: 요청 스레드는 레코드를 큐에 넣기만 하고, 콘솔 출력은 전용 스레드가 처리
+  (stdout 이 파이프/로그 수집기로 막혀도 워커가 멈추지 않음, 큐가 가득 차면 버리고 개수만 기록)
+"""
+import atexit
+import logging
+import os
+import queue
+import sys
+import threading
+from logging.handlers import QueueHandler, QueueListener
+
+
+class _Listener(QueueListener):
+    def enqueue_sentinel(self):
+        # 큐가 가득 차 있어도 종료 신호는 버리지 않음 (출력 스레드가 비우는 동안 대기)
+        self.queue.put(self._sentinel)
+
+
+class QueueConsoleHandler(QueueHandler):
+    """비차단 콘솔 핸들러 (settings.LOG_ASYNC)"""
+
+    def __init__(self, maxsize=10000, stream=None):
+        super().__init__(queue.Queue(maxsize))
+        self.stream = stream
+        self.dropped = 0
+        self._listener = None
+        self._pid = None
+        self._start_lock = threading.Lock()
+        atexit.register(self.close)
+
+    def _ensure_listener(self):
+        # gunicorn --preload 처럼 fork 후에는 부모의 출력 스레드가 없으므로 프로세스별로 시작
+        if self._pid == os.getpid():
+            return
+        with self._start_lock:
+            if self._pid == os.getpid():
+                return
+            target = logging.StreamHandler(self.stream or sys.stderr)
+            target.setFormatter(logging.Formatter('%(message)s'))  # 포맷은 enqueue 전에 prepare 에서 적용됨
+            self._listener = _Listener(self.queue, target)
+            self._listener.start()
+            self._pid = os.getpid()
+
+    def enqueue(self, record):
+        self._ensure_listener()
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def close(self):
+        with self._start_lock:
+            listener, self._listener = self._listener, None
+            if listener is not None and self._pid == os.getpid():
+                listener.stop()  # 남은 레코드를 모두 출력한 뒤 종료
+            self._pid = None
+        super().close()
@@ -0,0 +1,70 @@
+"""
+운세 계산 단계별 시간 보고서
+- 합성 프로필로 FortuneCalculator.calculate_fortune 을 실행하면서 요청마다 Trace 를 열어 단계별 시간 집계
+- 운영 서버 프로세스의 집계는 TIMING_ENABLED=True 로 실행 후 /api/metrics/ 의 timing 항목에서 확인
+
+예) python manage.py timing_report --samples 500
+    python manage.py timing_report --samples 50 --llm   # LLM 텍스트 포함 (OPENAI_API_KEY 필요, 실제 호출)
+"""
+import random
+from datetime import date, datetime, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test import override_settings
+
+from core import timing
+from fortune.services import FortuneCalculator
+
+ENDPOINT = 'calculate_fortune'
+
+
+class Command(BaseCommand):
+    help = 'calculate_fortune 단계별(음력 변환/사주/점수/색상/로또/아이템/LLM) 시간 분포 출력'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--samples', type=int, default=200, help='계산할 합성 프로필 수')
+        parser.add_argument('--date', help='운세 날짜 (YYYY-MM-DD, 기본값: 오늘)')
+        parser.add_argument('--llm', action='store_true', help='LLM 텍스트 생성 포함 (기본: 키 없이 기본 텍스트)')
+        parser.add_argument('--seed', type=int, default=0)
+
+    def handle(self, *args, **options):
+        if options['samples'] < 1:
+            raise CommandError('--samples 는 1 이상이어야 합니다')
+        try:
+            day = datetime.strptime(options['date'], '%Y-%m-%d').date() if options['date'] else date.today()
+        except ValueError:
+            raise CommandError('--date 는 YYYY-MM-DD 형식이어야 합니다')
+
+        picker = random.Random(options['seed'])
+        calculator = FortuneCalculator()
+        timing.reset_timing_metrics()
+
+        overrides = {} if options['llm'] else {'OPENAI_API_KEY': ''}
+        with override_settings(**overrides):
+            for i in range(options['samples']):
+                birth_date = date(1960, 1, 1) + timedelta(days=picker.randint(0, 20000))
+                lunar = picker.random() < 0.3
+                if lunar:
+                    birth_date = birth_date.replace(day=min(birth_date.day, 29))  # 음력 달은 29/30일
+                token = timing.start_trace()
+                try:
+                    calculator.calculate_fortune(
+                        birth_date=birth_date,
+                        gender=picker.choice('MF'),
+                        calendar_type='lunar' if lunar else 'solar',
+                        mbti=picker.choice(['INFP', 'ESTJ', None]),
+                        user_id=i,
+                        today=day,
+                    )
+                finally:
+                    timing.finish_trace(token, ENDPOINT)
+
+        self._print(timing.timing_metrics().get(ENDPOINT, {}))
+
+    def _print(self, stages):
+        self.stdout.write(f'{"단계":<20}{"횟수":>8}{"평균 ms":>10}{"CPU ms":>10}{"p50":>8}{"p95":>8}{"최대 ms":>10}')
+        for name, row in stages.items():
+            self.stdout.write(
+                f'{name:<20}{row["count"]:>8}{row["avg_ms"]:>10.2f}{row["avg_cpu_ms"]:>10.2f}'
+                f'{row["p50_ms"]:>8}{row["p95_ms"]:>8}{row["max_ms"]:>10.2f}'
+            )
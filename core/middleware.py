@@ -1,7 +1,10 @@
+from django.conf import settings
 from django.contrib import messages
 from django.shortcuts import redirect
 from django.urls import resolve
 
+from core import timing
+
 
 class LoginRequiredMessageMiddleware:
     """로그인이 필요한 페이지 접근 시 메시지를 표시하는 미들웨어"""
@@ -24,3 +27,36 @@ class LoginRequiredMessageMiddleware:
                 messages.warning(request, '로그인 후 이용해주세요.')
 
         return response
+
+
+class ServerTimingMiddleware:
+    """
+    단계별 시간 측정 미들웨어 (settings.TIMING_ENABLED 일 때만)
+    - TIMING_PATH_PREFIXES 로 시작하는 요청에 Trace 를 열고 응답에 Server-Timing 헤더 추가
+    - 요청이 끝나면 뷰 이름별 히스토그램에 합산 (manage.py timing_report, /api/metrics/)
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not getattr(settings, 'TIMING_ENABLED', False) or not request.path.startswith(
+            tuple(getattr(settings, 'TIMING_PATH_PREFIXES', ('/api/fortune/',)))
+        ):
+            return self.get_response(request)
+
+        token = timing.start_trace()
+        try:
+            response = self.get_response(request)
+        except Exception:
+            timing.finish_trace(token, self._endpoint(request))
+            raise
+        trace = timing.current_trace()
+        response['Server-Timing'] = trace.server_timing()
+        timing.finish_trace(token, self._endpoint(request))
+        return response
+
+    @staticmethod
+    def _endpoint(request):
+        match = getattr(request, 'resolver_match', None)
+        return match.view_name if match else request.path
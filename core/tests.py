@@ -1,3 +1,240 @@
-from django.test import TestCase
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+from unittest import mock
+import asyncio
+import io
+import logging
+import threading
 
-# Create your tests here.
+from django.test import SimpleTestCase, TestCase, override_settings
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from core import http, llm, timing
+from core.log_handlers import QueueConsoleHandler
+from core.views import metrics
+
+
+def _response(content):
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+class LLMClientTest(SimpleTestCase):
+    def setUp(self):
+        llm.reset_llm_metrics()
+
+    def test_client_is_reused_per_key(self):
+        with mock.patch.dict(llm._sync_clients, clear=True):
+            first = llm.get_client('key-a', 'http://llm.local/v1')
+            self.assertIs(first, llm.get_client('key-a', 'http://llm.local/v1'))
+            self.assertIsNot(first, llm.get_client('key-b', 'http://llm.local/v1'))
+
+    def test_retry_with_backoff_and_metrics(self):
+        client = mock.Mock()
+        client.chat.completions.create.side_effect = [RuntimeError('503'), _response('{"a": 1}')]
+
+        with mock.patch.object(llm, 'get_client', return_value=client), \
+                mock.patch.object(llm.time, 'sleep') as sleep:
+            text = llm.chat_completion('test_call', 'key', max_retries=1, model='m', messages=[])
+
+        self.assertEqual(llm.parse_json_response(text), {'a': 1})
+        sleep.assert_called_once()
+        self.assertLessEqual(sleep.call_args[0][0], 0.75)
+        stats = llm.llm_metrics()['test_call']
+        self.assertEqual((stats['calls'], stats['errors'], stats['retries']), (1, 1, 1))
+
+    @override_settings(LLM_QUEUE_TIMEOUT=0.01)
+    def test_busy_when_concurrency_exhausted(self):
+        semaphore = mock.Mock()
+        semaphore.acquire.return_value = False
+        with mock.patch.object(llm, '_get_sync_semaphore', return_value=semaphore):
+            with self.assertRaises(llm.LLMBusyError):
+                llm.chat_completion('test_call', 'key', model='m', messages=[])
+        self.assertEqual(llm.llm_metrics()['test_call']['busy'], 1)
+
+    def test_async_path_does_not_block_loop(self):
+        async def create(**params):
+            await asyncio.sleep(0.05)
+            return _response('```json\n{"ok": true}\n```')
+
+        client = mock.Mock()
+        client.chat.completions.create = create
+
+        async def run():
+            with mock.patch.object(llm, 'get_async_client', return_value=client):
+                results = await asyncio.gather(*[
+                    llm.achat_completion('test_async', 'key', model='m', messages=[]) for _ in range(4)
+                ])
+            return [llm.parse_json_response(text) for text in results]
+
+        loop = asyncio.new_event_loop()
+        try:
+            started = loop.time()
+            results = loop.run_until_complete(run())
+            elapsed = loop.time() - started
+        finally:
+            loop.close()
+
+        self.assertEqual(results, [{'ok': True}] * 4)
+        # 4개 호출이 동시에 진행됨 (순차라면 0.2초 이상)
+        self.assertLess(elapsed, 0.15)
+        self.assertEqual(llm.llm_metrics()['test_async']['calls'], 4)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """keep-alive 테스트 서버 (요청마다 클라이언트 포트 기록, fail 횟수만큼 503)"""
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        server = self.server
+        server.client_ports.append(self.client_address[1])
+        if server.failures > 0:
+            server.failures -= 1
+            status, body = 503, b'busy'
+        else:
+            status, body = 200, b'{"ok": true}'
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@override_settings(HTTP_RETRY_BACKOFF=0)
+class HTTPClientTest(SimpleTestCase):
+    def setUp(self):
+        http.close_sessions()
+        http.reset_http_metrics()
+        self.addCleanup(http.close_sessions)
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+        self.server.client_ports = []
+        self.server.failures = 0
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.host = f'127.0.0.1:{self.server.server_port}'
+        self.url = f'http://{self.host}/forecast'
+
+    def test_connections_are_reused(self):
+        for _ in range(5):
+            self.assertEqual(http.get(self.url, timeout=2).json(), {'ok': True})
+        # keep-alive: 5번 호출이 한 연결로 처리됨
+        self.assertEqual(len(set(self.server.client_ports)), 1)
+        self.assertEqual(http.http_metrics()[self.host]['calls'], 5)
+
+    def test_retries_server_errors_and_records_metrics(self):
+        self.server.failures = 2
+        response = http.get(self.url, timeout=2, max_retries=2)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(self.server.client_ports), 3)
+        stats = http.http_metrics()[self.host]
+        self.assertEqual((stats['calls'], stats['errors'], stats['retries']), (1, 0, 2))
+
+        self.server.failures = 5
+        self.assertEqual(http.get(self.url, timeout=2, max_retries=1).status_code, 503)
+        self.assertEqual(http.http_metrics()[self.host]['errors'], 1)
+
+    def test_metrics_view_is_staff_only(self):
+        http.get(self.url, timeout=2)
+        factory = APIRequestFactory()
+
+        request = factory.get('/api/metrics/')
+        force_authenticate(request, user=SimpleNamespace(is_authenticated=True, is_staff=False))
+        self.assertEqual(metrics(request).status_code, 403)
+
+        request = factory.get('/api/metrics/')
+        force_authenticate(request, user=SimpleNamespace(is_authenticated=True, is_staff=True))
+        response = metrics(request)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['http'][self.host]['calls'], 1)
+        self.assertIn('llm', response.data)
+
+
+class QueueConsoleHandlerTest(SimpleTestCase):
+    """비차단 콘솔 로그 핸들러 테스트"""
+
+    def _logger(self, handler):
+        logger = logging.getLogger('core.tests.queue')
+        logger.handlers = [handler]
+        logger.setLevel(logging.DEBUG)
+        logger.propagate = False
+        self.addCleanup(setattr, logger, 'handlers', [])
+        return logger
+
+    def test_formats_and_flushes_on_close(self):
+        stream = io.StringIO()
+        handler = QueueConsoleHandler(stream=stream)
+        handler.setFormatter(logging.Formatter('%(levelname)s %(message)s'))
+        logger = self._logger(handler)
+
+        logger.info('운세 %s건', 3)
+        logger.debug('격자 %s', (67, 100))
+        handler.close()
+        self.assertEqual(stream.getvalue().splitlines(), ['INFO 운세 3건', 'DEBUG 격자 (67, 100)'])
+
+    def test_drops_when_queue_is_full(self):
+        class BlockedStream(io.StringIO):
+            def __init__(self):
+                super().__init__()
+                self.release = threading.Event()
+
+            def write(self, text):
+                self.release.wait(5)
+                return super().write(text)
+
+        stream = BlockedStream()
+        handler = QueueConsoleHandler(maxsize=2, stream=stream)
+        logger = self._logger(handler)
+
+        # 출력이 막혀 있어도 로깅 호출은 기다리지 않음 (큐 크기를 넘는 레코드는 버림)
+        for i in range(10):
+            logger.info('line %s', i)
+        self.assertGreater(handler.dropped, 0)
+        stream.release.set()
+        handler.close()
+        self.assertEqual(len(stream.getvalue().splitlines()), 10 - handler.dropped)
+
+
+class TimingTest(TestCase):
+    """단계별 시간 측정 / Server-Timing 테스트"""
+
+    def setUp(self):
+        timing.reset_timing_metrics()
+        self.addCleanup(timing.reset_timing_metrics)
+
+    def test_stage_is_noop_without_trace(self):
+        self.assertIs(timing.stage('saju'), timing.stage('scores'))
+        self.assertIsNone(timing.current_trace())
+
+    def test_trace_accumulates_stages(self):
+        @timing.timed('lotto')
+        def lotto():
+            return 7
+
+        token = timing.start_trace()
+        with timing.stage('saju'):
+            pass
+        with timing.stage('saju'):
+            pass
+        self.assertEqual(lotto(), 7)
+        trace = timing.finish_trace(token, 'test')
+
+        self.assertEqual(list(trace.stages), ['saju', 'lotto'])
+        self.assertEqual(trace.stages['saju'][2], 2)
+        self.assertRegex(trace.server_timing(), r'^saju;dur=[\d.]+;desc="cpu [\d.]+ms x2", lotto;dur=.*total;dur=')
+        self.assertEqual(timing.timing_metrics()['test']['saju']['count'], 1)
+        self.assertIsNone(timing.current_trace())
+
+    def test_server_timing_header_on_fortune_api(self):
+        with override_settings(TIMING_ENABLED=True):
+            response = self.client.get('/api/fortune/today/')
+            other = self.client.get('/api/')
+        self.assertIn('total;dur=', response['Server-Timing'])
+        self.assertFalse(other.has_header('Server-Timing'))
+        self.assertEqual(len(timing.timing_metrics()), 1)
+
+        response = self.client.get('/api/fortune/today/')
+        self.assertFalse(response.has_header('Server-Timing'))
@@ -0,0 +1,178 @@
+"""
+요청 단계별 시간 측정 (opt-in)
+- 요청마다 Trace 를 contextvar 에 두고, stage()/timed() 구간의 벽시계/CPU 시간(ms)을 단계 이름별로 누적
+- 활성 Trace 가 없으면 stage() 는 공용 no-op 컨텍스트를 돌려주므로 측정 비용이 거의 없음
+- 요청이 끝나면 단계별 값을 프로세스 히스토그램에 합산 (timing_metrics, manage.py timing_report)
+- 응답 헤더 연결은 core.middleware.ServerTimingMiddleware (settings.TIMING_ENABLED)
+"""
+import bisect
+import contextvars
+import functools
+import threading
+import time
+from contextlib import nullcontext
+from typing import Dict, List, Optional
+
+# 히스토그램 구간 상한 (ms), 마지막은 그 이상
+BUCKET_BOUNDS_MS = (0.1, 0.5, 1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+_NOOP = nullcontext()
+_current: contextvars.ContextVar[Optional['Trace']] = contextvars.ContextVar('timing_trace', default=None)
+
+
+class Trace:
+    """요청 하나의 단계별 누적 시간 (이름 -> [벽시계 ms, CPU ms, 횟수], 처음 기록된 순서 유지)"""
+    __slots__ = ('stages', 'started', 'cpu_started')
+
+    def __init__(self):
+        self.stages: Dict[str, List[float]] = {}
+        self.started = time.perf_counter()
+        self.cpu_started = time.thread_time()
+
+    def add(self, name: str, wall_ms: float, cpu_ms: float):
+        entry = self.stages.get(name)
+        if entry is None:
+            self.stages[name] = [wall_ms, cpu_ms, 1]
+        else:
+            entry[0] += wall_ms
+            entry[1] += cpu_ms
+            entry[2] += 1
+
+    def total(self):
+        """(벽시계 ms, CPU ms) - Trace 시작부터 지금까지"""
+        return (time.perf_counter() - self.started) * 1000, (time.thread_time() - self.cpu_started) * 1000
+
+    def server_timing(self) -> str:
+        """Server-Timing 헤더 값 (단계별 dur=벽시계, desc=CPU, 마지막에 total)"""
+        parts = [
+            f'{name};dur={wall:.2f};desc="cpu {cpu:.2f}ms x{count}"'
+            for name, (wall, cpu, count) in self.stages.items()
+        ]
+        wall, cpu = self.total()
+        parts.append(f'total;dur={wall:.2f};desc="cpu {cpu:.2f}ms"')
+        return ', '.join(parts)
+
+
+class _Stage:
+    __slots__ = ('trace', 'name', 'wall', 'cpu')
+
+    def __init__(self, trace, name):
+        self.trace = trace
+        self.name = name
+
+    def __enter__(self):
+        self.wall = time.perf_counter()
+        self.cpu = time.thread_time()
+        return self
+
+    def __exit__(self, *exc):
+        self.trace.add(
+            self.name, (time.perf_counter() - self.wall) * 1000, (time.thread_time() - self.cpu) * 1000
+        )
+        return False
+
+
+def stage(name: str):
+    """단계 측정 컨텍스트 (활성 Trace 가 없으면 no-op)"""
+    trace = _current.get()
+    if trace is None:
+        return _NOOP
+    return _Stage(trace, name)
+
+
+def timed(name: str):
+    """함수 전체를 한 단계로 측정하는 데코레이터"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            trace = _current.get()
+            if trace is None:
+                return func(*args, **kwargs)
+            with _Stage(trace, name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def start_trace() -> contextvars.Token:
+    """현재 컨텍스트에서 Trace 시작 -> finish_trace 에 넘길 토큰"""
+    return _current.set(Trace())
+
+
+def current_trace() -> Optional[Trace]:
+    return _current.get()
+
+
+def finish_trace(token: contextvars.Token, endpoint: str = '') -> Optional[Trace]:
+    """Trace 종료 후 히스토그램에 합산 -> 종료한 Trace"""
+    trace = _current.get()
+    _current.reset(token)
+    if trace is not None:
+        _record(endpoint, trace)
+    return trace
+
+
+# ===== 히스토그램 =====
+
+class _Histogram:
+    __slots__ = ('count', 'total_ms', 'cpu_ms', 'max_ms', 'buckets')
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.cpu_ms = 0.0
+        self.max_ms = 0.0
+        self.buckets = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+
+    def add(self, wall_ms, cpu_ms):
+        self.count += 1
+        self.total_ms += wall_ms
+        self.cpu_ms += cpu_ms
+        self.max_ms = max(self.max_ms, wall_ms)
+        self.buckets[bisect.bisect_left(BUCKET_BOUNDS_MS, wall_ms)] += 1
+
+    def quantile(self, ratio):
+        """구간 상한 기준 근사 분위수 (ms)"""
+        target = ratio * self.count
+        seen = 0
+        for bound, count in zip(BUCKET_BOUNDS_MS, self.buckets):
+            seen += count
+            if seen >= target:
+                return bound
+        return self.max_ms
+
+
+_stats_lock = threading.Lock()
+_histograms: Dict[tuple, _Histogram] = {}  # (엔드포인트, 단계) -> 히스토그램
+
+
+def _record(endpoint: str, trace: Trace):
+    wall, cpu = trace.total()
+    with _stats_lock:
+        for name, (stage_wall, stage_cpu, _) in list(trace.stages.items()) + [('total', (wall, cpu, 1))]:
+            histogram = _histograms.get((endpoint, name))
+            if histogram is None:
+                histogram = _histograms[(endpoint, name)] = _Histogram()
+            histogram.add(stage_wall, stage_cpu)
+
+
+def timing_metrics() -> Dict[str, Dict[str, dict]]:
+    """엔드포인트 -> 단계 -> (요청 수, 평균 벽시계/CPU ms, p50/p95 근사, 최대, 구간별 개수)"""
+    with _stats_lock:
+        result = {}
+        for (endpoint, name), histogram in _histograms.items():
+            result.setdefault(endpoint, {})[name] = {
+                'count': histogram.count,
+                'avg_ms': round(histogram.total_ms / histogram.count, 2),
+                'avg_cpu_ms': round(histogram.cpu_ms / histogram.count, 2),
+                'p50_ms': histogram.quantile(0.5),
+                'p95_ms': histogram.quantile(0.95),
+                'max_ms': round(histogram.max_ms, 2),
+                'buckets': dict(zip([f'<={bound}' for bound in BUCKET_BOUNDS_MS] + ['inf'], histogram.buckets)),
+            }
+    return result
+
+
+def reset_timing_metrics():
+    with _stats_lock:
+        _histograms.clear()
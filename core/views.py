@@ -1,10 +1,15 @@
 from django.shortcuts import render
 from django.http import JsonResponse
 from django.conf import settings
-from rest_framework.decorators import api_view
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import IsAdminUser
 from rest_framework.response import Response
 from datetime import date
 
+from core.http import http_metrics
+from core.llm import llm_metrics
+from core.timing import timing_metrics
+
 def home(request):
     """홈페이지 - 템플릿 렌더링"""
     context = {
@@ -61,3 +66,14 @@ def api_root(request):
         "documentation": "Visit /admin/ for Django Admin",
         "note": "Most endpoints require authentication or session key"
     })
+
+
+@api_view(['GET'])
+@permission_classes([IsAdminUser])
+def metrics(request):
+    """운영 통계 (관리자 전용) - 호스트별 HTTP, 호출 이름별 LLM, 뷰/단계별 처리 시간 (TIMING_ENABLED)"""
+    return Response({
+        'http': http_metrics(),
+        'llm': llm_metrics(),
+        'timing': timing_metrics(),
+    })
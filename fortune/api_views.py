@@ -2,112 +2,432 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import AllowAny, IsAuthenticated
+from collections import OrderedDict
 from datetime import date, datetime
+import copy
+import logging
+import threading
+import time
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from core.timing import timed
 from .services import FortuneCalculator
 from .serializers import FortuneCalculateSerializer
 from .models import DailyFortuneCache
 import json
 
+logger = logging.getLogger(__name__)
 
+# fill_fortune_cache 가 채우는 필드 (upsert 시 갱신 대상, 변경 여부 비교 대상)
+FORTUNE_DATA_FIELDS = [
+    'full_fortune_data', 'birth_date', 'birth_time', 'calendar_type', 'chinese_name',
+    'fortune_score', 'fortune_text', 'lucky_color', 'lucky_colors_json', 'lucky_number',
+    'lucky_direction', 'zodiac_sign', 'chinese_zodiac', 'saju_data',
+]
+
+
+@timed('db_save')
 def save_fortune_to_db(user, session_key, fortune_date, fortune_data, birth_date=None, birth_time='', calendar_type='solar', chinese_name=''):
-    """데이터베이스에 운세 데이터 저장"""
+    """
+    데이터베이스에 운세 데이터 저장 (upsert)
+    - 기존 행을 한 번에 조회해서 내용이 같으면 쓰기 생략
+    - 다르면 기존 행을 갱신 (없으면 삽입), 다른 유니크 키로 충돌하는 행만 삭제
+    """
     try:
-        # 기존 데이터 삭제 후 새로 저장
         if user and user.is_authenticated:
-            # 로그인 사용자: user 기반 + session_key 기반 모두 삭제 (충돌 방지)
-            DailyFortuneCache.objects.filter(user=user, fortune_date=fortune_date).delete()
+            # 로그인 사용자: user 기반 행을 유지하고, 같은 session_key 의 다른 행(로그인 전 비회원 행)은 정리
+            lookup = Q(user=user)
             if session_key:
-                DailyFortuneCache.objects.filter(session_key=session_key, fortune_date=fortune_date).delete()
+                lookup |= Q(session_key=session_key)
+            conflict_fields = ['user', 'fortune_date']
             cache = DailyFortuneCache(user=user, fortune_date=fortune_date, session_key=session_key)
         elif session_key:
-            DailyFortuneCache.objects.filter(session_key=session_key, fortune_date=fortune_date).delete()
+            lookup = Q(session_key=session_key)
+            conflict_fields = ['session_key', 'fortune_date']
             cache = DailyFortuneCache(session_key=session_key, fortune_date=fortune_date)
         else:
             return False
 
-        # 전체 운세 데이터를 JSON으로 저장
-        cache.full_fortune_data = json.dumps(fortune_data, ensure_ascii=False)
-
-        # 운세 계산 키 저장 (동일 조건 캐시용)
-        cache.birth_date = birth_date
-        cache.birth_time = birth_time or ''
-        cache.calendar_type = calendar_type or 'solar'
-        cache.chinese_name = chinese_name or ''
-
-        # 기본 필드도 저장 (검색/필터링용)
-        cache.fortune_score = fortune_data.get('fortune_score', 50)
-        cache.fortune_text = fortune_data.get('fortune_texts', {}).get('total', '')
-        cache.lucky_color = fortune_data.get('lucky_color', '#7c3aed')
-        cache.lucky_colors = fortune_data.get('lucky_colors', [])
-        cache.lucky_number = fortune_data.get('lotto_numbers', [None])[0]
-        cache.lucky_direction = fortune_data.get('lucky_item', {}).get('direction', '')
-        cache.zodiac_sign = fortune_data.get('zodiac_sign', '')
-        cache.chinese_zodiac = fortune_data.get('chinese_zodiac', '')
-        cache.saju_data = json.dumps(fortune_data.get('saju_data', {}), ensure_ascii=False)
-
-        cache.save()
-        print(f"[DB Cache] 저장 완료: user={user}, session={session_key}, date={fortune_date}, birth={birth_date}")
+        fill_fortune_cache(cache, fortune_data, birth_date, birth_time, calendar_type, chinese_name)
+        existing = list(DailyFortuneCache.objects.filter(lookup, fortune_date=fortune_date))
+
+        if (
+            len(existing) == 1
+            and existing[0].user_id == cache.user_id
+            and existing[0].session_key == cache.session_key
+            and _same_fortune_fields(existing[0], cache)
+        ):
+            logger.debug("변경 없음 - 저장 생략: user=%s, session=%s, date=%s", user, session_key, fortune_date)
+            return True
+
+        with transaction.atomic():
+            # 유지할 행(conflict_fields 기준)이 아닌 충돌 행 삭제
+            if user and user.is_authenticated:
+                stale = [row.pk for row in existing if row.user_id != user.pk]
+            else:
+                stale = []
+            if stale:
+                DailyFortuneCache.objects.filter(pk__in=stale).delete()
+
+            DailyFortuneCache.objects.bulk_create(
+                [cache],
+                update_conflicts=True,
+                unique_fields=conflict_fields,
+                update_fields=FORTUNE_DATA_FIELDS + ['user', 'session_key'],
+            )
+        if user and user.is_authenticated:
+            forget_today_fortune(user)
+        logger.debug("저장 완료: user=%s, session=%s, date=%s, birth=%s", user, session_key, fortune_date, birth_date)
         return True
     except Exception as e:
-        print(f"[DB Cache] 저장 실패: {e}")
+        logger.exception("운세 저장 실패: %s", e)
         return False
 
 
-def find_same_condition_fortune(fortune_date, birth_date, birth_time='', calendar_type='solar', chinese_name=''):
-    """동일 조건의 운세 캐시 찾기 (생년월일+시간+양음력+한자이름+날짜)"""
+def save_fortunes_to_db_bulk(caches, overwrite=False, batch_size=500):
+    """
+    user 기반 운세 행 일괄 저장 (사전 생성용, fill_fortune_cache 로 채운 인스턴스 목록)
+
+    Args:
+        overwrite: True면 같은 (user, fortune_date) 행을 갱신, False면 기존 행 유지
+    """
+    if not caches:
+        return 0
+    if overwrite:
+        DailyFortuneCache.objects.bulk_create(
+            caches,
+            batch_size=batch_size,
+            update_conflicts=True,
+            unique_fields=['user', 'fortune_date'],
+            update_fields=FORTUNE_DATA_FIELDS,
+        )
+    else:
+        DailyFortuneCache.objects.bulk_create(caches, batch_size=batch_size, ignore_conflicts=True)
+    return len(caches)
+
+
+# 사전 생성 행의 세션 키 (session_key + fortune_date 유니크 제약 때문에 사용자별로 구분)
+PREWARM_SESSION_PREFIX = 'prewarm:'
+
+
+# 사전 생성 대상 사용자 조회 컬럼 (prewarm_profile 에 필요한 것만)
+PREWARM_USER_FIELDS = ('pk', 'birth_date', 'birth_time', 'calendar_type', 'gender', 'chinese_name', 'mbti')
+
+
+def prewarm_profile(user):
+    """사전 생성용 운세 계산 인자 (API 뷰와 같은 인자여야 동일 조건 캐시/텍스트 캐시 키가 일치함)"""
+    return {
+        'birth_date': user.birth_date,
+        'gender': user.gender,
+        'birth_time': user.birth_time or '',
+        'chinese_name': user.chinese_name or '',
+        'calendar_type': user.calendar_type,
+        'mbti': user.mbti,
+        'user_id': user.pk,
+    }
+
+
+def prewarm_user_fortunes(calculator, users, day, overwrite=False, use_llm=False, llm_concurrency=4):
+    """
+    사용자 청크 하나의 운세 계산 후 일괄 저장 (prewarm_fortunes, batch_fortune_texts 공용)
+
+    Returns:
+        (저장 수, 건너뛴 수)
+    """
+    # 오늘 이미 운세가 있는 사용자는 건너뜀 (직접 조회한 결과를 덮어쓰지 않음, overwrite 면 모두 갱신)
+    if overwrite:
+        targets = users
+    else:
+        existing = set(
+            DailyFortuneCache.objects
+            .filter(fortune_date=day, user_id__in=[user.pk for user in users])
+            .values_list('user_id', flat=True)
+        )
+        targets = [user for user in users if user.pk not in existing]
+    if not targets:
+        return 0, len(users)
+
+    profiles = [prewarm_profile(user) for user in targets]
+    fortunes = calculator.calculate_fortunes_bulk(profiles, day, use_llm=use_llm, llm_concurrency=llm_concurrency)
+
+    rows = []
+    for user, profile, fortune_data in zip(targets, profiles, fortunes):
+        cache = DailyFortuneCache(
+            user_id=user.pk,
+            session_key=f'{PREWARM_SESSION_PREFIX}{user.pk}',
+            fortune_date=day,
+        )
+        rows.append(fill_fortune_cache(
+            cache, fortune_data,
+            birth_date=user.birth_date, birth_time=profile['birth_time'],
+            calendar_type=profile['calendar_type'], chinese_name=profile['chinese_name']
+        ))
+
+    # 실행 중 사용자가 직접 생성한 행과 충돌하면 그 행을 유지 (overwrite 면 갱신)
+    save_fortunes_to_db_bulk(rows, overwrite=overwrite, batch_size=len(rows))
+    return len(rows), len(users) - len(rows)
+
+
+def _birth_time_str(birth_time):
+    """출생 시간을 행에 저장되는 문자열 형식으로 (time -> 'HH:MM:SS', 없으면 '')"""
+    return str(birth_time) if birth_time else ''
+
+
+def _same_fortune_fields(row, cache):
+    return all(getattr(row, field) == getattr(cache, field) for field in FORTUNE_DATA_FIELDS)
+
+
+def fill_fortune_cache(cache, fortune_data, birth_date=None, birth_time='', calendar_type='solar', chinese_name=''):
+    """DailyFortuneCache 인스턴스에 운세 데이터 필드 채우기 (저장은 호출자가 수행)"""
+    # 전체 운세 데이터를 JSON으로 저장
+    cache.full_fortune_data = fortune_data
+
+    # 운세 계산 키 저장 (동일 조건 캐시용)
+    cache.birth_date = birth_date
+    cache.birth_time = _birth_time_str(birth_time)  # CharField 는 문자열로 읽히므로 비교 전에 맞춤
+    cache.calendar_type = calendar_type or 'solar'
+    cache.chinese_name = chinese_name or ''
+
+    # 기본 필드도 저장 (검색/필터링용)
+    cache.fortune_score = fortune_data.get('fortune_score', 50)
+    cache.fortune_text = fortune_data.get('fortune_texts', {}).get('total', '')
+    cache.lucky_color = fortune_data.get('lucky_color', '#7c3aed')
+    cache.lucky_colors = fortune_data.get('lucky_colors', [])
+    cache.lucky_number = fortune_data.get('lotto_numbers', [None])[0]
+    cache.lucky_direction = fortune_data.get('lucky_item', {}).get('direction', '')
+    cache.zodiac_sign = fortune_data.get('zodiac_sign', '')
+    cache.chinese_zodiac = fortune_data.get('chinese_zodiac', '')
+    cache.saju_data = fortune_data.get('saju_data', {})
+    return cache
+
+
+@timed('db_same_condition')
+def find_same_condition_fortune(fortune_date, birth_date, birth_time='', calendar_type='solar', chinese_name='',
+                                gender=None, mbti=None):
+    """
+    동일 조건의 운세 캐시 찾기 (생년월일+시간+양음력+한자이름+날짜)
+
+    gender 를 주면 저장된 운세의 성별/MBTI 까지 같은 행만 사용 (점수/행운색/로또/아이템/텍스트가 달라짐)
+    """
     try:
-        cache = DailyFortuneCache.objects.filter(
+        rows = DailyFortuneCache.objects.filter(
             fortune_date=fortune_date,
             birth_date=birth_date,
-            birth_time=birth_time or '',
+            birth_time=_birth_time_str(birth_time),
             calendar_type=calendar_type or 'solar',
             chinese_name=chinese_name or ''
-        ).order_by('created_at').first()  # 가장 먼저 생성된 것 사용
-
-        if cache and cache.full_fortune_data:
-            fortune_data = json.loads(cache.full_fortune_data)
-            print(f"[DB Cache] 동일 조건 캐시 히트: birth={birth_date}, time={birth_time}, name={chinese_name}")
+        )
+        if gender is not None:
+            rows = rows.filter(full_fortune_data__gender=gender)
+            if mbti:
+                rows = rows.filter(full_fortune_data__mbti=mbti)
+            else:
+                rows = rows.filter(Q(full_fortune_data__mbti=None) | Q(full_fortune_data__mbti=''))
+        fortune_data = rows.order_by('created_at').values_list('full_fortune_data', flat=True).first()  # 가장 먼저 생성된 것 사용
+
+        if fortune_data:
+            logger.debug("동일 조건 캐시 히트: birth=%s, time=%s, name=%s", birth_date, birth_time, chinese_name)
             return fortune_data
         return None
     except Exception as e:
-        print(f"[DB Cache] 동일 조건 조회 실패: {e}")
+        logger.error("동일 조건 조회 실패: %s", e)
         return None
 
 
+def _own_fortune_rows(user, session_key, fortune_date):
+    """본인(user 또는 session) 운세 행 쿼리셋, 조회 불가하면 None"""
+    if user and user.is_authenticated:
+        return DailyFortuneCache.objects.filter(user=user, fortune_date=fortune_date)
+    if session_key:
+        return DailyFortuneCache.objects.filter(session_key=session_key, fortune_date=fortune_date)
+    return None
+
+
+@timed('db_load')
 def load_fortune_from_db(user, session_key, fortune_date):
     """데이터베이스에서 운세 데이터 로드"""
     try:
-        if user and user.is_authenticated:
-            cache = DailyFortuneCache.objects.filter(user=user, fortune_date=fortune_date).first()
-        elif session_key:
-            cache = DailyFortuneCache.objects.filter(session_key=session_key, fortune_date=fortune_date).first()
-        else:
+        rows = _own_fortune_rows(user, session_key, fortune_date)
+        if rows is None:
             return None
+        # 건강운 보완 시 갱신하는 필드만 로드
+        cache = rows.only('pk', 'full_fortune_data', 'fortune_score').first()
 
         if not cache:
-            print(f"[DB Cache] 미스: user={user}, session={session_key}, date={fortune_date}")
+            logger.debug("DB 캐시 미스: user=%s, session=%s, date=%s", user, session_key, fortune_date)
             return None
 
         # full_fortune_data에서 전체 데이터 복원
         if cache.full_fortune_data:
-            fortune_data = json.loads(cache.full_fortune_data)
+            fortune_data = cache.full_fortune_data
 
             # 건강운이 없는 기존 데이터에 건강운 추가
             fortune_data = add_health_fortune_if_missing(fortune_data, cache)
 
-            print(f"[DB Cache] 히트: user={user}, session={session_key}, date={fortune_date}")
+            logger.debug("DB 캐시 히트: user=%s, session=%s, date=%s", user, session_key, fortune_date)
             return fortune_data
 
         # 레거시 데이터 처리 (full_fortune_data가 없는 경우)
-        print(f"[DB Cache] 레거시 데이터 - 재계산 필요")
+        logger.debug("레거시 데이터 - 재계산 필요")
+        return None
+    except Exception as e:
+        logger.error("운세 로드 실패: %s", e)
         return None
+
+
+def load_fortune_summary_from_db(user, session_key, fortune_date):
+    """
+    요약 카드용 운세 필드만 로드 (전체 운세 JSON 을 읽거나 역직렬화하지 않음)
+
+    Returns:
+        {'fortune_score', 'fortune_scores', 'fortune_text', 'lucky_color', 'lucky_colors',
+         'zodiac_sign', 'chinese_zodiac'} 또는 None
+    """
+    try:
+        rows = _own_fortune_rows(user, session_key, fortune_date)
+        if rows is None:
+            return None
+        row = rows.values(
+            'fortune_score', 'fortune_text', 'lucky_color', 'lucky_colors_json', 'zodiac_sign', 'chinese_zodiac',
+            'full_fortune_data__fortune_scores',  # JSON 키 조회 (DB에서 해당 키만 추출)
+        ).first()
+        if not row:
+            return None
+
+        try:
+            row['lucky_colors'] = json.loads(row.pop('lucky_colors_json') or '[]')
+        except ValueError:
+            row['lucky_colors'] = []
+        row['fortune_scores'] = row.pop('full_fortune_data__fortune_scores') or {}
+        return row
     except Exception as e:
-        print(f"[DB Cache] 로드 실패: {e}")
+        logger.error("운세 요약 로드 실패: %s", e)
         return None
 
 
+# ===== 오늘의 운세 read-through (OOTD/메뉴/아이템 체크/운세 생성 공용) =====
+
+# 세션 없이 저장하는 사용자 행의 session_key (session_key + fortune_date 유니크 제약 때문에 사용자별로 구분)
+USER_ROW_SESSION_PREFIX = 'user:'
+
+_today_lock = threading.Lock()
+_today_fortunes = OrderedDict()  # user.pk -> (운세 날짜, 프로필, 저장 시각, 운세 데이터)
+
+
+def _fortune_profile(user):
+    """운세 계산 입력 (행에 저장되는 형식: birth_time 은 문자열)"""
+    return (
+        user.birth_date,
+        _birth_time_str(getattr(user, 'birth_time', None)),
+        getattr(user, 'calendar_type', None) or 'solar',
+        getattr(user, 'chinese_name', None) or '',
+    )
+
+
+def _remember_today_fortune(user, fortune_date, profile, fortune_data):
+    with _today_lock:
+        _today_fortunes[user.pk] = (fortune_date, profile, time.monotonic(), fortune_data)
+        _today_fortunes.move_to_end(user.pk)
+        while len(_today_fortunes) > getattr(settings, 'TODAY_FORTUNE_CACHE_SIZE', 2048):
+            _today_fortunes.popitem(last=False)
+
+
+def _recall_today_fortune(user, fortune_date, profile):
+    with _today_lock:
+        entry = _today_fortunes.get(user.pk)
+        if entry is None:
+            return None
+        cached_date, cached_profile, stored_at, fortune_data = entry
+        if (
+            cached_date != fortune_date or cached_profile != profile
+            or time.monotonic() - stored_at > getattr(settings, 'TODAY_FORTUNE_CACHE_TTL', 300)
+        ):
+            del _today_fortunes[user.pk]
+            return None
+        _today_fortunes.move_to_end(user.pk)
+    # 호출자가 수정해도 캐시가 바뀌지 않도록 복사본 반환
+    return copy.deepcopy(fortune_data)
+
+
+def forget_today_fortune(user):
+    """사용자 운세가 다시 저장되면 프로세스 캐시에서 제거"""
+    if user is not None and user.pk is not None:
+        with _today_lock:
+            _today_fortunes.pop(user.pk, None)
+
+
+def clear_today_fortune_cache():
+    with _today_lock:
+        _today_fortunes.clear()
+
+
+@timed('db_load')
+def _load_own_fortune(user, fortune_date, profile):
+    """사용자 본인 행 (현재 프로필로 계산된 것만, 다른 생년월일로 계산한 행은 무시)"""
+    row = DailyFortuneCache.objects.filter(user=user, fortune_date=fortune_date).only(
+        'pk', 'full_fortune_data', 'fortune_score', 'birth_date', 'birth_time', 'calendar_type', 'chinese_name'
+    ).first()
+    if not row or not row.full_fortune_data:
+        return None
+    if (row.birth_date, row.birth_time, row.calendar_type, row.chinese_name) != profile:
+        logger.debug("프로필이 바뀐 운세 행 - 재계산: user=%s, date=%s", user, fortune_date)
+        return None
+    return add_health_fortune_if_missing(row.full_fortune_data, row)
+
+
+def get_today_fortune(user, session_key=None, fortune_date=None):
+    """
+    로그인 사용자의 오늘 운세 (read-through, 생년월일이 없으면 None)
+
+    조회 순서: 요청 내 메모 -> 프로세스 LRU -> DailyFortuneCache 본인 행 -> 동일 조건(성별/MBTI 포함) 행 -> 계산 후 저장
+    """
+    if not user or not user.is_authenticated or not user.birth_date:
+        return None
+    fortune_date = fortune_date or date.today()
+    profile = _fortune_profile(user)
+
+    # 같은 요청 안에서는 request.user 객체가 같으므로 객체에 메모
+    memo = getattr(user, '_today_fortune_memo', None)
+    if memo and memo[0] == (fortune_date, profile):
+        return memo[1]
+
+    fortune_data = _recall_today_fortune(user, fortune_date, profile)
+    if fortune_data is None:
+        fortune_data = _load_own_fortune(user, fortune_date, profile)
+        if fortune_data is None:
+            birth_date, birth_time, calendar_type, chinese_name = profile
+            fortune_data = find_same_condition_fortune(
+                fortune_date, birth_date, birth_time, calendar_type, chinese_name,
+                gender=user.gender or '', mbti=getattr(user, 'mbti', None)
+            )
+            if not fortune_data:
+                logger.debug("운세 계산: user=%s", user.pk)
+                fortune_data = FortuneCalculator().calculate_fortune(
+                    birth_date=user.birth_date,
+                    gender=user.gender,
+                    birth_time=getattr(user, 'birth_time', None),
+                    chinese_name=chinese_name,
+                    calendar_type=calendar_type,
+                    mbti=getattr(user, 'mbti', None),
+                    user_id=user.id,
+                    session_key=session_key,
+                    today=fortune_date,
+                )
+            save_fortune_to_db(
+                user, session_key or f'{USER_ROW_SESSION_PREFIX}{user.pk}', fortune_date, fortune_data,
+                birth_date=birth_date, birth_time=birth_time,
+                calendar_type=calendar_type, chinese_name=chinese_name
+            )
+        _remember_today_fortune(user, fortune_date, profile, copy.deepcopy(fortune_data))
+
+    user._today_fortune_memo = ((fortune_date, profile), fortune_data)
+    return fortune_data
+
+
 def add_health_fortune_if_missing(fortune_data, cache=None):
     """기존 운세 데이터에 건강운이 없으면 추가"""
+    import hashlib
     import random
 
     fortune_scores = fortune_data.get('fortune_scores', {})
@@ -117,7 +437,7 @@ def add_health_fortune_if_missing(fortune_data, cache=None):
     if 'health' in fortune_scores and 'health' in fortune_texts:
         return fortune_data
 
-    print("[DB Cache] 건강운 없음 - 추가 생성")
+    logger.debug("건강운 없음 - 추가 생성")
 
     # 건강운 점수 생성 (기존 점수들의 평균 기반)
     existing_scores = [v for k, v in fortune_scores.items() if k != 'total' and isinstance(v, (int, float))]
@@ -126,7 +446,10 @@ def add_health_fortune_if_missing(fortune_data, cache=None):
     else:
         base = 70
 
-    health_score = max(50, min(100, base + random.randint(-10, 10)))
+    # 같은 날 같은 사용자는 항상 같은 건강운 (전역 random 상태를 건드리지 않는 독립 난수 생성기)
+    seed_string = f"health-{fortune_data.get('calculation_date')}-{fortune_data.get('birth_date')}-{fortune_data.get('gender')}"
+    rng = random.Random(int(hashlib.md5(seed_string.encode()).hexdigest(), 16))
+    health_score = max(50, min(100, base + rng.randint(-10, 10)))
     fortune_scores['health'] = health_score
 
     # 총운 점수 재계산 (5개 운세 평균)
@@ -169,12 +492,12 @@ def add_health_fortune_if_missing(fortune_data, cache=None):
     # DB 캐시 업데이트 (건강운이 추가된 데이터로)
     if cache:
         try:
-            cache.full_fortune_data = json.dumps(fortune_data, ensure_ascii=False)
+            cache.full_fortune_data = fortune_data
             cache.fortune_score = fortune_scores['total']
-            cache.save()
-            print("[DB Cache] 건강운 추가 후 DB 업데이트 완료")
+            cache.save(update_fields=['full_fortune_data', 'fortune_score'])
+            logger.debug("건강운 추가 후 DB 업데이트 완료")
         except Exception as e:
-            print(f"[DB Cache] 건강운 DB 업데이트 실패: {e}")
+            logger.error("건강운 DB 업데이트 실패: %s", e)
 
     return fortune_data
 
@@ -260,12 +583,14 @@ class TodayFortuneAPIView(APIView):
     오늘의 운세 조회 API
     - 캐시 확인만 수행, 없으면 need_calculate 반환
     - 실제 계산은 FortuneCalculateAPIView 또는 GenerateFortuneAPIView에서 수행
+    - ?summary=1: 요약 카드용 필드(점수/행운색 등)만 반환 (전체 운세 JSON 로드 생략)
     """
     permission_classes = [AllowAny]
 
     def get(self, request):
         today = date.today()
         today_str = str(today)
+        summary_only = request.query_params.get('summary') in ('1', 'true')
 
         # 로그인 사용자: DB 캐시 확인
         if request.user.is_authenticated:
@@ -281,12 +606,15 @@ class TodayFortuneAPIView(APIView):
                 request.session.create()
             session_key = request.session.session_key
 
+            if summary_only:
+                return self._summary_response(request.user, session_key, today)
+
             # DB 캐시 확인만 (계산 안함)
             fortune_data = load_fortune_from_db(request.user, session_key, today)
 
             # 캐시 미스 - 계산 필요 응답
             if not fortune_data:
-                print(f"[API] DB 캐시 미스 - 계산 필요 (사용자: {request.user.username})")
+                logger.debug("DB 캐시 미스 - 계산 필요: user=%s", request.user.pk)
                 return Response({
                     'success': False,
                     'need_calculate': True,
@@ -308,6 +636,9 @@ class TodayFortuneAPIView(APIView):
             request.session.create()
         session_key = request.session.session_key
 
+        if summary_only:
+            return self._summary_response(None, session_key, today)
+
         # DB 캐시 확인 (비로그인 사용자는 세션 키로 조회)
         fortune_data = load_fortune_from_db(None, session_key, today)
 
@@ -325,6 +656,21 @@ class TodayFortuneAPIView(APIView):
             'date': today_str
         }, status=status.HTTP_200_OK)
 
+    def _summary_response(self, user, session_key, today):
+        summary = load_fortune_summary_from_db(user, session_key, today)
+        if not summary:
+            return Response({
+                'success': False,
+                'need_calculate': True,
+                'message': '오늘의 운세가 아직 생성되지 않았습니다.'
+            }, status=status.HTTP_200_OK)
+
+        return Response({
+            'success': True,
+            'summary': summary,
+            'date': str(today)
+        }, status=status.HTTP_200_OK)
+
 
 class GenerateFortuneAPIView(APIView):
     """로그인 사용자 운세 생성 API (로딩 페이지에서 호출)"""
@@ -345,47 +691,13 @@ class GenerateFortuneAPIView(APIView):
             request.session.create()
         session_key = request.session.session_key
 
-        # 사용자 정보 추출
-        birth_date = request.user.birth_date
-        birth_time = getattr(request.user, 'birth_time', None) or ''
-        chinese_name = getattr(request.user, 'chinese_name', None) or ''
-        calendar_type = getattr(request.user, 'calendar_type', 'solar')
-
-        # 1. 동일 조건 캐시 확인 (생년월일+시간+이름+날짜)
-        fortune_data = find_same_condition_fortune(
-            today, birth_date, birth_time, calendar_type, chinese_name
-        )
-
-        if not fortune_data:
-            # 2. 캐시 미스 - 새로 계산
-            print(f"[API] 운세 생성 시작 (사용자: {request.user.username})")
-            calculator = FortuneCalculator()
-            fortune_data = calculator.calculate_fortune(
-                birth_date=birth_date,
-                gender=request.user.gender,
-                birth_time=birth_time,
-                chinese_name=chinese_name,
-                calendar_type=calendar_type,
-                mbti=getattr(request.user, 'mbti', None),
-                user_id=request.user.id,
-                session_key=session_key
-            )
-        else:
-            print(f"[API] 동일 조건 캐시 사용 (사용자: {request.user.username})")
-
-        # DB에 저장 (본인 캐시 생성/갱신)
-        save_fortune_to_db(
-            request.user, session_key, today, fortune_data,
-            birth_date=birth_date, birth_time=birth_time,
-            calendar_type=calendar_type, chinese_name=chinese_name
-        )
+        # 오늘 운세 (프로세스 캐시 -> 본인 행 -> 동일 조건 행 -> 계산 후 저장)
+        fortune_data = get_today_fortune(request.user, session_key, today)
 
         # 세션에도 저장 (Django 템플릿 호환성)
         request.session['fortune_data_v2'] = fortune_data
         request.session['fortune_date_v2'] = today_str
 
-        print(f"[API] 운세 생성 완료 (사용자: {request.user.username})")
-
         return Response({
             'success': True,
             'fortune': fortune_data,
@@ -407,15 +719,7 @@ class ItemCheckAPIView(APIView):
                 'error': '생년월일 정보가 없습니다.'
             }, status=status.HTTP_400_BAD_REQUEST)
 
-        calculator = FortuneCalculator()
-        fortune_data = calculator.calculate_fortune(
-            birth_date=request.user.birth_date,
-            gender=request.user.gender,
-            birth_time=getattr(request.user, 'birth_time', None),
-            chinese_name=getattr(request.user, 'chinese_name', None),
-            user_id=request.user.id,
-            session_key=None
-        )
+        fortune_data = get_today_fortune(request.user)
 
         # 사용자 아이템 목록 가져오기
         from items.models import UserItem
@@ -0,0 +1,210 @@
+"""
+LLM 운세 텍스트 일괄(Batch) 생성 - 야간 사전 생성용
+- 대상 프로필을 LLM 없이 먼저 계산해서 운세 텍스트 캐시 키(생년월일/성별/별자리/띠/MBTI/행운 아이템/날짜)를 구하고,
+  같은 키는 한 번만 요청하도록 중복 제거 -> 키당 한 줄씩 OpenAI Batch 형식 JSONL 작성 (custom_id = 캐시 키)
+- 전송 방식은 교체 가능 (OpenAIBatchTransport: Files + Batches API / LocalBatchTransport: 파일 기반, 테스트/개발용)
+- 결과 JSONL 을 한 줄씩 읽어 실시간 경로와 같은 캐시 키로 저장 -> 이후 운세 계산은 캐시 적중 (동기 LLM 호출 없음)
+"""
+import json
+import logging
+import os
+import shutil
+import time
+import uuid
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from django.core.cache import cache
+
+from core import llm
+
+logger = logging.getLogger(__name__)
+
+BATCH_ENDPOINT = '/v1/chat/completions'
+FORTUNE_TEXT_TTL = 60 * 60 * 24  # 실시간 경로(_request_fortune_text)와 같은 캐시 기간
+
+# Batch 상태 (OpenAI Batches API 와 같은 값)
+DONE_STATUSES = ('completed', 'failed', 'expired', 'cancelled')
+
+
+def plan_fortune_texts(calculator, profiles: List[Dict], day) -> Tuple[List[str], Dict[str, str]]:
+    """
+    프로필별 운세 텍스트 캐시 키와 키별 프롬프트
+
+    Returns:
+        (profiles 순서대로 캐시 키 목록, {캐시 키: 프롬프트} - 중복 제거됨)
+    """
+    # LLM 없이 계산해도 별자리/띠/행운 아이템/사주는 실시간 경로와 같음 (텍스트만 기본 로직)
+    fortunes = calculator.calculate_fortunes_bulk(profiles, day, use_llm=False)
+
+    keys, prompts = [], {}
+    for fortune in fortunes:
+        lucky_item = fortune['lucky_item']
+        key = calculator._fortune_text_cache_key(
+            fortune['birth_date'], fortune['gender'], fortune['zodiac_sign'], fortune['chinese_zodiac'],
+            fortune['mbti'], lucky_item['main'], day
+        )
+        keys.append(key)
+        if key not in prompts:
+            prompts[key] = calculator._build_fortune_text_prompt(
+                fortune['birth_date'], fortune['gender'], fortune['saju_data'], fortune['zodiac_sign'],
+                fortune['chinese_zodiac'], fortune['mbti'], lucky_item['main'], lucky_item['zodiac'], day
+            )
+    return keys, prompts
+
+
+def uncached_keys(keys: Iterable[str]) -> List[str]:
+    """운세 텍스트가 아직 캐시에 없는 키 (순서 유지)"""
+    keys = list(dict.fromkeys(keys))
+    cached = cache.get_many(keys)
+    return [key for key in keys if not cached.get(key)]
+
+
+def write_batch_lines(f, prompts: Dict[str, str]) -> int:
+    """열린 Batch 입력 JSONL 파일에 키당 한 줄씩 추가 (청크별로 이어 쓰기) -> 줄 수"""
+    from .services import FortuneCalculator
+
+    for key, prompt in prompts.items():
+        f.write(json.dumps({
+            'custom_id': key,
+            'method': 'POST',
+            'url': BATCH_ENDPOINT,
+            'body': FortuneCalculator._fortune_text_params(prompt),
+        }, ensure_ascii=False) + '\n')
+    return len(prompts)
+
+
+def write_batch_file(path, prompts: Dict[str, str]) -> int:
+    """Batch 입력 JSONL 작성 (키당 한 줄) -> 줄 수"""
+    with open(path, 'w', encoding='utf-8') as f:
+        return write_batch_lines(f, prompts)
+
+
+def apply_batch_results(lines: Iterable[Dict], on_stored: Optional[Callable[[str], None]] = None) -> Tuple[int, int]:
+    """
+    Batch 출력 줄을 하나씩 운세 텍스트 캐시에 저장
+
+    Args:
+        lines: 출력 JSONL 의 각 줄 (dict)
+        on_stored: 저장한 캐시 키마다 호출 (DailyFortuneCache 반영용)
+
+    Returns:
+        (저장 수, 실패 수)
+    """
+    stored = failed = 0
+    for line in lines:
+        key = line.get('custom_id')
+        response = line.get('response') or {}
+        try:
+            if line.get('error') or response.get('status_code') != 200:
+                raise ValueError(line.get('error') or f"status {response.get('status_code')}")
+            content = response['body']['choices'][0]['message']['content']
+            result = llm.parse_json_response(content)
+        except (KeyError, IndexError, TypeError, ValueError) as e:
+            failed += 1
+            logger.warning("결과 처리 실패: %s (%s)", key, e)
+            continue
+
+        cache.set(key, result, FORTUNE_TEXT_TTL)
+        stored += 1
+        if on_stored:
+            on_stored(key)
+    return stored, failed
+
+
+def wait_for_batch(transport, batch_id: str, poll_interval: float = 60, timeout: Optional[float] = None) -> str:
+    """Batch 가 끝날 때까지 상태 확인 -> 마지막 상태 (timeout 이 지나면 진행 중 상태 그대로 반환)"""
+    deadline = time.monotonic() + timeout if timeout is not None else None
+    while True:
+        status = transport.status(batch_id)
+        if status in DONE_STATUSES:
+            return status
+        if deadline is not None and time.monotonic() + poll_interval > deadline:
+            return status
+        time.sleep(poll_interval)
+
+
+# ===== 전송 방식 =====
+
+class OpenAIBatchTransport:
+    """OpenAI Files + Batches API (결과는 24시간 안에 생성)"""
+
+    def __init__(self, api_key: str, base_url: Optional[str] = None, completion_window: str = '24h'):
+        self.client = llm.get_client(api_key, base_url)
+        self.completion_window = completion_window
+
+    def submit(self, path) -> str:
+        with open(path, 'rb') as f:
+            input_file = self.client.files.create(file=f, purpose='batch')
+        batch = self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint=BATCH_ENDPOINT,
+            completion_window=self.completion_window,
+        )
+        return batch.id
+
+    def status(self, batch_id: str) -> str:
+        return self.client.batches.retrieve(batch_id).status
+
+    def results(self, batch_id: str) -> Iterator[Dict]:
+        batch = self.client.batches.retrieve(batch_id)
+        # 실패한 요청은 error 파일에 따로 기록됨
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if file_id:
+                for raw in self.client.files.content(file_id).iter_lines():
+                    if raw.strip():
+                        yield json.loads(raw)
+
+
+class LocalBatchTransport:
+    """
+    파일 기반 Batch (테스트/개발용)
+    - submit: 입력 JSONL 을 directory/<batch_id>.input.jsonl 로 복사
+    - responder 가 있으면 바로 처리해서 directory/<batch_id>.output.jsonl 작성 (OpenAI 출력 형식)
+    - responder 가 없으면 출력 파일이 생길 때까지 진행 중 (다른 곳에서 작성)
+    """
+
+    def __init__(self, directory, responder: Optional[Callable[[Dict], str]] = None):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.responder = responder  # 요청 body -> 응답 content
+
+    def _path(self, batch_id: str, kind: str) -> Path:
+        return self.directory / f'{batch_id}.{kind}.jsonl'
+
+    def submit(self, path) -> str:
+        batch_id = f'batch_local_{uuid.uuid4().hex[:12]}'
+        shutil.copyfile(path, self._path(batch_id, 'input'))
+        if self.responder:
+            self._respond(batch_id)
+        return batch_id
+
+    def _respond(self, batch_id: str):
+        output = self._path(batch_id, 'output')
+        tmp_output = output.with_name(output.name + '.tmp')
+        with open(self._path(batch_id, 'input'), encoding='utf-8') as src, open(tmp_output, 'w', encoding='utf-8') as dst:
+            for raw in src:
+                request = json.loads(raw)
+                try:
+                    content = self.responder(request['body'])
+                    line = {'custom_id': request['custom_id'], 'error': None, 'response': {
+                        'status_code': 200, 'body': {'choices': [{'message': {'role': 'assistant', 'content': content}}]},
+                    }}
+                except Exception as e:
+                    line = {'custom_id': request['custom_id'], 'response': None,
+                            'error': {'code': 'local_error', 'message': str(e)}}
+                dst.write(json.dumps(line, ensure_ascii=False) + '\n')
+        os.replace(tmp_output, output)
+
+    def status(self, batch_id: str) -> str:
+        if self._path(batch_id, 'output').exists():
+            return 'completed'
+        if self._path(batch_id, 'input').exists():
+            return 'in_progress'
+        return 'failed'
+
+    def results(self, batch_id: str) -> Iterator[Dict]:
+        with open(self._path(batch_id, 'output'), encoding='utf-8') as f:
+            for raw in f:
+                if raw.strip():
+                    yield json.loads(raw)
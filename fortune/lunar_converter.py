@@ -2,10 +2,16 @@
 음력-양력 변환 유틸리티
 """
 from datetime import date
+from functools import lru_cache
 from typing import Optional
+import logging
 from korean_lunar_calendar import KoreanLunarCalendar
 
+logger = logging.getLogger(__name__)
 
+
+# 변환 한 번에 수 ms 걸리므로 결과 캐시 (date 는 불변이라 그대로 공유 가능)
+@lru_cache(maxsize=4096)
 def lunar_to_solar(lunar_date: date, is_leap_month: bool = False) -> Optional[date]:
     """
     음력 날짜를 양력 날짜로 변환
@@ -36,7 +42,7 @@ def lunar_to_solar(lunar_date: date, is_leap_month: bool = False) -> Optional[da
         return date(solar_year, solar_month, solar_day)
 
     except Exception as e:
-        print(f"[ERROR] 음력->양력 변환 실패: {e}")
+        logger.error("음력->양력 변환 실패: %s", e)
         return None
 
 
@@ -69,5 +75,5 @@ def solar_to_lunar(solar_date: date) -> Optional[dict]:
         }
 
     except Exception as e:
-        print(f"[ERROR] 양력->음력 변환 실패: {e}")
+        logger.error("양력->음력 변환 실패: %s", e)
         return None
@@ -0,0 +1,189 @@
+"""
+LLM 운세 텍스트 일괄(Batch) 생성 후 운세 사전 생성 (야간 배치)
+- 생년월일이 있는 활성 사용자를 --chunk-size 단위로 스트리밍하면서 운세 텍스트 캐시 키를 구해 중복 제거
+  -> 캐시에 없는 키만 Batch JSONL 에 이어 쓰고 제출 (키 -> 사용자 pk 만 메모리에 유지)
+- 결과를 한 줄씩 읽어 운세 텍스트 캐시에 저장하고, 해당 키를 쓰는 사용자 운세를 청크 단위로 DailyFortuneCache 에 저장
+  (저장은 prewarm_fortunes 와 같은 prewarm_user_fortunes, 텍스트는 캐시 적중이라 동기 LLM 호출 없음)
+- 제출 후 기다리지 않으려면 --timeout 0, 나중에 --batch-id 로 결과만 반영
+  (캐시 키에 운세 날짜가 들어가므로 제출 시 --local-dir 에 <batch_id>.manifest.json 으로 날짜를 기록해 두고 그 날짜로 반영)
+
+예) python manage.py batch_fortune_texts                      # 제출 -> 완료까지 대기 -> 반영
+    python manage.py batch_fortune_texts --timeout 0          # 제출만
+    python manage.py batch_fortune_texts --batch-id batch_abc # 결과 반영
+"""
+from contextlib import nullcontext
+from datetime import date, datetime
+from itertools import islice
+from pathlib import Path
+import json
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from fortune import llm_batch
+from fortune.api_views import PREWARM_USER_FIELDS, prewarm_profile, prewarm_user_fortunes
+from fortune.services import FortuneCalculator
+
+
+class Command(BaseCommand):
+    help = '운세 텍스트를 LLM Batch 로 일괄 생성해서 캐시와 DailyFortuneCache 에 저장'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--date', help='운세 날짜 (YYYY-MM-DD, 기본값: 오늘, --batch-id 면 제출 시 기록한 날짜)')
+        parser.add_argument('--transport', choices=['openai', 'local'], default='openai', help='Batch 전송 방식')
+        parser.add_argument('--local-dir', default=str(Path(settings.BASE_DIR) / '.llm_batches'),
+                            help='local 전송 방식의 입출력 폴더 (입력 JSONL 도 여기에 작성)')
+        parser.add_argument('--batch-id', help='이미 제출한 Batch 의 결과만 반영')
+        parser.add_argument('--poll-interval', type=float, default=60, help='상태 확인 간격 (초)')
+        parser.add_argument('--timeout', type=float, default=None, help='완료 대기 최대 시간 (초, 0 이면 제출만)')
+        parser.add_argument('--chunk-size', type=int, default=500, help='한 번에 계산/저장할 사용자 수')
+        parser.add_argument('--limit', type=int, help='최대 처리 사용자 수 (테스트용)')
+        parser.add_argument('--overwrite', action='store_true', help='이미 있는 오늘 운세도 갱신')
+
+    def handle(self, *args, **options):
+        try:
+            day = datetime.strptime(options['date'], '%Y-%m-%d').date() if options['date'] else None
+        except ValueError:
+            raise CommandError('--date 는 YYYY-MM-DD 형식이어야 합니다')
+        if options['batch_id']:
+            # 결과 반영은 보통 제출 다음 날 -> 제출한 날짜의 키로 맞춰야 함
+            recorded = self._load_manifest_day(options['local_dir'], options['batch_id'])
+            if recorded and day and recorded != day:
+                raise CommandError(f'Batch {options["batch_id"]} 는 {recorded} 운세입니다 (--date {day})')
+            day = day or recorded
+            if not day:
+                raise CommandError(f'Batch {options["batch_id"]} 의 제출 기록이 없습니다 - --date 로 운세 날짜를 지정하세요')
+        day = day or date.today()
+        if options['chunk_size'] < 1:
+            raise CommandError('--chunk-size 는 1 이상이어야 합니다')
+
+        users = (
+            get_user_model().objects
+            .filter(is_active=True, birth_date__isnull=False)
+            .order_by('pk')
+            .only(*PREWARM_USER_FIELDS)
+        )
+        if options['limit']:
+            users = users[:options['limit']]
+
+        calculator = FortuneCalculator()
+        transport = self._transport(options)
+        batch_id = options['batch_id']
+        saver = _ChunkSaver(calculator, day, options)
+        pks_by_key = {}  # 운세 텍스트 캐시 키 -> 사용자 pk 목록 (결과 반영 시 저장 대상)
+        pending = set()  # 이번 Batch 로 요청할 키
+        input_path = Path(options['local_dir']) / f'fortune_texts_{day.isoformat()}.jsonl'
+        input_path.parent.mkdir(parents=True, exist_ok=True)
+
+        total = 0
+        stream = users.iterator(chunk_size=options['chunk_size'])
+        with nullcontext() if batch_id else open(input_path, 'w', encoding='utf-8') as batch_file:
+            while True:
+                chunk = list(islice(stream, options['chunk_size']))
+                if not chunk:
+                    break
+                total += len(chunk)
+                keys, prompts = llm_batch.plan_fortune_texts(calculator, [prewarm_profile(user) for user in chunk], day)
+                new_keys = [key for key in prompts if key not in pks_by_key]
+                for user, key in zip(chunk, keys):
+                    pks_by_key.setdefault(key, []).append(user.pk)
+                if batch_id:
+                    continue
+
+                uncached = llm_batch.uncached_keys(new_keys)
+                llm_batch.write_batch_lines(batch_file, {key: prompts[key] for key in uncached})
+                pending.update(uncached)
+                # 이미 텍스트가 캐시된 키의 사용자는 바로 저장
+                saver.add([user.pk for user, key in zip(chunk, keys) if key not in pending])
+        saver.flush()
+        self.stdout.write(f'{day} 대상 {total}명, 운세 텍스트 키 {len(pks_by_key)}개 (중복 제거)')
+
+        if not batch_id:
+            if not pending:
+                input_path.unlink()
+                self.stdout.write(self.style.SUCCESS(f'모든 키가 캐시됨 - 제출 생략 (저장 {saver.saved}건)'))
+                return
+
+            batch_id = transport.submit(input_path)
+            self._save_manifest(options['local_dir'], batch_id, day, len(pending))
+            self.stdout.write(f'Batch 제출: {batch_id} ({len(pending)}건, 캐시 적중 {len(pks_by_key) - len(pending)}건)')
+
+        status = llm_batch.wait_for_batch(transport, batch_id, options['poll_interval'], options['timeout'])
+        if status != 'completed':
+            if status in llm_batch.DONE_STATUSES:
+                raise CommandError(f'Batch {batch_id} 상태: {status}')
+            self.stdout.write(f'Batch {batch_id} 진행 중 ({status}) - 완료 후 --batch-id {batch_id} 로 다시 실행')
+            return
+
+        unmatched = []
+
+        def on_stored(key):
+            if key in pks_by_key:
+                saver.add(pks_by_key[key])
+            else:
+                unmatched.append(key)
+
+        stored, failed = llm_batch.apply_batch_results(transport.results(batch_id), on_stored=on_stored)
+        saver.flush()
+        if unmatched and len(unmatched) == stored:
+            raise CommandError(
+                f'Batch {batch_id} 결과 {stored}건 중 {day} 대상 사용자와 맞는 키가 없습니다 (운세 날짜 확인, 예: {unmatched[0]})'
+            )
+        self.stdout.write(self.style.SUCCESS(
+            f'Batch {batch_id} 반영: 텍스트 {stored}건 저장 (대상 밖 {len(unmatched)}건), 실패 {failed}건, '
+            f'운세 {saver.saved}건 저장 ({saver.skipped}건 건너뜀)'
+        ))
+
+    @staticmethod
+    def _manifest_path(local_dir, batch_id):
+        return Path(local_dir) / f'{batch_id}.manifest.json'
+
+    def _save_manifest(self, local_dir, batch_id, day, count):
+        self._manifest_path(local_dir, batch_id).write_text(
+            json.dumps({'batch_id': batch_id, 'date': day.isoformat(), 'requests': count})
+        )
+
+    def _load_manifest_day(self, local_dir, batch_id):
+        try:
+            data = json.loads(self._manifest_path(local_dir, batch_id).read_text())
+            return datetime.strptime(data['date'], '%Y-%m-%d').date()
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _transport(self, options):
+        if options['transport'] == 'local':
+            return llm_batch.LocalBatchTransport(options['local_dir'])
+        api_key = getattr(settings, 'OPENAI_API_KEY', '')
+        if not api_key:
+            raise CommandError('OPENAI_API_KEY 가 설정되지 않았습니다')
+        return llm_batch.OpenAIBatchTransport(api_key, getattr(settings, 'OPENAI_BASE_URL', '') or None)
+
+
+class _ChunkSaver:
+    """텍스트가 캐시된 사용자 pk 를 모아 청크 단위로 다시 읽어서 계산/저장"""
+
+    def __init__(self, calculator, day, options):
+        self.calculator = calculator
+        self.day = day
+        self.chunk_size = options['chunk_size']
+        self.overwrite = options['overwrite']
+        self.pending = []
+        self.saved = self.skipped = 0
+
+    def add(self, pks):
+        self.pending.extend(pks)
+        if len(self.pending) >= self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        while self.pending:
+            chunk, self.pending = self.pending[:self.chunk_size], self.pending[self.chunk_size:]
+            users = list(
+                get_user_model().objects.filter(pk__in=chunk).order_by('pk').only(*PREWARM_USER_FIELDS)
+            )
+            saved, skipped = prewarm_user_fortunes(
+                self.calculator, users, self.day, overwrite=self.overwrite, use_llm=True, llm_concurrency=1
+            )
+            self.saved += saved
+            self.skipped += skipped
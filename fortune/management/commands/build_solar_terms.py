@@ -0,0 +1,67 @@
+"""
+24절기 바이너리 테이블 생성
+- astronomy-engine (pip install astronomy-engine) 필요 - 런타임 의존성 아님
+- 태양 황경 285도(소한)부터 15도 간격으로 24절기 절입 시각 계산
+"""
+from array import array
+from datetime import datetime, timedelta
+from pathlib import Path
+import struct
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+# fortune/solar_terms.py 의 포맷과 동일해야 함
+HEADER_FORMAT = '<4sHH'
+HEADER_MAGIC = b'STRM'
+EPOCH = datetime(1899, 1, 1)
+KST_OFFSET = timedelta(hours=9)
+DEFAULT_OUTPUT = Path(__file__).resolve().parents[2] / 'data' / 'solar_terms.bin'
+
+
+class Command(BaseCommand):
+    help = '24절기 절입 시각 테이블(fortune/data/solar_terms.bin) 생성'
+    # URL 체크 시 solar_terms 모듈이 로드되므로 테이블이 없어도 실행 가능하도록 체크 생략
+    requires_system_checks = []
+
+    def add_arguments(self, parser):
+        parser.add_argument('--start-year', type=int, default=1899)
+        parser.add_argument('--end-year', type=int, default=2101)
+        parser.add_argument('--output', default=str(DEFAULT_OUTPUT))
+
+    def handle(self, *args, **options):
+        try:
+            import astronomy
+        except ImportError:
+            raise CommandError('astronomy-engine 패키지가 필요합니다: pip install astronomy-engine')
+
+        start_year = options['start_year']
+        end_year = options['end_year']
+        minutes = array('i')
+
+        for year in range(start_year, end_year + 1):
+            # 소한은 1월 초 -> 전년도 12월 말부터 탐색
+            search_from = astronomy.Time.Make(year - 1, 12, 25, 0, 0, 0)
+            for term_idx in range(24):
+                longitude = (285 + term_idx * 15) % 360
+                found = astronomy.SearchSunLongitude(longitude, search_from, 40)
+                if found is None:
+                    raise CommandError(f'{year}년 {term_idx}번째 절기 계산 실패')
+
+                kst = found.Utc().replace(tzinfo=None) + KST_OFFSET
+                minutes.append(round((kst - EPOCH).total_seconds() / 60))
+                search_from = found.AddDays(10)
+
+        if sys.byteorder == 'big':
+            minutes.byteswap()
+
+        output = Path(options['output'])
+        output.parent.mkdir(parents=True, exist_ok=True)
+        num_years = end_year - start_year + 1
+        with open(output, 'wb') as f:
+            f.write(struct.pack(HEADER_FORMAT, HEADER_MAGIC, start_year, num_years))
+            f.write(minutes.tobytes())
+
+        self.stdout.write(self.style.SUCCESS(
+            f'절기 테이블 생성 완료: {output} ({start_year}~{end_year}, {len(minutes)}개)'
+        ))
@@ -0,0 +1,114 @@
+"""
+운세 사전 생성 (야간 배치)
+- 생년월일이 있는 활성 사용자를 pk 순으로 청크 단위 스트리밍 (iterator)
+- 청크별로 calculate_fortunes_bulk 계산 후 DailyFortuneCache bulk_create (fortune.api_views.prewarm_user_fortunes)
+- 청크 완료 시마다 체크포인트(마지막 pk) 저장 -> 중단 후 재실행하면 이어서 진행
+
+예) python manage.py prewarm_fortunes --llm --llm-concurrency 8
+"""
+from datetime import date, datetime
+from itertools import islice
+from pathlib import Path
+import json
+import os
+import time
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from fortune.api_views import PREWARM_USER_FIELDS, prewarm_user_fortunes
+from fortune.services import FortuneCalculator
+
+DEFAULT_CHECKPOINT = Path(settings.BASE_DIR) / '.prewarm_fortunes_checkpoint.json'
+
+
+class Command(BaseCommand):
+    help = '전체 사용자의 오늘 운세를 미리 계산해 DailyFortuneCache에 저장'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--date', help='운세 날짜 (YYYY-MM-DD, 기본값: 오늘)')
+        parser.add_argument('--chunk-size', type=int, default=500, help='한 번에 계산/저장할 사용자 수')
+        parser.add_argument('--llm', action='store_true', help='LLM으로 운세 텍스트 생성 (기본: 기본 텍스트 로직)')
+        parser.add_argument('--llm-concurrency', type=int, default=4, help='동시에 진행할 LLM 호출 수')
+        parser.add_argument('--checkpoint', default=str(DEFAULT_CHECKPOINT), help='체크포인트 파일 경로')
+        parser.add_argument('--restart', action='store_true', help='체크포인트를 무시하고 처음부터 실행')
+        parser.add_argument('--limit', type=int, help='최대 처리 사용자 수 (테스트용)')
+        parser.add_argument('--overwrite', action='store_true', help='이미 있는 오늘 운세도 다시 계산해서 갱신')
+
+    def handle(self, *args, **options):
+        try:
+            day = datetime.strptime(options['date'], '%Y-%m-%d').date() if options['date'] else date.today()
+        except ValueError:
+            raise CommandError('--date 는 YYYY-MM-DD 형식이어야 합니다')
+
+        chunk_size = options['chunk_size']
+        if chunk_size < 1 or options['llm_concurrency'] < 1:
+            raise CommandError('--chunk-size, --llm-concurrency 는 1 이상이어야 합니다')
+
+        checkpoint_path = Path(options['checkpoint'])
+        last_pk = 0 if options['restart'] else self._load_checkpoint(checkpoint_path, day)
+        if last_pk:
+            self.stdout.write(f'체크포인트에서 재개: pk > {last_pk}')
+
+        users = (
+            get_user_model().objects
+            .filter(is_active=True, birth_date__isnull=False, pk__gt=last_pk)
+            .order_by('pk')
+            .only(*PREWARM_USER_FIELDS)
+        )
+        total = users.count()
+        if options['limit']:
+            total = min(total, options['limit'])
+            users = users[:options['limit']]
+
+        self.stdout.write(f'{day} 운세 사전 생성 시작: 대상 {total}명 (LLM: {"사용" if options["llm"] else "미사용"})')
+
+        calculator = FortuneCalculator()
+        stream = users.iterator(chunk_size=chunk_size)
+        processed = created = skipped = 0
+        started = time.monotonic()
+
+        while True:
+            chunk = list(islice(stream, chunk_size))
+            if not chunk:
+                break
+
+            chunk_created, chunk_skipped = prewarm_user_fortunes(
+                calculator, chunk, day, overwrite=options['overwrite'],
+                use_llm=options['llm'], llm_concurrency=options['llm_concurrency'],
+            )
+            processed += len(chunk)
+            created += chunk_created
+            skipped += chunk_skipped
+            self._save_checkpoint(checkpoint_path, day, chunk[-1].pk)
+
+            elapsed = time.monotonic() - started
+            rate = processed / elapsed if elapsed else 0.0
+            remaining = (total - processed) / rate if rate else 0.0
+            self.stdout.write(
+                f'  {processed}/{total} ({processed / total * 100:.1f}%) '
+                f'생성 {created}, 건너뜀 {skipped} | {rate:.1f}명/s, 남은 시간 약 {remaining:.0f}s'
+            )
+
+        elapsed = time.monotonic() - started
+        self.stdout.write(self.style.SUCCESS(
+            f'완료: {processed}명 처리, {created}건 생성, {skipped}건 건너뜀 '
+            f'({elapsed:.1f}s, {processed / elapsed if elapsed else 0:.1f}명/s)'
+        ))
+
+    def _load_checkpoint(self, path, day):
+        """같은 날짜의 체크포인트가 있으면 마지막 처리 pk 반환"""
+        try:
+            data = json.loads(path.read_text())
+        except (OSError, ValueError):
+            return 0
+        if data.get('date') != day.isoformat():
+            return 0
+        return int(data.get('last_pk', 0))
+
+    def _save_checkpoint(self, path, day, last_pk):
+        """체크포인트 저장 (임시 파일에 쓴 뒤 교체해서 중간에 끊겨도 파일이 깨지지 않도록)"""
+        tmp_path = path.with_name(path.name + '.tmp')
+        tmp_path.write_text(json.dumps({'date': day.isoformat(), 'last_pk': last_pk}))
+        os.replace(tmp_path, path)
@@ -0,0 +1,23 @@
+# JSONField 전환 1/3: 새 JSON 컬럼 추가 (기존 텍스트 컬럼은 0007 에서 제거)
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('fortune', '0004_dailyfortunecache_birth_date_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='dailyfortunecache',
+            name='full_fortune_data_json',
+            field=models.JSONField(blank=True, default=dict, verbose_name='전체 운세 데이터 (JSON)'),
+        ),
+        migrations.AddField(
+            model_name='dailyfortunecache',
+            name='saju_data_json',
+            field=models.JSONField(blank=True, default=dict, verbose_name='사주 데이터 (JSON)'),
+        ),
+    ]
@@ -0,0 +1,65 @@
+# JSONField 전환 2/3: 텍스트 JSON 을 새 컬럼으로 복사 (pk 순 청크 단위, 전체 테이블을 메모리에 올리지 않음)
+
+import json
+
+from django.db import migrations
+
+CHUNK_SIZE = 1000
+
+
+def _loads(text):
+    try:
+        return json.loads(text) if text else {}
+    except ValueError:
+        return {}
+
+
+def copy_to_json(apps, schema_editor):
+    DailyFortuneCache = apps.get_model('fortune', 'DailyFortuneCache')
+    last_pk = 0
+    while True:
+        rows = list(
+            DailyFortuneCache.objects
+            .filter(pk__gt=last_pk)
+            .order_by('pk')
+            .only('pk', 'full_fortune_data', 'saju_data')[:CHUNK_SIZE]
+        )
+        if not rows:
+            break
+        for row in rows:
+            row.full_fortune_data_json = _loads(row.full_fortune_data)
+            row.saju_data_json = _loads(row.saju_data)
+        DailyFortuneCache.objects.bulk_update(rows, ['full_fortune_data_json', 'saju_data_json'])
+        last_pk = rows[-1].pk
+
+
+def copy_to_text(apps, schema_editor):
+    DailyFortuneCache = apps.get_model('fortune', 'DailyFortuneCache')
+    last_pk = 0
+    while True:
+        rows = list(
+            DailyFortuneCache.objects
+            .filter(pk__gt=last_pk)
+            .order_by('pk')
+            .only('pk', 'full_fortune_data_json', 'saju_data_json')[:CHUNK_SIZE]
+        )
+        if not rows:
+            break
+        for row in rows:
+            row.full_fortune_data = json.dumps(row.full_fortune_data_json or {}, ensure_ascii=False)
+            row.saju_data = json.dumps(row.saju_data_json or {}, ensure_ascii=False)
+        DailyFortuneCache.objects.bulk_update(rows, ['full_fortune_data', 'saju_data'])
+        last_pk = rows[-1].pk
+
+
+class Migration(migrations.Migration):
+    # 청크마다 커밋 (대용량 테이블에서 트랜잭션 하나가 길어지지 않도록)
+    atomic = False
+
+    dependencies = [
+        ('fortune', '0005_dailyfortunecache_json_payload'),
+    ]
+
+    operations = [
+        migrations.RunPython(copy_to_json, copy_to_text),
+    ]
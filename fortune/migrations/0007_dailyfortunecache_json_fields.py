@@ -0,0 +1,31 @@
+# JSONField 전환 3/3: 기존 텍스트 컬럼 제거 후 새 컬럼을 원래 이름으로 변경
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('fortune', '0006_copy_fortune_json'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='dailyfortunecache',
+            name='full_fortune_data',
+        ),
+        migrations.RemoveField(
+            model_name='dailyfortunecache',
+            name='saju_data',
+        ),
+        migrations.RenameField(
+            model_name='dailyfortunecache',
+            old_name='full_fortune_data_json',
+            new_name='full_fortune_data',
+        ),
+        migrations.RenameField(
+            model_name='dailyfortunecache',
+            old_name='saju_data_json',
+            new_name='saju_data',
+        ),
+    ]
@@ -94,17 +94,17 @@ class DailyFortuneCache(models.Model):
     )
     
     # 사주 정보 (JSON)
-    saju_data = models.TextField(
+    saju_data = models.JSONField(
         verbose_name='사주 데이터 (JSON)',
         blank=True,
-        default='{}'
+        default=dict
     )
 
     # 전체 운세 데이터 (JSON) - 모든 필드를 통째로 저장
-    full_fortune_data = models.TextField(
+    full_fortune_data = models.JSONField(
         verbose_name='전체 운세 데이터 (JSON)',
         blank=True,
-        default='{}'
+        default=dict
     )
 
     created_at = models.DateTimeField(auto_now_add=True)
@@ -5,8 +5,32 @@
 - 지장간(숨은 천간) 포함 계산
 """
 from datetime import date, datetime, timedelta
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 import math
+from .solar_terms import IPCHUN_TERM_INDEX, lookup_solar_month, solar_term_date
+
+# 사주 결과 캐시 크기 (settings.SAJU_CACHE_SIZE 로 조정)
+DEFAULT_SAJU_CACHE_SIZE = 20000
+
+
+def _saju_cache_size() -> int:
+    try:
+        from django.conf import settings
+        return int(getattr(settings, 'SAJU_CACHE_SIZE', DEFAULT_SAJU_CACHE_SIZE))
+    except Exception:
+        # Django 설정 없이 단독 실행하는 경우
+        return DEFAULT_SAJU_CACHE_SIZE
+
+
+def _copy_result(result: Dict) -> Dict:
+    """캐시된 결과의 사본 (호출자가 수정해도 캐시가 오염되지 않도록 중첩 dict까지 복사)"""
+    copied = dict(result)
+    copied['saju'] = {name: dict(pillar) for name, pillar in result['saju'].items()}
+    copied['ohaeng_scores'] = dict(result['ohaeng_scores'])
+    copied['ilju_strength'] = dict(result['ilju_strength'])
+    return copied
+
 
 class SajuCalculator:
     """정확한 사주팔자 및 오행 계산 클래스"""
@@ -103,8 +127,8 @@ class SajuCalculator:
     BASE_DATE = date(1900, 1, 31)
     BASE_DAY_GANZI = (0, 4)  # 갑(0), 진(4)
     
-    # 절기 데이터 (년도별 절기 시작일) - 일부 샘플, 실제로는 더 많은 데이터 필요
-    # 형식: {년도: [(월, 일, 시, 분), ...]} - 24절기 순서대로
+    # 절기 데이터: solar_terms.py (1899~2101년 24절기 절입 시각 테이블)
+    # 테이블 범위 밖의 날짜만 아래 근사 계산 사용
     
     def __init__(self):
         pass
@@ -126,6 +150,28 @@ class SajuCalculator:
         Returns:
             사주팔자 정보 딕셔너리
         """
+        # 사주는 (생년월일, 시지)만으로 결정되므로 결과를 캐시에서 조회
+        hour_ji_idx = self._get_hour_branch_index(birth_time.hour) if birth_time else None
+        return _copy_result(_cached_saju(birth_date.toordinal(), hour_ji_idx))
+
+    @staticmethod
+    def cache_info():
+        """사주 결과 캐시 적중/미스 통계 (functools.lru_cache 의 CacheInfo)"""
+        return _cached_saju.cache_info()
+
+    @staticmethod
+    def cache_clear():
+        """사주 결과 캐시 비우기"""
+        _cached_saju.cache_clear()
+
+    def _build_saju(self, birth_date: date, hour_ji_idx: Optional[int]) -> Dict:
+        """
+        사주팔자 계산 (캐시 미스 시 호출)
+
+        Args:
+            birth_date: 생년월일
+            hour_ji_idx: 시지 인덱스 (0=자 ~ 11=해, 없으면 None)
+        """
         # 년주 계산
         year_gan, year_ji = self._calculate_year_pillar(birth_date)
         
@@ -136,8 +182,8 @@ class SajuCalculator:
         day_gan, day_ji = self._calculate_day_pillar(birth_date)
         
         # 시주 계산
-        if birth_time:
-            hour_gan, hour_ji = self._calculate_hour_pillar(birth_time, day_gan, use_jaси_split)
+        if hour_ji_idx is not None:
+            hour_gan, hour_ji = self._hour_pillar_from_branch(hour_ji_idx, day_gan)
         else:
             hour_gan, hour_ji = None, None
         
@@ -173,19 +219,19 @@ class SajuCalculator:
             'hour_hanja': f"{self.CHEONGAN_HANJA[self.CHEONGAN.index(hour_gan)]}{self.JIJI_HANJA[self.JIJI.index(hour_ji)]}" if hour_gan else "미상"
         }
     
+    
     def _calculate_year_pillar(self, birth_date: date) -> Tuple[str, str]:
         """
         년주 계산 (입춘 기준)
         - 입춘 전이면 전년도로 계산
         """
-        year = birth_date.year
-        
-        # 입춘 날짜 계산 (대략 2월 4일)
-        # 더 정확한 계산을 위해서는 절기 데이터베이스 필요
-        ipchun = self._get_ipchun_date(year)
-        
-        if birth_date < ipchun:
-            year -= 1
+        solar = lookup_solar_month(birth_date)
+        if solar:
+            year = solar[0]
+        else:
+            year = birth_date.year
+            if birth_date < self._get_ipchun_date(year):
+                year -= 1
         
         # 년간 계산: (년도 - 4) % 10
         year_gan_idx = (year - 4) % 10
@@ -196,8 +242,16 @@ class SajuCalculator:
     
     def _get_ipchun_date(self, year: int) -> date:
         """
-        입춘 날짜 계산 (근사값)
-        실제로는 천문 계산이나 데이터베이스 필요
+        입춘 날짜 (절기 테이블 기준, 범위 밖이면 근사값)
+        """
+        ipchun = solar_term_date(year, IPCHUN_TERM_INDEX)
+        if ipchun:
+            return ipchun
+        return self._approximate_ipchun_date(year)
+    
+    def _approximate_ipchun_date(self, year: int) -> date:
+        """
+        입춘 날짜 계산 (근사값) - 절기 테이블 범위 밖에서만 사용
         """
         # 입춘은 대략 2월 3~5일 사이
         # 더 정확한 계산을 위한 근사 공식
@@ -248,6 +302,15 @@ class SajuCalculator:
         - 2월: 경칩 ~ 청명 전
         - ...
         """
+        solar = lookup_solar_month(birth_date)
+        if solar:
+            return solar[1]
+        return self._approximate_solar_month(birth_date)
+    
+    def _approximate_solar_month(self, birth_date: date) -> int:
+        """
+        절기 기준 월 계산 (근사값) - 절기 테이블 범위 밖에서만 사용
+        """
         year = birth_date.year
         month = birth_date.month
         day = birth_date.day
@@ -320,15 +383,21 @@ class SajuCalculator:
         """
         시주 계산
         """
-        hour = birth_time.hour
-        
-        # 시지 결정 (2시간 단위)
-        # 자시: 23:00-01:00, 축시: 01:00-03:00, ...
+        hour_ji_idx = self._get_hour_branch_index(birth_time.hour)
+        return self._hour_pillar_from_branch(hour_ji_idx, day_gan)
+    
+    @staticmethod
+    def _get_hour_branch_index(hour: int) -> int:
+        """
+        시지 인덱스 결정 (2시간 단위)
+        자시: 23:00-01:00, 축시: 01:00-03:00, ...
+        """
         if hour == 23 or hour == 0:
-            hour_ji_idx = 0  # 자
-        else:
-            hour_ji_idx = ((hour + 1) // 2) % 12
-        
+            return 0  # 자
+        return ((hour + 1) // 2) % 12
+    
+    def _hour_pillar_from_branch(self, hour_ji_idx: int, day_gan: str) -> Tuple[str, str]:
+        """시지 인덱스와 일간으로 시주 계산"""
         hour_ji = self.JIJI[hour_ji_idx]
         
         # 시간 (일상기시법)
@@ -443,6 +512,15 @@ class SajuCalculator:
         return result['day_ohaeng']
 
 
+@lru_cache(maxsize=_saju_cache_size())
+def _cached_saju(birth_ordinal: int, hour_ji_idx: Optional[int]) -> Dict:
+    """(생년월일 서수, 시지 인덱스) -> 사주 결과. 반환값은 직접 수정하지 말 것 (_copy_result 사용)"""
+    return _CALCULATOR._build_saju(date.fromordinal(birth_ordinal), hour_ji_idx)
+
+
+_CALCULATOR = SajuCalculator()
+
+
 # 테스트
 if __name__ == "__main__":
     calc = SajuCalculator()
@@ -24,10 +24,7 @@ class FortuneSerializer(serializers.ModelSerializer):
             return []
     
     def get_saju_data(self, obj):
-        try:
-            return json.loads(obj.saju_data) if obj.saju_data else {}
-        except:
-            return {}
+        return obj.saju_data or {}
 
 
 class FortuneCalculateSerializer(serializers.Serializer):
@@ -1,15 +1,31 @@
 """
 운세 계산 핵심 로직
 """
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
 import random
 import hashlib
-import json
-from typing import Dict, List, Optional
+import logging
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+import copy
 from django.core.cache import cache
 from django.conf import settings
 from .saju_calculator import SajuCalculator
 from .lunar_converter import lunar_to_solar
+from .singleflight import SingleFlight
+from core import llm
+from core.timing import stage
+
+try:
+    import numpy as np
+except ImportError:  # numpy 없으면 일괄 계산도 사용자별 순차 계산으로 처리
+    np = None
+
+logger = logging.getLogger(__name__)
+
+# LLM 운세 텍스트 요청 병합기 (같은 캐시 키의 동시 요청은 한 번만 호출)
+_fortune_text_flight = SingleFlight('fortune_text', lease_timeout=getattr(settings, 'LLM_SINGLEFLIGHT_LEASE', 90))
+
 
 class FortuneCalculator:
     """운세 계산 클래스"""
@@ -88,6 +104,9 @@ class FortuneCalculator:
         '분홍색', '흰색', '검은색', '회색', '은색',
         '금색', '갈색', '베이지색', '진한 빨간색'
     ]
+
+    # 운세 점수 키 (총운 + 5개 운)
+    SCORE_KEYS = ('total', 'money', 'love', 'study', 'work', 'health')
     
     # def __init__(self):
     #     self.cache_ttl = getattr(settings, 'CACHE_TTL', 86400)  # 24시간
@@ -104,35 +123,116 @@ class FortuneCalculator:
         mbti: Optional[str] = None,  # MBTI 추가
         calendar_type: str = 'solar',  # 양력/음력 구분 (기본값: 양력)
         user_id: Optional[int] = None,  # 로그인 사용자 ID (로또 번호용)
-        session_key: Optional[str] = None  # 세션 키 (비로그인 사용자 로또 번호용)
+        session_key: Optional[str] = None,  # 세션 키 (비로그인 사용자 로또 번호용)
+        today: Optional[date] = None  # 운세 날짜 (기본값: 오늘)
     ) -> Dict:
         """
         운세 계산 메인 함수
         """
         # 음력인 경우 양력으로 변환
-        original_birth_date = birth_date  # 원본 음력 날짜 보관 (띠 계산용)
-        if calendar_type == 'lunar':
-            solar_date = lunar_to_solar(birth_date)
-            if solar_date:
-                birth_date = solar_date  # 양력으로 변환된 날짜 사용
-                print(f"[DEBUG] 음력 {original_birth_date} -> 양력 {birth_date} 변환")
-            else:
-                print(f"[WARNING] 음력 변환 실패, 원본 날짜 사용")
+        with stage('lunar'):
+            birth_date, original_birth_date = self._to_solar_birth_date(birth_date, calendar_type)
 
         # 오늘 날짜
-        today = date.today()
+        today = today or date.today()
 
         # 고유 시드 생성 (날짜 + 생년월일로 매일 같은 운세 보장)
-        seed_string = f"{today.isoformat()}-{birth_date.isoformat()}-{gender}"
-        seed = int(hashlib.md5(seed_string.encode()).hexdigest(), 16)
-        random.seed(seed)
+        # 전역 random.seed()는 스레드 간에 경쟁하므로 호출마다 독립된 난수 생성기 사용
+        rng = self._seeded_rng(f"{today.isoformat()}-{birth_date.isoformat()}-{gender}")
 
         # 사주 데이터 계산 (운세 점수 계산에 필요하므로 먼저 계산)
-        saju_data = self._calculate_saju(birth_date, birth_time)
+        with stage('saju'):
+            saju_data = self._calculate_saju(birth_date, birth_time)
 
         # 각 운별 점수 계산 (사주 오행 데이터 반영)
-        fortune_scores = self._calculate_all_fortunes(birth_date, today, saju_data)
-        
+        with stage('scores'):
+            fortune_scores = self._calculate_all_fortunes(birth_date, today, saju_data, rng)
+
+        return self._build_fortune(
+            birth_date, original_birth_date, gender, calendar_type, today,
+            saju_data, fortune_scores, mbti, user_id, session_key
+        )
+
+    def calculate_fortunes_bulk(
+        self,
+        profiles: Iterable[Dict],
+        day: Optional[date] = None,
+        use_llm: bool = False,
+        llm_concurrency: int = 1
+    ) -> List[Dict]:
+        """
+        여러 사용자의 운세를 한 번에 계산 (야간 사전 생성용)
+
+        Args:
+            profiles: calculate_fortune 인자와 같은 키를 가진 dict 목록
+                      (birth_date, gender 필수 / birth_time, chinese_name, mbti, calendar_type, user_id, session_key 선택)
+            day: 운세 날짜 (기본값: 오늘)
+            use_llm: True면 사용자별로 LLM 텍스트 생성, False면 기본 텍스트 생성 로직만 사용
+            llm_concurrency: use_llm일 때 동시에 진행할 LLM 호출 수 (스레드 수)
+
+        Returns:
+            profiles 순서대로 calculate_fortune과 동일한 결과 dict 목록
+        """
+        today = day or date.today()
+        profiles = list(profiles)
+
+        prepared = []
+        for profile in profiles:
+            calendar_type = profile.get('calendar_type') or 'solar'
+            birth_date, original_birth_date = self._to_solar_birth_date(profile['birth_date'], calendar_type)
+            gender = profile['gender']
+            rng = self._seeded_rng(f"{today.isoformat()}-{birth_date.isoformat()}-{gender}")
+            saju_data = self._calculate_saju(birth_date, profile.get('birth_time'))
+            prepared.append((profile, birth_date, original_birth_date, calendar_type, rng, saju_data))
+
+        # 점수 계산 (난수는 사용자별 rng에서 단일 경로와 같은 순서로 추출)
+        all_scores = self._calculate_all_fortunes_bulk([(item[4], item[5]) for item in prepared])
+
+        # 같은 조건(별자리/띠/점수)의 색상/아이템/텍스트 결과 재사용
+        memo = {}
+
+        def build(args):
+            (profile, birth_date, original_birth_date, calendar_type, _, saju_data), fortune_scores = args
+            return self._build_fortune(
+                birth_date, original_birth_date, profile['gender'], calendar_type, today,
+                saju_data, fortune_scores, profile.get('mbti'), profile.get('user_id'), profile.get('session_key'),
+                use_llm=use_llm, memo=memo
+            )
+
+        if use_llm and llm_concurrency > 1:
+            # LLM 호출은 I/O 대기이므로 스레드로 동시 진행 (최대 llm_concurrency개)
+            with ThreadPoolExecutor(max_workers=llm_concurrency) as executor:
+                return list(executor.map(build, zip(prepared, all_scores)))
+        return [build(args) for args in zip(prepared, all_scores)]
+
+    def _to_solar_birth_date(self, birth_date: date, calendar_type: str):
+        """음력 생일이면 양력으로 변환 -> (양력 날짜, 원본 날짜)"""
+        original_birth_date = birth_date  # 원본 음력 날짜 보관 (띠 계산용)
+        if calendar_type == 'lunar':
+            solar_date = lunar_to_solar(birth_date)
+            if solar_date:
+                birth_date = solar_date  # 양력으로 변환된 날짜 사용
+                logger.debug("음력 %s -> 양력 %s 변환", original_birth_date, birth_date)
+            else:
+                logger.warning("음력 변환 실패, 원본 날짜 사용: %s", original_birth_date)
+        return birth_date, original_birth_date
+
+    def _build_fortune(
+        self,
+        birth_date: date,
+        original_birth_date: date,
+        gender: str,
+        calendar_type: str,
+        today: date,
+        saju_data: Dict,
+        fortune_scores: Dict,
+        mbti: Optional[str] = None,
+        user_id: Optional[int] = None,
+        session_key: Optional[str] = None,
+        use_llm: bool = True,
+        memo: Optional[Dict] = None
+    ) -> Dict:
+        """점수 계산 이후 단계 (별자리/띠/행운 색상/로또/아이템/텍스트) - 단일/일괄 계산 공용"""
         # 별자리 계산 (양력 날짜로)
         zodiac_sign = self._get_zodiac_sign(birth_date)
 
@@ -147,27 +247,30 @@ class FortuneCalculator:
             chinese_zodiac = self._get_chinese_zodiac(birth_date)
         
         # 행운의 색상들 결정 (별자리 + 띠 + 날짜 + 운세점수 기반)
-        lucky_colors = self._determine_lucky_colors(
-            zodiac_sign, chinese_zodiac, today, fortune_scores
-        )
+        with stage('colors'):
+            lucky_colors = self._memoized(
+                memo, ('colors', zodiac_sign, chinese_zodiac, fortune_scores['total']),
+                lambda: self._determine_lucky_colors(zodiac_sign, chinese_zodiac, today, fortune_scores)
+            )
 
         # 로또 번호 6개 생성 (user_id 또는 session_key 기반으로 사용자별 다른 번호)
-        lotto_numbers = self._generate_lucky_lotto_numbers(
-            birth_date, today, fortune_scores, gender, user_id, session_key
-        )
+        with stage('lotto'):
+            lotto_numbers = self._generate_lucky_lotto_numbers(
+                birth_date, today, fortune_scores, gender, user_id, session_key
+            )
         
         # 행운의 아이템 (user_id 기반으로 사용자별 일관된 아이템, 가장 낮은 운 보완 기반)
-        lucky_item = self._determine_lucky_item(
-            zodiac_sign, today, user_id, session_key, lucky_colors,
-            fortune_score=fortune_scores['total'],
-            fortune_scores=fortune_scores
-        )
+        with stage('lucky_item'):
+            lucky_item = self._lucky_item_for_scores(zodiac_sign, today, user_id, session_key, lucky_colors, fortune_scores, memo)
 
         # 상세 운세 텍스트 생성 (LLM 시도 후 실패시 기존 로직)
-        fortune_texts = self._generate_fortune_text_with_llm(
-            birth_date, gender, saju_data, zodiac_sign, chinese_zodiac, fortune_scores, mbti,
-            lucky_item['main'], lucky_item['zodiac']
-        )
+        fortune_texts = None
+        if use_llm:
+            with stage('llm'):
+                fortune_texts = self._generate_fortune_text_with_llm(
+                    birth_date, gender, saju_data, zodiac_sign, chinese_zodiac, fortune_scores, mbti,
+                    lucky_item['main'], lucky_item['zodiac'], today=today
+                )
 
         if fortune_texts:
             # LLM이 점수도 함께 반환한 경우, 그 점수를 사용 (텍스트와 점수 일치)
@@ -181,21 +284,23 @@ class FortuneCalculator:
                     'work': llm_scores.get('work', fortune_scores['work']),
                     'health': llm_scores.get('health', fortune_scores['health'])
                 }
-                print(f"[DEBUG] LLM 점수 사용: {fortune_scores}")
+                logger.debug("LLM 점수 사용: %s", fortune_scores)
 
                 # LLM 점수 기반으로 lucky_item 재계산 (낮은 운세 2개가 바뀔 수 있음)
-                lucky_item = self._determine_lucky_item(
-                    zodiac_sign, today, user_id, session_key, lucky_colors,
-                    fortune_score=fortune_scores['total'],
-                    fortune_scores=fortune_scores
-                )
+                with stage('lucky_item_rescore'):
+                    lucky_item = self._lucky_item_for_scores(zodiac_sign, today, user_id, session_key, lucky_colors, fortune_scores, memo)
 
             # LLM lucky_item 설명 사용 안함 - 하드코딩된 설명 사용
             # LLM이 아이템 이름을 제대로 반영하지 않아서 비활성화
             pass
         else:
-            print("[DEBUG] LLM 생성 실패, 기존 로직 사용")
-            fortune_texts = self._generate_fortune_texts(fortune_scores, zodiac_sign, chinese_zodiac)
+            if use_llm:
+                logger.debug("LLM 생성 실패, 기존 로직 사용")
+            with stage('texts'):
+                fortune_texts = self._memoized(
+                    memo, ('texts', zodiac_sign) + tuple(self._score_band(fortune_scores[k]) for k in self.SCORE_KEYS),
+                    lambda: self._generate_fortune_texts(fortune_scores, zodiac_sign, chinese_zodiac, today=today)
+                )
         
         return {
             'fortune_score': fortune_scores['total'],
@@ -216,6 +321,32 @@ class FortuneCalculator:
             'mbti': mbti  # 결과에 MBTI 포함
         }
 
+    def _lucky_item_for_scores(self, zodiac_sign, today, user_id, session_key, lucky_colors, fortune_scores, memo=None) -> Dict:
+        """점수 기반 행운 아이템 (일괄 계산 시 같은 별자리/총점 구간/낮은 운 2개 조합은 재사용)"""
+        weakest = sorted(('money', 'love', 'study', 'work'), key=lambda k: fortune_scores.get(k, 70))[:2]
+        return self._memoized(
+            memo, ('item', zodiac_sign, self._score_band(fortune_scores['total'])) + tuple(weakest),
+            lambda: self._determine_lucky_item(
+                zodiac_sign, today, user_id, session_key, lucky_colors,
+                fortune_score=fortune_scores['total'],
+                fortune_scores=fortune_scores
+            )
+        )
+
+    @staticmethod
+    def _score_band(score: int) -> int:
+        """텍스트/아이템 선택에 쓰이는 점수 구간 (80 이상 / 60 이상 / 그 외)"""
+        return 2 if score >= 80 else 1 if score >= 60 else 0
+
+    @staticmethod
+    def _memoized(memo: Optional[Dict], key, compute):
+        """memo가 주어지면 key별로 결과를 재사용하고 사본을 반환 (호출자 간 공유 방지)"""
+        if memo is None:
+            return compute()
+        if key not in memo:
+            memo[key] = compute()
+        return copy.copy(memo[key])
+
     def _generate_fortune_text_with_llm(
         self,
         birth_date: date,
@@ -226,29 +357,95 @@ class FortuneCalculator:
         scores: Dict,
         mbti: Optional[str] = None,
         lucky_item_name: Optional[str] = None,
-        zodiac_item_name: Optional[str] = None
+        zodiac_item_name: Optional[str] = None,
+        today: Optional[date] = None
     ) -> Optional[Dict]:
         """GMS API (Claude/GPT) 또는 Gemini를 사용한 운세 텍스트 생성"""
-        import time
+        today = today or date.today()
 
         # 캐시 키 생성
-        cache_key = f"fortune_text_{birth_date}_{gender}_{zodiac}_{chinese_zodiac}_{mbti}_{lucky_item_name}_{date.today()}"
+        cache_key = self._fortune_text_cache_key(birth_date, gender, zodiac, chinese_zodiac, mbti, lucky_item_name, today)
         cached_result = cache.get(cache_key)
 
         if cached_result:
-            print("[DEBUG] 캐시된 운세 텍스트 사용")
             return cached_result
 
         # OpenAI API 사용
         openai_api_key = getattr(settings, 'OPENAI_API_KEY', '')
 
         if not openai_api_key:
-            print("[ERROR] OPENAI_API_KEY가 설정되지 않음")
+            logger.error("OPENAI_API_KEY가 설정되지 않음")
+            return None
+
+        prompt = self._build_fortune_text_prompt(
+            birth_date, gender, saju, zodiac, chinese_zodiac, mbti, lucky_item_name, zodiac_item_name, today
+        )
+
+        # 같은 캐시 키로 동시에 들어온 요청은 한 번만 호출 (나머지는 결과 대기, 시간 초과 시 기본 로직)
+        result = _fortune_text_flight.do(
+            cache_key,
+            lambda: self._request_fortune_text(prompt, cache_key, openai_api_key),
+            timeout=getattr(settings, 'LLM_SINGLEFLIGHT_TIMEOUT', 25)
+        )
+        if result is None:
+            logger.warning("OpenAI API 시도 실패, 동적 텍스트 생성으로 대체")
+        return result
+
+    async def agenerate_fortune_text_with_llm(
+        self,
+        birth_date: date,
+        gender: str,
+        saju: Dict,
+        zodiac: str,
+        chinese_zodiac: str,
+        scores: Dict,
+        mbti: Optional[str] = None,
+        lucky_item_name: Optional[str] = None,
+        zodiac_item_name: Optional[str] = None,
+        today: Optional[date] = None
+    ) -> Optional[Dict]:
+        """_generate_fortune_text_with_llm 의 비동기 버전 (ASGI 뷰용, 대기 중 이벤트 루프를 막지 않음)"""
+        today = today or date.today()
+
+        cache_key = self._fortune_text_cache_key(birth_date, gender, zodiac, chinese_zodiac, mbti, lucky_item_name, today)
+        cached_result = await cache.aget(cache_key)
+        if cached_result:
+            return cached_result
+
+        openai_api_key = getattr(settings, 'OPENAI_API_KEY', '')
+        if not openai_api_key:
+            logger.error("OPENAI_API_KEY가 설정되지 않음")
             return None
 
-        max_retries = 1
-        retry_delay = 2  # 재시도 간 딜레이 (초)
+        prompt = self._build_fortune_text_prompt(
+            birth_date, gender, saju, zodiac, chinese_zodiac, mbti, lucky_item_name, zodiac_item_name, today
+        )
+        result = await _fortune_text_flight.ado(
+            cache_key,
+            lambda: self._arequest_fortune_text(prompt, cache_key, openai_api_key),
+            timeout=getattr(settings, 'LLM_SINGLEFLIGHT_TIMEOUT', 25)
+        )
+        if result is None:
+            logger.warning("OpenAI API 시도 실패, 동적 텍스트 생성으로 대체")
+        return result
+
+    @staticmethod
+    def _fortune_text_cache_key(birth_date, gender, zodiac, chinese_zodiac, mbti, lucky_item_name, today) -> str:
+        return f"fortune_text_{birth_date}_{gender}_{zodiac}_{chinese_zodiac}_{mbti}_{lucky_item_name}_{today}"
 
+    def _build_fortune_text_prompt(
+        self,
+        birth_date: date,
+        gender: str,
+        saju: Dict,
+        zodiac: str,
+        chinese_zodiac: str,
+        mbti: Optional[str],
+        lucky_item_name: Optional[str],
+        zodiac_item_name: Optional[str],
+        today: date
+    ) -> str:
+        """운세 텍스트 생성 프롬프트"""
         mbti_info = f"- MBTI: {mbti}" if mbti else "- MBTI: 정보 없음"
         lucky_item_info = f"- 운세 기반 행운 아이템: {lucky_item_name}" if lucky_item_name else ""
         zodiac_item_info = f"- 별자리 행운 아이템: {zodiac_item_name}" if zodiac_item_name else ""
@@ -264,7 +461,7 @@ class FortuneCalculator:
 {mbti_info}
 {lucky_item_info}
 - 사주: {saju['year']}년 {saju['month']}월 {saju['day']}일 {saju['hour']}시 (간지)
-- 오늘 날짜: {date.today()}
+- 오늘 날짜: {today}
 
 [작성 가이드]
 1. **말투**: "~합니다", "~입니다" 체의 정중하고 부드러운 문체 (네이버 운세 스타일)
@@ -317,48 +514,58 @@ class FortuneCalculator:
     }}}}
 }}}}
 """
+        return prompt
 
-        # OpenAI API (gpt-4o-mini) 사용
-        for attempt in range(max_retries + 1):
-            try:
-                from openai import OpenAI
-                client = OpenAI(api_key=openai_api_key)
-
-                print(f"[DEBUG] OpenAI gpt-4o-mini 운세 생성 요청 (시도: {attempt + 1}/{max_retries + 1})...")
-                response = client.chat.completions.create(
-                    model="gpt-4o-mini",
-                    messages=[{"role": "user", "content": prompt}],
-                    max_tokens=4000
-                )
+    def _request_fortune_text(self, prompt: str, cache_key: str, openai_api_key: str, max_retries: int = 1) -> Optional[Dict]:
+        """OpenAI 운세 텍스트 요청 (공용 클라이언트 사용, 성공 시 결과를 cache_key로 캐싱)"""
+        try:
+            text = llm.chat_completion(
+                'fortune_text', openai_api_key, getattr(settings, 'OPENAI_BASE_URL', '') or None,
+                max_retries=max_retries, **self._fortune_text_params(prompt)
+            )
+            result = llm.parse_json_response(text)
+        except Exception as e:
+            logger.error("OpenAI 운세 텍스트 생성 오류: %s", e)
+            return None
 
-                text = response.choices[0].message.content.strip()
-                if text.startswith('```json'):
-                    text = text[7:]
-                if text.startswith('```'):
-                    text = text[3:]
-                if text.endswith('```'):
-                    text = text[:-3]
-
-                result = json.loads(text.strip())
-                print("[DEBUG] OpenAI gpt-4o-mini 운세 생성 성공!")
-
-                # 결과 캐싱 (24시간)
-                cache.set(cache_key, result, 60 * 60 * 24)
-                return result
-
-            except Exception as e:
-                print(f"[ERROR] OpenAI gpt-4o-mini 운세 생성 오류 (시도: {attempt + 1}): {e}")
-                if attempt < max_retries:
-                    time.sleep(retry_delay)
-                continue
-
-        # API 실패
-        print("[ERROR] OpenAI API 시도 실패, 동적 텍스트 생성으로 대체")
-        return None
-    
-    def _calculate_all_fortunes(self, birth_date: date, today: date, saju_data: Dict = None) -> Dict:
+        # 결과 캐싱 (24시간)
+        cache.set(cache_key, result, 60 * 60 * 24)
+        return result
+
+    async def _arequest_fortune_text(self, prompt: str, cache_key: str, openai_api_key: str, max_retries: int = 1) -> Optional[Dict]:
+        """_request_fortune_text 의 비동기 버전"""
+        try:
+            text = await llm.achat_completion(
+                'fortune_text', openai_api_key, getattr(settings, 'OPENAI_BASE_URL', '') or None,
+                max_retries=max_retries, **self._fortune_text_params(prompt)
+            )
+            result = llm.parse_json_response(text)
+        except Exception as e:
+            logger.error("OpenAI 운세 텍스트 생성 오류: %s", e)
+            return None
+
+        await cache.aset(cache_key, result, 60 * 60 * 24)
+        return result
+
+    @staticmethod
+    def _fortune_text_params(prompt: str) -> Dict:
+        """운세 텍스트 요청 파라미터 (OpenAI gpt-4o-mini)"""
+        return {
+            'model': "gpt-4o-mini",
+            'messages': [{"role": "user", "content": prompt}],
+            'max_tokens': 4000,
+        }
+
+    @staticmethod
+    def _seeded_rng(seed_string: str) -> random.Random:
+        """시드 문자열의 md5 값으로 초기화한 독립 난수 생성기 (프로세스/스레드와 무관하게 같은 결과)"""
+        return random.Random(int(hashlib.md5(seed_string.encode()).hexdigest(), 16))
+
+    def _calculate_all_fortunes(self, birth_date: date, today: date, saju_data: Dict = None, rng: random.Random = None) -> Dict:
         """각 운별 점수 계산 (사주 오행 기반, 최소 50점)"""
-        base = random.randint(55, 90)  # 55~90점 사이 (기본, 50점대도 가능)
+        if rng is None:
+            rng = self._seeded_rng(f"{today.isoformat()}-{birth_date.isoformat()}")
+        base = rng.randint(55, 90)  # 55~90점 사이 (기본, 50점대도 가능)
 
         # 사주 오행 데이터가 있으면 반영
         ohaeng_bonus = {'money': 0, 'love': 0, 'study': 0, 'work': 0}
@@ -410,11 +617,11 @@ class FortuneCalculator:
         # 오행 보너스 적용 (범위 제한: -15 ~ +15)
         ohaeng_bonus = {k: max(-15, min(15, v)) for k, v in ohaeng_bonus.items()}
 
-        money = max(50, min(100, base + random.randint(-10, 15) + ohaeng_bonus['money']))
-        love = max(50, min(100, base + random.randint(-15, 20) + ohaeng_bonus['love']))
-        study = max(50, min(100, base + random.randint(-10, 10) + ohaeng_bonus['study']))
-        work = max(50, min(100, base + random.randint(-10, 15) + ohaeng_bonus['work']))
-        health = max(50, min(100, base + random.randint(-10, 10)))
+        money = max(50, min(100, base + rng.randint(-10, 15) + ohaeng_bonus['money']))
+        love = max(50, min(100, base + rng.randint(-15, 20) + ohaeng_bonus['love']))
+        study = max(50, min(100, base + rng.randint(-10, 10) + ohaeng_bonus['study']))
+        work = max(50, min(100, base + rng.randint(-10, 15) + ohaeng_bonus['work']))
+        health = max(50, min(100, base + rng.randint(-10, 10)))
 
         # 총운은 5개 운세의 평균
         total = round((money + love + study + work + health) / 5)
@@ -428,24 +635,98 @@ class FortuneCalculator:
             'health': health,
         }
     
-    def _generate_fortune_texts(self, scores: Dict, zodiac_sign: str, chinese_zodiac: str) -> Dict:
+    def _calculate_all_fortunes_bulk(self, items: Sequence[Tuple[random.Random, Dict]]) -> List[Dict]:
+        """
+        여러 사용자의 운별 점수 일괄 계산 - _calculate_all_fortunes와 같은 결과
+        - 난수는 사용자별 rng에서 단일 경로와 같은 순서(기본, 재물, 애정, 학업, 직장, 건강)로 추출
+        - 오행 보너스/점수 범위 제한은 numpy 배열 연산으로 한 번에 처리
+        """
+        if np is None or not items:
+            return [self._calculate_all_fortunes(None, None, saju_data, rng) for rng, saju_data in items]
+
+        # 사용자별 값은 파이썬 리스트로 모은 뒤 한 번에 배열로 변환
+        draws = []
+        ohaeng_rows = []
+        ohaeng_totals = []
+        has_ohaeng = []
+        base_adjust = []
+        no_ohaeng = (0, 0, 0, 0, 0)
+
+        for rng, saju_data in items:
+            randint = rng.randint
+            draws.append((
+                randint(55, 90), randint(-10, 15), randint(-15, 20),
+                randint(-10, 10), randint(-10, 15), randint(-10, 10)
+            ))
+            adjust = 0
+            if saju_data and 'ohaeng_scores' in saju_data:
+                scores = saju_data['ohaeng_scores']
+                has_ohaeng.append(True)
+                # 열 순서: 금(재물), 화(애정), 수(학업), 목(직장), 토(안정)
+                ohaeng_rows.append((
+                    scores.get('금', 0), scores.get('화', 0), scores.get('수', 0),
+                    scores.get('목', 0), scores.get('토', 0)
+                ))
+                ohaeng_totals.append(sum(scores.values()) if scores else 1)
+                # 일주 강약 반영 (_calculate_all_fortunes와 같은 비교)
+                strength = saju_data.get('ilju_strength')
+                if strength:
+                    if strength == '강':
+                        adjust = 5
+                    elif strength == '약':
+                        adjust = -3
+            else:
+                has_ohaeng.append(False)
+                ohaeng_rows.append(no_ohaeng)
+                ohaeng_totals.append(1)
+            base_adjust.append(adjust)
+
+        draws = np.array(draws, dtype=np.int64)
+        ohaeng = np.array(ohaeng_rows, dtype=np.float64)
+        ohaeng_total = np.array(ohaeng_totals, dtype=np.float64)
+        has_ohaeng = np.array(has_ohaeng, dtype=bool)
+
+        # 평균 대비 오행 보너스 (-10 ~ +10), int()와 같은 0 방향 절사
+        avg = np.where(ohaeng_total > 0, ohaeng_total / 5, 10.0)[:, None]
+        bonus = np.trunc((ohaeng[:, :4] - avg) / avg * 10).astype(np.int64)
+
+        # 토(土)가 강하면 전체 안정 보너스
+        earth = ohaeng[:, 4:5]
+        stability = np.where(earth > avg, np.trunc((earth - avg) / avg * 5), 0).astype(np.int64)
+        bonus = np.clip(bonus + stability, -15, 15)
+        bonus[~has_ohaeng] = 0
+
+        base = draws[:, 0] + np.array(base_adjust, dtype=np.int64)
+        sub_scores = np.empty((len(items), 5), dtype=np.int64)
+        sub_scores[:, :4] = np.clip(base[:, None] + draws[:, 1:5] + bonus, 50, 100)
+        sub_scores[:, 4] = np.clip(base + draws[:, 5], 50, 100)
+        # 총운은 5개 운세의 평균 (round와 같은 짝수 반올림)
+        totals = np.round(sub_scores.sum(axis=1) / 5).astype(np.int64)
+
+        return [
+            {'total': total, 'money': money, 'love': love, 'study': study, 'work': work, 'health': health}
+            for total, (money, love, study, work, health) in zip(totals.tolist(), sub_scores.tolist())
+        ]
+
+    def _generate_fortune_texts(self, scores: Dict, zodiac_sign: str, chinese_zodiac: str, today: Optional[date] = None) -> Dict:
         """LLM 실패 시 동적 운세 텍스트 생성 - 날짜/점수 기반 변형"""
-        today = date.today()
-        day_seed = today.toordinal() + hash(zodiac_sign) % 100  # 날짜+별자리 기반 시드
-        random.seed(day_seed)
+        today = today or date.today()
+        # 날짜+별자리 기반 시드 (hash()는 프로세스마다 달라지므로 md5 사용)
+        zodiac_hash = int(hashlib.md5(zodiac_sign.encode()).hexdigest(), 16)
+        rng = random.Random(today.toordinal() + zodiac_hash % 100)
 
         # 시간대 변형 (매일 다르게)
-        morning_hours = random.choice(["오전 9시", "오전 10시", "오전 11시", "아침 일찍"])
-        afternoon_hours = random.choice(["오후 2시", "오후 3시", "오후 4시", "점심 이후"])
-        evening_hours = random.choice(["저녁 6시", "저녁 7시", "저녁 8시", "저녁 무렵"])
+        morning_hours = rng.choice(["오전 9시", "오전 10시", "오전 11시", "아침 일찍"])
+        afternoon_hours = rng.choice(["오후 2시", "오후 3시", "오후 4시", "점심 이후"])
+        evening_hours = rng.choice(["저녁 6시", "저녁 7시", "저녁 8시", "저녁 무렵"])
 
         # 조언 키워드 변형
-        action_words_positive = random.choice(["적극적으로", "자신감 있게", "주도적으로", "과감하게"])
-        action_words_neutral = random.choice(["차분하게", "꾸준히", "성실하게", "묵묵히"])
-        action_words_negative = random.choice(["신중하게", "조심스럽게", "천천히", "여유롭게"])
+        action_words_positive = rng.choice(["적극적으로", "자신감 있게", "주도적으로", "과감하게"])
+        action_words_neutral = rng.choice(["차분하게", "꾸준히", "성실하게", "묵묵히"])
+        action_words_negative = rng.choice(["신중하게", "조심스럽게", "천천히", "여유롭게"])
 
         # 장소 변형
-        places = random.choice(["카페", "공원", "도서관", "익숙한 장소"])
+        places = rng.choice(["카페", "공원", "도서관", "익숙한 장소"])
 
         texts = {}
 
@@ -468,11 +749,11 @@ class FortuneCalculator:
         ]
 
         if total_score >= 80:
-            texts['total'] = random.choice(total_templates_high)
+            texts['total'] = rng.choice(total_templates_high)
         elif total_score >= 60:
-            texts['total'] = random.choice(total_templates_mid)
+            texts['total'] = rng.choice(total_templates_mid)
         else:
-            texts['total'] = random.choice(total_templates_low)
+            texts['total'] = rng.choice(total_templates_low)
 
         # 재물운
         money_score = scores['money']
@@ -490,11 +771,11 @@ class FortuneCalculator:
         ]
 
         if money_score >= 80:
-            texts['money'] = random.choice(money_high)
+            texts['money'] = rng.choice(money_high)
         elif money_score >= 60:
-            texts['money'] = random.choice(money_mid)
+            texts['money'] = rng.choice(money_mid)
         else:
-            texts['money'] = random.choice(money_low)
+            texts['money'] = rng.choice(money_low)
 
         # 연애운
         love_score = scores['love']
@@ -512,11 +793,11 @@ class FortuneCalculator:
         ]
 
         if love_score >= 80:
-            texts['love'] = random.choice(love_high)
+            texts['love'] = rng.choice(love_high)
         elif love_score >= 60:
-            texts['love'] = random.choice(love_mid)
+            texts['love'] = rng.choice(love_mid)
         else:
-            texts['love'] = random.choice(love_low)
+            texts['love'] = rng.choice(love_low)
 
         # 학업운
         study_score = scores['study']
@@ -534,11 +815,11 @@ class FortuneCalculator:
         ]
 
         if study_score >= 80:
-            texts['study'] = random.choice(study_high)
+            texts['study'] = rng.choice(study_high)
         elif study_score >= 60:
-            texts['study'] = random.choice(study_mid)
+            texts['study'] = rng.choice(study_mid)
         else:
-            texts['study'] = random.choice(study_low)
+            texts['study'] = rng.choice(study_low)
 
         # 직장운
         work_score = scores['work']
@@ -556,11 +837,11 @@ class FortuneCalculator:
         ]
 
         if work_score >= 80:
-            texts['work'] = random.choice(work_high)
+            texts['work'] = rng.choice(work_high)
         elif work_score >= 60:
-            texts['work'] = random.choice(work_mid)
+            texts['work'] = rng.choice(work_mid)
         else:
-            texts['work'] = random.choice(work_low)
+            texts['work'] = rng.choice(work_low)
 
         # 건강운
         health_score = scores.get('health', 70)
@@ -578,14 +859,11 @@ class FortuneCalculator:
         ]
 
         if health_score >= 80:
-            texts['health'] = random.choice(health_high)
+            texts['health'] = rng.choice(health_high)
         elif health_score >= 60:
-            texts['health'] = random.choice(health_mid)
+            texts['health'] = rng.choice(health_mid)
         else:
-            texts['health'] = random.choice(health_low)
-
-        # 랜덤 시드 리셋 (다른 곳에 영향 안 주도록)
-        random.seed()
+            texts['health'] = rng.choice(health_low)
 
         return texts
     
@@ -870,7 +1148,7 @@ class FortuneCalculator:
                 'ilju_strength': result['ilju_strength']
             }
         except Exception as e:
-            print(f"[ERROR] 사주 계산 오류: {e}, 기존 로직 사용")
+            logger.error("사주 계산 오류: %s, 기존 로직 사용", e)
             # 폴백: 기존 간단 계산
             heavenly_stems = ['갑', '을', '병', '정', '무', '기', '경', '신', '임', '계']
             earthly_branches = ['자', '축', '인', '묘', '진', '사', '오', '미', '신', '유', '술', '해']
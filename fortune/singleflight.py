@@ -0,0 +1,163 @@
+"""
+동일 키 요청 병합 (single-flight)
+- 같은 캐시 키로 동시에 들어온 요청 중 하나만 실제 계산(LLM 호출)을 수행
+- 같은 프로세스: 첫 요청(리더)의 결과를 threading.Event 로 기다림
+- 다른 워커: Django 캐시의 cache.add 임대(lease)로 리더를 정하고, 나머지는 결과 캐시를 폴링
+- 대기 시간이 지나면 None 반환 -> 호출자가 기본 로직으로 대체
+- 비동기(ASGI) 경로는 ado() 사용: 같은 이벤트 루프의 대기자는 asyncio.Future 로 결과 공유
+"""
+import asyncio
+import threading
+import time
+import uuid
+import weakref
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from django.core.cache import cache
+
+
+class _Call:
+    """진행 중인 계산 하나 (같은 프로세스의 대기자가 공유)"""
+    __slots__ = ('event', 'result')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+
+
+class SingleFlight:
+    """
+    키별 요청 병합기
+
+    compute 는 성공 시 결과를 직접 cache.set(key, result) 해야 함
+    (다른 워커의 대기자는 같은 키의 캐시 값을 폴링해서 결과를 받음)
+    """
+
+    def __init__(self, namespace: str, lease_timeout: int = 60, poll_interval: float = 0.2):
+        self.namespace = namespace
+        self.lease_timeout = lease_timeout
+        self.poll_interval = poll_interval
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+        self._async_calls: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Future]]" = weakref.WeakKeyDictionary()
+        self._stats = {'leader': 0, 'local_wait': 0, 'remote_wait': 0, 'timeout': 0}
+
+    def do(self, key: str, compute: Callable[[], Optional[Any]], timeout: float) -> Optional[Any]:
+        """
+        key 에 대한 계산을 한 번만 수행하고 결과 반환
+
+        Args:
+            key: 결과가 저장되는 캐시 키
+            compute: 실제 계산 함수 (실패 시 None)
+            timeout: 다른 요청의 결과를 기다리는 최대 시간 (초)
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = self._calls[key] = _Call()
+                self._stats['leader'] += 1
+            else:
+                self._stats['local_wait'] += 1
+
+        if not is_leader:
+            if not call.event.wait(timeout):
+                self._count('timeout')
+            return call.result
+
+        try:
+            call.result = self._lead(key, compute, timeout)
+            return call.result
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.event.set()
+
+    def _lead(self, key: str, compute: Callable[[], Optional[Any]], timeout: float) -> Optional[Any]:
+        """프로세스 내 리더: 워커 간 임대를 얻으면 계산, 다른 워커가 계산 중이면 결과 대기"""
+        lease_key = f"{self.namespace}:lease:{key}"
+        token = uuid.uuid4().hex
+        deadline = time.monotonic() + timeout
+        waited = False
+
+        while True:
+            # 결과를 먼저 확인 (다른 워커가 결과 저장 후 임대를 해제한 직후일 수 있음)
+            result = cache.get(key)
+            if result is not None:
+                return result
+
+            if cache.add(lease_key, token, self.lease_timeout):
+                try:
+                    return compute()
+                finally:
+                    if cache.get(lease_key) == token:
+                        cache.delete(lease_key)
+
+            if not waited:
+                waited = True
+                self._count('remote_wait')
+            if time.monotonic() >= deadline:
+                self._count('timeout')
+                return None
+            time.sleep(self.poll_interval)
+
+    async def ado(self, key: str, compute: Callable[[], Awaitable[Optional[Any]]], timeout: float) -> Optional[Any]:
+        """do() 의 비동기 버전 (compute 는 코루틴 함수)"""
+        loop = asyncio.get_running_loop()
+        calls = self._async_calls.setdefault(loop, {})
+
+        future = calls.get(key)
+        if future is not None:
+            self._count('local_wait')
+            try:
+                return await asyncio.wait_for(asyncio.shield(future), timeout)
+            except asyncio.TimeoutError:
+                self._count('timeout')
+                return None
+
+        future = calls[key] = loop.create_future()
+        self._count('leader')
+        result = None
+        try:
+            result = await self._alead(key, compute, timeout)
+            return result
+        finally:
+            calls.pop(key, None)
+            if not future.done():
+                future.set_result(result)
+
+    async def _alead(self, key: str, compute: Callable[[], Awaitable[Optional[Any]]], timeout: float) -> Optional[Any]:
+        """_lead() 의 비동기 버전 (폴링 대기 중에도 이벤트 루프를 막지 않음)"""
+        lease_key = f"{self.namespace}:lease:{key}"
+        token = uuid.uuid4().hex
+        deadline = time.monotonic() + timeout
+        waited = False
+
+        while True:
+            result = await cache.aget(key)
+            if result is not None:
+                return result
+
+            if await cache.aadd(lease_key, token, self.lease_timeout):
+                try:
+                    return await compute()
+                finally:
+                    if await cache.aget(lease_key) == token:
+                        await cache.adelete(lease_key)
+
+            if not waited:
+                waited = True
+                self._count('remote_wait')
+            if time.monotonic() >= deadline:
+                self._count('timeout')
+                return None
+            await asyncio.sleep(self.poll_interval)
+
+    def _count(self, name: str):
+        with self._lock:
+            self._stats[name] += 1
+
+    def stats(self) -> Dict[str, int]:
+        """리더/대기/타임아웃 횟수"""
+        with self._lock:
+            return dict(self._stats)
@@ -0,0 +1,111 @@
+"""
+24절기 테이블 (1899 ~ 2101)
+- 번들된 바이너리(data/solar_terms.bin)를 import 시 한 번만 로드
+- 절입 시각은 KST(UTC+9) 기준 분 단위로 저장
+- 월주/년주 경계는 bisect로 O(log n) 조회
+
+테이블 재생성: python manage.py build_solar_terms
+"""
+from array import array
+from bisect import bisect_right
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Optional, Tuple
+import struct
+import sys
+
+SOLAR_TERMS_PATH = Path(__file__).resolve().parent / 'data' / 'solar_terms.bin'
+
+# 파일 헤더: 매직, 시작 년도, 년도 수
+HEADER_FORMAT = '<4sHH'
+HEADER_MAGIC = b'STRM'
+TERMS_PER_YEAR = 24
+IPCHUN_TERM_INDEX = 2  # 0=소한, 1=대한, 2=입춘
+
+# 분 단위 기준 시각 (KST)
+EPOCH = datetime(1899, 1, 1)
+EPOCH_ORDINAL = EPOCH.toordinal()
+
+
+def _load_table(path: Path = SOLAR_TERMS_PATH) -> Tuple[int, int, array]:
+    """바이너리 절기 테이블 로드 -> (시작 년도, 년도 수, 분 단위 절입 시각 배열)"""
+    raw = path.read_bytes()
+    header_size = struct.calcsize(HEADER_FORMAT)
+    magic, first_year, num_years = struct.unpack_from(HEADER_FORMAT, raw)
+    if magic != HEADER_MAGIC:
+        raise ValueError(f"잘못된 절기 테이블 파일: {path}")
+
+    minutes = array('i')
+    minutes.frombytes(raw[header_size:])
+    if sys.byteorder == 'big':
+        minutes.byteswap()
+
+    if len(minutes) != num_years * TERMS_PER_YEAR:
+        raise ValueError(f"절기 테이블 크기 불일치: {len(minutes)} != {num_years * TERMS_PER_YEAR}")
+
+    return first_year, num_years, minutes
+
+
+FIRST_YEAR, NUM_YEARS, TERM_MINUTES = _load_table()
+LAST_YEAR = FIRST_YEAR + NUM_YEARS - 1
+
+
+def _build_jeol_index():
+    """
+    절(節) 12개만 뽑아 월 경계 인덱스 구성
+    - 짝수 인덱스(소한, 입춘, 경칩, ... 대설)가 월의 시작
+    - 각 절입일의 날짜 서수(ordinal)와 해당 절이 시작하는 (사주 년도, 절기월)을 병렬 배열로 보관
+    """
+    ordinals = array('l')
+    saju_years = array('h')
+    months = array('b')
+
+    for year_offset in range(NUM_YEARS):
+        year = FIRST_YEAR + year_offset
+        for term_idx in range(0, TERMS_PER_YEAR, 2):
+            minute = TERM_MINUTES[year_offset * TERMS_PER_YEAR + term_idx]
+            ordinals.append(EPOCH_ORDINAL + minute // (24 * 60))
+            if term_idx == 0:
+                # 소한: 전년도 축월(12월)
+                saju_years.append(year - 1)
+                months.append(12)
+            else:
+                # 입춘(2) -> 인월(1월), 경칩(4) -> 묘월(2월), ... 대설(22) -> 자월(11월)
+                saju_years.append(year)
+                months.append(term_idx // 2)
+
+    return ordinals, saju_years, months
+
+
+JEOL_ORDINALS, JEOL_SAJU_YEARS, JEOL_MONTHS = _build_jeol_index()
+
+
+def lookup_solar_month(target: date) -> Optional[Tuple[int, int]]:
+    """
+    날짜가 속한 (사주 년도, 절기월 1~12) 반환
+    - 절입일 당일은 새 절기로 취급 (날짜 단위 기준)
+    - 테이블 범위를 벗어나면 None
+    """
+    idx = bisect_right(JEOL_ORDINALS, target.toordinal()) - 1
+    if idx < 0 or target.year > LAST_YEAR:
+        return None
+    return JEOL_SAJU_YEARS[idx], JEOL_MONTHS[idx]
+
+
+def solar_term_datetime(year: int, term_idx: int) -> Optional[datetime]:
+    """
+    절입 시각 (KST, naive datetime)
+    term_idx: SajuCalculator.JEOLGI 순서 (0=소한, 2=입춘, ... 23=동지)
+    """
+    if not (FIRST_YEAR <= year <= LAST_YEAR) or not (0 <= term_idx < TERMS_PER_YEAR):
+        return None
+    minute = TERM_MINUTES[(year - FIRST_YEAR) * TERMS_PER_YEAR + term_idx]
+    return EPOCH + timedelta(minutes=minute)
+
+
+def solar_term_date(year: int, term_idx: int) -> Optional[date]:
+    """절입일 (KST 날짜)"""
+    if not (FIRST_YEAR <= year <= LAST_YEAR) or not (0 <= term_idx < TERMS_PER_YEAR):
+        return None
+    minute = TERM_MINUTES[(year - FIRST_YEAR) * TERMS_PER_YEAR + term_idx]
+    return date.fromordinal(EPOCH_ORDINAL + minute // (24 * 60))
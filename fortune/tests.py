@@ -1,3 +1,548 @@
-from django.test import TestCase
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from pathlib import Path
+from unittest import mock
+import asyncio
+import io
+import json
+import random
+import sys
+import tempfile
+import threading
+import time
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from fortune import llm_batch, solar_terms
+from fortune.api_views import (
+    clear_today_fortune_cache, find_same_condition_fortune, get_today_fortune, load_fortune_from_db,
+    load_fortune_summary_from_db, save_fortune_to_db,
+)
+from fortune.models import DailyFortuneCache
+from fortune.saju_calculator import SajuCalculator
+from fortune.services import FortuneCalculator
+from fortune.management.commands.batch_fortune_texts import Command as BatchFortuneTextsCommand
+from fortune.singleflight import SingleFlight
+
+
+class SolarTermTableTest(SimpleTestCase):
+    """24절기 테이블 테스트"""
+
+    def test_table_covers_1900_to_2100(self):
+        """1900~2100년 전 범위가 테이블에 포함되는지 테스트"""
+        self.assertLessEqual(solar_terms.FIRST_YEAR, 1899)
+        self.assertGreaterEqual(solar_terms.LAST_YEAR, 2101)
+        self.assertIsNotNone(solar_terms.lookup_solar_month(date(1900, 1, 1)))
+        self.assertIsNotNone(solar_terms.lookup_solar_month(date(2100, 12, 31)))
+
+    def test_known_ipchun_times(self):
+        """한국천문연구원 발표 입춘 시각과 일치하는지 테스트 (KST, 분 단위)"""
+        known = {
+            2021: datetime(2021, 2, 3, 23, 59),
+            2024: datetime(2024, 2, 4, 17, 27),
+            2025: datetime(2025, 2, 3, 23, 10),
+        }
+        for year, expected in known.items():
+            actual = solar_terms.solar_term_datetime(year, solar_terms.IPCHUN_TERM_INDEX)
+            self.assertLessEqual(abs((actual - expected).total_seconds()), 60, year)
+
+    def test_solar_month_boundary(self):
+        """절입일 당일부터 새 절기월로 바뀌는지 테스트 (2023 소한 = 1/6 00:05)"""
+        self.assertEqual(solar_terms.lookup_solar_month(date(2023, 1, 5)), (2022, 11))
+        self.assertEqual(solar_terms.lookup_solar_month(date(2023, 1, 6)), (2022, 12))
+        self.assertEqual(solar_terms.lookup_solar_month(date(2023, 2, 3)), (2022, 12))
+        self.assertEqual(solar_terms.lookup_solar_month(date(2023, 2, 4)), (2023, 1))
+
+
+class SajuCalculatorTest(SimpleTestCase):
+    """사주 계산 테스트"""
+
+    def setUp(self):
+        self.calc = SajuCalculator()
+
+    def test_year_pillar_switches_on_ipchun(self):
+        """입춘 전후로 년주가 바뀌는지 테스트 (2021 입춘 = 2/3)"""
+        self.assertEqual(self.calc._calculate_year_pillar(date(2021, 2, 2)), ('경', '자'))
+        self.assertEqual(self.calc._calculate_year_pillar(date(2021, 2, 3)), ('신', '축'))
+
+    def test_month_pillar(self):
+        """월주 계산 테스트"""
+        # 1998-12-19: 무인년 대설(12/7) 이후 -> 갑자월
+        result = self.calc.calculate_saju(date(1998, 12, 19))
+        self.assertEqual(result['saju']['year']['ganzi'], '무인')
+        self.assertEqual(result['saju']['month']['ganzi'], '갑자')
+
+    def test_ipchun_date(self):
+        """입춘 날짜가 테이블 값을 사용하는지 테스트"""
+        self.assertEqual(self.calc._get_ipchun_date(2021), date(2021, 2, 3))
+        self.assertEqual(self.calc._get_ipchun_date(2026), date(2026, 2, 4))
+
+    def test_saju_cache_hit_and_isolation(self):
+        """같은 생년월일/시지는 캐시에서 반환되고, 결과를 수정해도 캐시가 오염되지 않는지 테스트"""
+        SajuCalculator.cache_clear()
+        birth_date = date(1995, 7, 21)
+
+        first = self.calc.calculate_saju(birth_date, datetime(1995, 7, 21, 9, 10))
+        # 같은 시지(사시, 09~11시)는 같은 캐시 항목
+        second = self.calc.calculate_saju(birth_date, datetime(1995, 7, 21, 10, 50))
+        info = SajuCalculator.cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 1))
+        self.assertEqual(first, second)
+
+        first['saju']['day']['gan'] = '변조'
+        first['ohaeng_scores']['목'] = -1
+        third = self.calc.calculate_saju(birth_date, datetime(1995, 7, 21, 9, 10))
+        self.assertEqual(third, second)
+        self.assertIsNot(third['saju'], second['saju'])
+
+        # 시간 미상은 별도 항목
+        unknown = self.calc.calculate_saju(birth_date)
+        self.assertEqual(unknown['hour_hanja'], '미상')
+        self.assertEqual(SajuCalculator.cache_info().misses, 2)
+
+
+@override_settings(OPENAI_API_KEY='')
+class FortuneDeterminismTest(SimpleTestCase):
+    """운세 결과 결정성 테스트 (LLM 미사용 경로)"""
+
+    PROFILES = [(date(1960 + i, (i % 12) + 1, (i % 28) + 1), 'M' if i % 2 else 'F') for i in range(32)]
+
+    def _fortune(self, birth_date, gender):
+        result = FortuneCalculator().calculate_fortune(birth_date, gender, user_id=1)
+        return {key: result[key] for key in ('fortune_scores', 'fortune_texts', 'lucky_colors', 'lotto_numbers', 'lucky_item')}
+
+    def test_same_result_under_concurrent_threads(self):
+        """32개 스레드에서 동시에 계산해도 단일 스레드 결과와 동일한지 테스트"""
+        expected = [self._fortune(*profile) for profile in self.PROFILES]
+        barrier = threading.Barrier(len(self.PROFILES))
+
+        def worker(index):
+            barrier.wait()
+            # 다른 스레드와 최대한 겹치도록 여러 번 반복
+            return [self._fortune(*self.PROFILES[index]) for _ in range(20)]
+
+        # 스레드 전환을 자주 일으켜 경쟁 상태가 드러나도록 함
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            with ThreadPoolExecutor(max_workers=len(self.PROFILES)) as executor:
+                results = list(executor.map(worker, range(len(self.PROFILES))))
+        finally:
+            sys.setswitchinterval(switch_interval)
+
+        for index, runs in enumerate(results):
+            for run in runs:
+                self.assertEqual(run, expected[index])
+
+    def test_does_not_touch_global_random_state(self):
+        """운세 계산이 전역 random 상태를 바꾸지 않는지 테스트"""
+        random.seed(1234)
+        expected = random.random()
+        random.seed(1234)
+        self._fortune(date(1990, 3, 15), 'F')
+        self.assertEqual(random.random(), expected)
+
+    def test_bulk_matches_single(self):
+        """calculate_fortunes_bulk 결과가 calculate_fortune 결과와 완전히 같은지 테스트"""
+        day = date(2025, 6, 1)
+        profiles = [
+            {
+                'birth_date': birth_date,
+                'gender': gender,
+                'birth_time': datetime(2000, 1, 1, i % 24) if i % 3 else None,
+                'calendar_type': 'lunar' if i % 5 == 0 else 'solar',
+                'mbti': 'INFP' if i % 2 else None,
+                'user_id': i + 1,
+            }
+            for i, (birth_date, gender) in enumerate(self.PROFILES)
+        ]
+        calc = FortuneCalculator()
+        expected = json.dumps([calc.calculate_fortune(**profile, today=day) for profile in profiles], ensure_ascii=False)
+
+        self.assertEqual(json.dumps(calc.calculate_fortunes_bulk(profiles, day), ensure_ascii=False), expected)
+        # numpy 미설치 환경의 순차 계산 경로
+        with mock.patch('fortune.services.np', None):
+            self.assertEqual(json.dumps(calc.calculate_fortunes_bulk(profiles, day), ensure_ascii=False), expected)
+
+
+@override_settings(OPENAI_API_KEY='')
+class PrewarmFortunesCommandTest(TestCase):
+    """prewarm_fortunes 관리 명령 테스트"""
+
+    def setUp(self):
+        User = get_user_model()
+        self.users = [
+            User.objects.create_user(
+                username=f'user{i}', password='pw', email=f'user{i}@example.com',
+                birth_date=date(1985 + i, 3, 10 + i), gender='MF'[i % 2], mbti='ENTP' if i else ''
+            )
+            for i in range(3)
+        ]
+        User.objects.create_user(username='nobirth', password='pw', email='nobirth@example.com')
+        self.day = date(2025, 6, 1)
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.checkpoint = str(Path(tmp_dir.name) / 'checkpoint.json')
+
+    def _run(self, *args):
+        call_command(
+            'prewarm_fortunes', '--date', self.day.isoformat(), '--checkpoint', self.checkpoint,
+            '--chunk-size', '2', *args, stdout=io.StringIO()
+        )
+
+    def test_creates_cache_rows_matching_live_calculation(self):
+        """사전 생성 결과가 API에서 계산하는 결과와 같은지 테스트"""
+        self._run()
+
+        self.assertEqual(DailyFortuneCache.objects.filter(fortune_date=self.day).count(), 3)
+        user = self.users[1]
+        stored = load_fortune_from_db(user, None, self.day)
+        expected = FortuneCalculator().calculate_fortune(
+            birth_date=user.birth_date, gender=user.gender, birth_time='', chinese_name='',
+            calendar_type=user.calendar_type, mbti=user.mbti, user_id=user.id, today=self.day
+        )
+        self.assertEqual(stored, json.loads(json.dumps(expected, ensure_ascii=False)))
+        self.assertEqual(find_same_condition_fortune(self.day, user.birth_date), stored)
+
+    def test_resumes_from_checkpoint(self):
+        """체크포인트 이후 사용자만 처리하고, 이미 있는 행은 건너뛰는지 테스트"""
+        self._run('--limit', '2')
+        self.assertEqual(DailyFortuneCache.objects.count(), 2)
+        self.assertEqual(json.loads(Path(self.checkpoint).read_text())['last_pk'], self.users[1].pk)
+
+        self._run()
+        self.assertEqual(DailyFortuneCache.objects.count(), 3)
+
+        # 처음부터 다시 실행해도 중복 생성 없음
+        self._run('--restart')
+        self.assertEqual(DailyFortuneCache.objects.count(), 3)
+
+        # --overwrite 면 기존 행을 갱신
+        DailyFortuneCache.objects.update(fortune_score=1)
+        self._run('--restart', '--overwrite')
+        self.assertEqual(DailyFortuneCache.objects.count(), 3)
+        self.assertFalse(DailyFortuneCache.objects.filter(fortune_score=1).exists())
+
+
+class SaveFortuneToDbTest(TestCase):
+    """운세 DB 저장(upsert) 테스트"""
+
+    def setUp(self):
+        self.day = date(2025, 6, 1)
+        self.fortune = {
+            'fortune_score': 80, 'fortune_texts': {'total': '좋은 하루'}, 'lucky_colors': ['빨강'],
+            'lotto_numbers': [7, 14], 'zodiac_sign': '양자리', 'saju_data': {},
+        }
+        self.user = get_user_model().objects.create_user(
+            username='saver', password='pw', email='saver@example.com', birth_date=date(1990, 1, 1)
+        )
+
+    def test_identical_save_skips_write(self):
+        """같은 내용을 다시 저장하면 조회 한 번으로 끝나는지 테스트"""
+        save_fortune_to_db(None, 'sess-1', self.day, self.fortune, birth_date=date(1990, 1, 1))
+        row = DailyFortuneCache.objects.get()
+
+        with self.assertNumQueries(1):
+            self.assertTrue(save_fortune_to_db(None, 'sess-1', self.day, self.fortune, birth_date=date(1990, 1, 1)))
+
+        self.fortune['fortune_score'] = 60
+        save_fortune_to_db(None, 'sess-1', self.day, self.fortune, birth_date=date(1990, 1, 1))
+        updated = DailyFortuneCache.objects.get()
+        self.assertEqual((updated.pk, updated.fortune_score), (row.pk, 60))
+
+        # 출생 시간은 time 으로 넘어와도 저장된 문자열과 같은 값으로 비교
+        birth_time = datetime(2000, 1, 1, 14, 30).time()
+        save_fortune_to_db(None, 'sess-2', self.day, self.fortune, birth_date=date(1990, 1, 1), birth_time=birth_time)
+        with self.assertNumQueries(1):
+            self.assertTrue(save_fortune_to_db(
+                None, 'sess-2', self.day, self.fortune, birth_date=date(1990, 1, 1), birth_time=birth_time
+            ))
+        self.assertEqual(DailyFortuneCache.objects.get(session_key='sess-2').birth_time, '14:30:00')
+
+    def test_login_replaces_session_row(self):
+        """로그인 전 비회원 행과 사용자 행이 하나로 합쳐지는지 테스트"""
+        save_fortune_to_db(None, 'sess-1', self.day, self.fortune)
+        DailyFortuneCache.objects.create(
+            user=self.user, session_key='old-sess', fortune_date=self.day, fortune_score=50, fortune_text='', lucky_color=''
+        )
+
+        self.assertTrue(save_fortune_to_db(self.user, 'sess-1', self.day, self.fortune))
+        row = DailyFortuneCache.objects.get()
+        self.assertEqual((row.user_id, row.session_key, row.fortune_score), (self.user.pk, 'sess-1', 80))
+        self.assertEqual(load_fortune_from_db(self.user, None, self.day)['lotto_numbers'], [7, 14])
+
+    def test_summary_reads_only_card_fields(self):
+        """요약 조회가 JSON 필드에서 점수만 꺼내고 전체 데이터는 돌려주지 않는지 테스트"""
+        self.fortune['fortune_scores'] = {'total': 80, 'money': 90}
+        save_fortune_to_db(None, 'sess-1', self.day, self.fortune)
+        self.assertEqual(DailyFortuneCache.objects.get().full_fortune_data['fortune_scores']['money'], 90)
+
+        summary = load_fortune_summary_from_db(None, 'sess-1', self.day)
+        self.assertEqual(summary['fortune_scores'], {'total': 80, 'money': 90})
+        self.assertEqual((summary['fortune_score'], summary['lucky_colors']), (80, ['빨강']))
+        self.assertNotIn('full_fortune_data', summary)
+        self.assertIsNone(load_fortune_summary_from_db(None, 'other', self.day))
+
+
+class TodayFortuneTest(TestCase):
+    """오늘 운세 read-through 캐시 테스트"""
+
+    def setUp(self):
+        clear_today_fortune_cache()
+        self.addCleanup(clear_today_fortune_cache)
+        self.day = date(2025, 6, 1)
+        self.user = get_user_model().objects.create_user(
+            username='reader', password='pw', email='reader@example.com', birth_date=date(1990, 1, 1), gender='F'
+        )
+        calculate = FortuneCalculator.calculate_fortune
+        patcher = mock.patch.object(FortuneCalculator, 'calculate_fortune', autospec=True, side_effect=calculate)
+        self.calculate = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _fresh_user(self):
+        # 요청마다 request.user 가 새로 로드되는 것과 같은 상황
+        return get_user_model().objects.get(pk=self.user.pk)
+
+    def test_computes_once_and_reuses(self):
+        """첫 호출만 계산/저장하고, 같은 요청은 메모, 다음 요청은 프로세스 캐시를 쓰는지 테스트"""
+        first = get_today_fortune(self.user, fortune_date=self.day)
+        self.assertEqual(self.calculate.call_count, 1)
+        row = DailyFortuneCache.objects.get()
+        self.assertEqual((row.user_id, row.session_key), (self.user.pk, f'user:{self.user.pk}'))
+
+        with self.assertNumQueries(0):
+            self.assertIs(get_today_fortune(self.user, fortune_date=self.day), first)
+
+        user = self._fresh_user()
+        with self.assertNumQueries(0):
+            cached = get_today_fortune(user, fortune_date=self.day)
+        self.assertEqual(cached['fortune_score'], first['fortune_score'])
+        self.assertIsNot(cached, first)
+        self.assertEqual(self.calculate.call_count, 1)
+
+    def test_reads_stored_row_and_checks_profile(self):
+        """저장된 본인 행을 재사용하고, 생년월일이 바뀌면 다시 계산하는지 테스트"""
+        get_today_fortune(self.user, fortune_date=self.day)
+        clear_today_fortune_cache()
+
+        stored = get_today_fortune(self._fresh_user(), fortune_date=self.day)
+        self.assertEqual(self.calculate.call_count, 1)
+        self.assertEqual(stored['lucky_colors'], load_fortune_from_db(self.user, None, self.day)['lucky_colors'])
+
+        self.user.birth_date = date(1991, 2, 2)
+        self.user.save()
+        get_today_fortune(self._fresh_user(), fortune_date=self.day)
+        self.assertEqual(self.calculate.call_count, 2)
+        row = DailyFortuneCache.objects.get()
+        self.assertEqual(row.birth_date, date(1991, 2, 2))
+
+    def test_same_birthday_other_profile_is_not_shared(self):
+        """생년월일이 같아도 성별/MBTI 가 다른 사용자의 운세는 쓰지 않고, 같으면 공유하는지 테스트"""
+        User = get_user_model()
+        male = User.objects.create_user(
+            username='m', password='pw', email='m@example.com', birth_date=date(1990, 5, 5), gender='M', mbti='INTJ'
+        )
+        female = User.objects.create_user(
+            username='f', password='pw', email='f@example.com', birth_date=date(1990, 5, 5), gender='F', mbti='ENFP'
+        )
+        twin = User.objects.create_user(
+            username='t', password='pw', email='t@example.com', birth_date=date(1990, 5, 5), gender='M', mbti='INTJ'
+        )
+
+        get_today_fortune(male, fortune_date=self.day)
+        fortune = get_today_fortune(female, fortune_date=self.day)
+        self.assertEqual(self.calculate.call_count, 2)
+        self.assertEqual((fortune['gender'], fortune['mbti'], fortune['user_id']), ('F', 'ENFP', female.pk))
+
+        self.assertEqual(get_today_fortune(twin, fortune_date=self.day)['gender'], 'M')
+        self.assertEqual(self.calculate.call_count, 2)
+
+    def test_without_birth_date(self):
+        self.user.birth_date = None
+        self.assertIsNone(get_today_fortune(self.user, fortune_date=self.day))
+        self.calculate.assert_not_called()
+
+
+class SingleFlightTest(SimpleTestCase):
+    """LLM 요청 병합(single-flight) 테스트"""
+
+    def setUp(self):
+        cache.clear()
+        self.flight = SingleFlight('test', lease_timeout=5, poll_interval=0.01)
+
+    def test_concurrent_callers_share_one_call(self):
+        """같은 키로 동시에 호출하면 계산은 한 번만 수행되는지 테스트"""
+        calls = []
+        release = threading.Event()
+
+        def compute():
+            calls.append(1)
+            release.wait(5)
+            cache.set('same-key', {'total': 'ok'})
+            return {'total': 'ok'}
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [executor.submit(self.flight.do, 'same-key', compute, 5) for _ in range(8)]
+            time.sleep(0.1)
+            release.set()
+            results = [future.result() for future in futures]
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [{'total': 'ok'}] * 8)
+        self.assertEqual(self.flight.stats()['leader'], 1)
+
+    def test_waits_for_other_worker_lease(self):
+        """다른 워커가 임대 중이면 계산하지 않고 그 결과를 받는지 테스트"""
+        cache.add('test:lease:remote-key', 'other-worker', 5)
+        threading.Timer(0.05, lambda: cache.set('remote-key', {'total': 'remote'})).start()
+
+        result = self.flight.do('remote-key', lambda: self.fail('계산하면 안 됨'), 2)
+        self.assertEqual(result, {'total': 'remote'})
+        self.assertEqual(self.flight.stats()['remote_wait'], 1)
+
+    def test_timeout_returns_none(self):
+        """임대 보유 워커가 응답하지 않으면 시간 초과 후 None 반환 (기본 로직으로 대체)"""
+        cache.add('test:lease:stuck-key', 'other-worker', 5)
+        self.assertIsNone(self.flight.do('stuck-key', lambda: self.fail('계산하면 안 됨'), 0.05))
+        self.assertEqual(self.flight.stats()['timeout'], 1)
+
+    @override_settings(OPENAI_API_KEY='test-key')
+    def test_fortune_text_requests_are_coalesced(self):
+        """같은 조건의 운세 텍스트 동시 요청이 LLM을 한 번만 호출하는지 테스트"""
+        calc = FortuneCalculator()
+        saju = calc._calculate_saju(date(1990, 1, 1))
+        scores = {'total': 70, 'money': 70, 'love': 70, 'study': 70, 'work': 70, 'health': 70}
+        calls = []
+
+        def fake_request(prompt, cache_key, *args):
+            calls.append(cache_key)
+            time.sleep(0.1)
+            cache.set(cache_key, {'total': 'llm'})
+            return {'total': 'llm'}
+
+        def generate():
+            return calc._generate_fortune_text_with_llm(
+                date(1990, 1, 1), 'M', saju, '염소자리', '뱀띠', scores, None, '텀블러', '시계', today=date(2025, 6, 1)
+            )
+
+        with mock.patch.object(calc, '_request_fortune_text', side_effect=fake_request):
+            with ThreadPoolExecutor(max_workers=6) as executor:
+                results = list(executor.map(lambda _: generate(), range(6)))
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [{'total': 'llm'}] * 6)
+
+    def test_async_callers_share_one_call(self):
+        """비동기 경로(ado)에서도 같은 키의 동시 호출이 한 번만 계산되는지 테스트"""
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            await cache.aset('async-key', {'total': 'async'})
+            return {'total': 'async'}
+
+        async def run():
+            return await asyncio.gather(*[self.flight.ado('async-key', compute, 5) for _ in range(5)])
+
+        results = asyncio.run(run())
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [{'total': 'async'}] * 5)
+
+
+class BatchFortuneTextsCommandTest(TestCase):
+    """LLM Batch 운세 텍스트 생성 테스트"""
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        User = get_user_model()
+        # 앞의 두 명은 같은 조건 -> 텍스트 요청 하나로 처리
+        for i, birth_date in enumerate([date(1990, 5, 5), date(1990, 5, 5), date(1984, 11, 20)]):
+            User.objects.create_user(
+                username=f'batch{i}', password='pw', email=f'batch{i}@example.com', birth_date=birth_date, gender='F'
+            )
+        self.day = date(2025, 6, 1)
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.requests = []
+
+        def responder(body):
+            self.requests.append(body)
+            return json.dumps({'total': f'배치 총운 {len(self.requests)}', 'money': '', 'love': '', 'study': '', 'work': '', 'health': ''})
+
+        transport = llm_batch.LocalBatchTransport(tmp_dir.name, responder)
+        patcher = mock.patch.object(BatchFortuneTextsCommand, '_transport', return_value=transport)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.local_dir = tmp_dir.name
+
+    def _run(self, *args):
+        call_command(
+            'batch_fortune_texts', '--date', self.day.isoformat(), '--local-dir', self.local_dir,
+            '--poll-interval', '0', *args, stdout=io.StringIO()
+        )
+
+    def test_dedupes_keys_and_fills_fortune_rows(self):
+        with mock.patch('core.llm.chat_completion') as chat:
+            self._run()
+        chat.assert_not_called()
+
+        self.assertEqual(len(self.requests), 2)
+        rows = DailyFortuneCache.objects.filter(fortune_date=self.day).order_by('user_id')
+        totals = [row.full_fortune_data['fortune_texts']['total'] for row in rows]
+        self.assertEqual(len(totals), 3)
+        self.assertEqual(totals[0], totals[1])
+        self.assertNotEqual(totals[0], totals[2])
+        self.assertTrue(all(total.startswith('배치 총운') for total in totals))
+
+        # 다시 실행하면 모든 키가 캐시돼 있어 제출하지 않음
+        self._run()
+        self.assertEqual(len(self.requests), 2)
+
+    def test_chunks_share_dedupe_across_chunks(self):
+        """사용자를 청크 단위로 읽어도 키 중복 제거가 청크를 넘어 유지되는지 테스트"""
+        with mock.patch('core.llm.chat_completion') as chat:
+            self._run('--chunk-size', '1')
+        chat.assert_not_called()  # 앞 청크에서 제출 대기 중인 키의 사용자를 먼저 저장하지 않음
+        self.assertEqual(len(self.requests), 2)
+        self.assertEqual(DailyFortuneCache.objects.filter(fortune_date=self.day).count(), 3)
+
+    def test_batch_id_applies_with_submitted_date(self):
+        """--batch-id 로 나중에 반영할 때 제출 시 기록한 운세 날짜의 키로 반영하는지 테스트"""
+        self._run()
+        batch_id = next(Path(self.local_dir).glob('*.manifest.json')).name.split('.')[0]
+        DailyFortuneCache.objects.all().delete()
+
+        call_command('batch_fortune_texts', '--batch-id', batch_id, '--local-dir', self.local_dir, stdout=io.StringIO())
+        self.assertEqual(DailyFortuneCache.objects.filter(fortune_date=self.day).count(), 3)
+
+        with self.assertRaisesMessage(CommandError, str(self.day)):
+            call_command(
+                'batch_fortune_texts', '--batch-id', batch_id, '--date', '2025-06-02', '--local-dir', self.local_dir,
+                stdout=io.StringIO()
+            )
+        Path(self.local_dir, f'{batch_id}.manifest.json').unlink()
+        with self.assertRaisesMessage(CommandError, '--date'):
+            call_command('batch_fortune_texts', '--batch-id', batch_id, '--local-dir', self.local_dir, stdout=io.StringIO())
+        # 기록 없이 다른 날짜로 반영하면 "저장 N건" 대신 오류
+        with self.assertRaisesMessage(CommandError, '맞는 키가 없습니다'):
+            call_command(
+                'batch_fortune_texts', '--batch-id', batch_id, '--date', '2025-06-02', '--local-dir', self.local_dir,
+                stdout=io.StringIO()
+            )
+
+    def test_failed_lines_are_skipped(self):
+        lines = [
+            {'custom_id': 'ok', 'error': None, 'response': {'status_code': 200, 'body': {'choices': [{'message': {'content': '{"total": "ok"}'}}]}}},
+            {'custom_id': 'bad', 'error': {'message': 'rate limited'}, 'response': None},
+            {'custom_id': 'broken', 'error': None, 'response': {'status_code': 200, 'body': {'choices': [{'message': {'content': 'not json'}}]}}},
+        ]
+        stored_keys = []
+        self.assertEqual(llm_batch.apply_batch_results(lines, on_stored=stored_keys.append), (1, 2))
+        self.assertEqual(stored_keys, ['ok'])
+        self.assertEqual(cache.get('ok'), {'total': 'ok'})
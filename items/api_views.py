@@ -1,3 +1,4 @@
+import logging
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
@@ -5,6 +6,8 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.parsers import MultiPartParser, FormParser
 from .models import UserItem
 
+logger = logging.getLogger(__name__)
+
 
 class ItemListAPIView(APIView):
     """아이템 목록 조회/생성 API"""
@@ -116,9 +119,7 @@ class ItemListAPIView(APIView):
             }, status=status.HTTP_201_CREATED)
 
         except Exception as e:
-            import traceback
-            print(f"[ItemListAPIView] Error: {str(e)}")
-            print(traceback.format_exc())
+            logger.exception("ItemListAPIView 오류: %s", e)
             return Response({
                 'success': False,
                 'error': str(e)
@@ -266,9 +267,7 @@ class ItemAnalyzeAPIView(APIView):
             })
 
         except Exception as e:
-            import traceback
-            print(f"[ItemAnalyzeAPIView] Error: {str(e)}")
-            print(traceback.format_exc())
+            logger.exception("ItemAnalyzeAPIView 오류: %s", e)
             return Response({
                 'success': False,
                 'error': str(e)
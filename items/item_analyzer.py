@@ -11,8 +11,20 @@ from PIL import Image
 from collections import Counter
 import colorsys
 import json
+import logging
 import os
 
+try:
+    import numpy as np
+except ImportError:  # numpy 가 없으면 픽셀별 파이썬 루프 사용
+    np = None
+
+# 색상 양자화: 채널별 32 단위(상위 3비트) -> 8 x 8 x 8 = 512 그룹
+COLOR_QUANT_SHIFT = 5
+COLOR_QUANT_BITS = 8 - COLOR_QUANT_SHIFT
+
+logger = logging.getLogger(__name__)
+
 class ItemAnalyzer:
     """아이템 이미지 분석 클래스 (색상 + AI 분석)"""
     
@@ -118,36 +130,33 @@ class ItemAnalyzer:
 
     def analyze_image_with_ai(self, image_path):
         """Gemini Vision API를 사용한 AI 이미지 분석"""
-        print(f"[DEBUG] AI 분석 시작: {image_path}")
+        logger.debug("AI 분석 시작: %s", image_path)
         try:
             import google.generativeai as genai
             from django.conf import settings
             
             # API 키 설정
             api_key = settings.GEMINI_API_KEY
-            print(f"[DEBUG] API 키 확인: {api_key[:10]}..." if api_key else "[DEBUG] API 키 없음!")
             
             if not api_key:
                 raise ValueError("GEMINI_API_KEY not configured")
             
             genai.configure(api_key=api_key)
-            print("[DEBUG] Gemini 설정 완료")
             
             # 사용 가능한 모델 목록 확인
             vision_model = None
             try:
-                print("[DEBUG] 사용 가능한 모델 목록 확인 중...")
-                available_models = []
-                for m in genai.list_models():
-                    if 'generateContent' in m.supported_generation_methods:
-                        available_models.append(m.name)
-                        print(f"[DEBUG] - {m.name}")
+                available_models = [
+                    m.name for m in genai.list_models()
+                    if 'generateContent' in m.supported_generation_methods
+                ]
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("사용 가능한 모델: %s", ', '.join(available_models))
                 
                 # 1순위: flash 모델 (무료)
                 for model_name in available_models:
                     if 'flash' in model_name.lower() and 'image' not in model_name.lower():
                         vision_model = model_name
-                        print(f"[DEBUG] Flash 모델 발견: {vision_model}")
                         break
                 
                 # 2순위: vision 모델
@@ -162,15 +171,14 @@ class ItemAnalyzer:
                     vision_model = available_models[0]
                     
             except Exception as e:
-                print(f"[WARNING] 모델 목록 조회 실패, 기본 모델 사용 시도: {e}")
+                logger.warning("모델 목록 조회 실패, 기본 모델 사용 시도: %s", e)
                 vision_model = 'gemini-pro-vision'
 
             if not vision_model:
                 raise ValueError("사용 가능한 모델을 찾을 수 없습니다")
             
-            print(f"[DEBUG] 선택된 모델: {vision_model}")
+            logger.debug("선택된 모델: %s", vision_model)
             model = genai.GenerativeModel(vision_model)
-            print("[DEBUG] 모델 초기화 완료")
             
             # 이미지 파일 읽기
             with open(image_path, 'rb') as f:
@@ -259,11 +267,9 @@ class ItemAnalyzer:
             }
             """
             
-            print("[DEBUG] Gemini API 호출 시작")
             response = model.generate_content([prompt, image_parts[0]])
             response.resolve()
             response_text = response.text
-            print("[DEBUG] Gemini API 응답 수신 완료")
             
             if response_text.endswith('```'):
                 response_text = response_text[:-3]
@@ -274,9 +280,9 @@ class ItemAnalyzer:
                 
             response_text = response_text.strip()
             
-            print(f"[DEBUG] JSON 파싱 전: {response_text[:200]}...")
+            logger.debug("JSON 파싱 전: %.200s", response_text)
             ai_result = json.loads(response_text)
-            print(f"[DEBUG] AI 분석 결과: {ai_result}")
+            logger.debug("AI 분석 결과: %s", ai_result)
 
             # item_name을 category로도 저장 (하위 호환성)
             if 'item_name' in ai_result and 'category' not in ai_result:
@@ -309,7 +315,6 @@ class ItemAnalyzer:
                             'percentage': 10.0
                         })
             
-            print("[DEBUG] AI 분석 성공!")
             return {
                 'success': True,
                 'colors': colors,
@@ -320,13 +325,11 @@ class ItemAnalyzer:
             
         except Exception as e:
             error_str = str(e)
-            print(f"[ERROR] AI 분석 실패: {type(e).__name__}: {error_str}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("AI 분석 실패: %s: %s", type(e).__name__, error_str)
 
             # API 할당량 초과 에러 확인
             if '429' in error_str or 'quota' in error_str.lower() or 'rate' in error_str.lower():
-                print("[ERROR] Gemini API 할당량 초과 - Pillow fallback 없이 에러 반환")
+                logger.error("Gemini API 할당량 초과 - Pillow fallback 없이 에러 반환")
                 return {
                     'success': False,
                     'error': 'API 할당량 초과',
@@ -460,21 +463,14 @@ class ItemAnalyzer:
             return '#E7E5E4'
 
         # 기본값 (회색)
-        print(f"[WARNING] 알 수 없는 색상: {color_name}, 회색으로 표시")
+        logger.warning("알 수 없는 색상: %s, 회색으로 표시", color_name)
         return '#6B7280'
     
     def analyze_image(self, image_path):
         """이미지 분석 메인 함수"""
         try:
-            # 이미지 열기
-            img = Image.open(image_path)
-            
-            # RGB로 변환
-            if img.mode != 'RGB':
-                img = img.convert('RGB')
-            
-            # 성능을 위해 리사이즈
-            img.thumbnail((200, 200))
+            # 축소 디코딩 후 RGB 변환
+            img = self.open_thumbnail(image_path)
             
             # 주요 색상 추출
             colors = self.extract_colors(img)
@@ -496,8 +492,79 @@ class ItemAnalyzer:
                 'colors': []
             }
     
+    def open_thumbnail(self, image_path, size=(200, 200)):
+        """
+        이미지를 size 이하 RGB 썸네일로 열기 (가능하면 원본 해상도 전체를 디코딩하지 않음)
+        - JPEG: draft 로 DCT 단계에서 1/2~1/8 축소 디코딩 후 축소, RGB 변환은 마지막에
+          (흑백/CMYK JPEG 을 먼저 convert 하면 원본 전체가 디코딩됨)
+        - 그 외: 축소 디코딩이 없으므로 알파/팔레트 이미지는 먼저 RGB 로 변환 (알파 리샘플링이 더 느림)
+        """
+        img = Image.open(image_path)
+        if img.format == 'JPEG':
+            img.draft('RGB', (size[0] * 2, size[1] * 2))
+        elif img.mode not in ('RGB', 'L'):
+            img = img.convert('RGB')
+
+        img.thumbnail(size, reducing_gap=2.0)
+        if img.mode != 'RGB':
+            img = img.convert('RGB')
+        return img
+
     def extract_colors(self, img, num_colors=3):
         """이미지에서 주요 색상 추출"""
+        if np is None:
+            return self._extract_colors_python(img, num_colors)
+
+        # 픽셀 버퍼 전체를 한 번에 양자화 -> 그룹 키(채널별 3비트, 9비트 정수)로 묶어 bincount
+        pixels = np.asarray(img if img.mode == 'RGB' else img.convert('RGB'), dtype=np.uint8).reshape(-1, 3)
+        total_pixels = len(pixels)
+        if not total_pixels:
+            return []
+
+        quantized = (pixels >> COLOR_QUANT_SHIFT).astype(np.uint16)
+        keys = (quantized[:, 0] << (2 * COLOR_QUANT_BITS)) | (quantized[:, 1] << COLOR_QUANT_BITS) | quantized[:, 2]
+        counts = np.bincount(keys, minlength=1 << (3 * COLOR_QUANT_BITS))
+
+        results = []
+        for key in self._top_color_keys(keys, counts, num_colors):
+            mask = (1 << COLOR_QUANT_BITS) - 1
+            color = (
+                int(key >> (2 * COLOR_QUANT_BITS)) << COLOR_QUANT_SHIFT,
+                int((key >> COLOR_QUANT_BITS) & mask) << COLOR_QUANT_SHIFT,
+                int(key & mask) << COLOR_QUANT_SHIFT,
+            )
+            results.append({
+                'rgb': color,
+                'hex': self.rgb_to_hex(color),
+                'percentage': round((int(counts[key]) / total_pixels) * 100, 1)
+            })
+
+        return results
+
+    def _top_color_keys(self, keys, counts, num_colors):
+        """픽셀 수 상위 num_colors 개 그룹 키 (동률은 이미지에서 먼저 나온 색 우선 - Counter.most_common 과 동일)"""
+        present = np.count_nonzero(counts)
+        num_colors = min(num_colors, present)
+        if num_colors <= 0:
+            return []
+
+        threshold = np.partition(counts, -num_colors)[-num_colors]
+        candidates = np.flatnonzero(counts >= threshold)
+
+        candidate_counts = counts[candidates]
+        if len(np.unique(candidate_counts)) == len(candidates):
+            return candidates[np.argsort(-candidate_counts)].tolist()
+
+        # 동률이 있으면 후보 색의 첫 등장 위치로 순서 결정
+        positions = np.flatnonzero(np.isin(keys, candidates))
+        candidate_keys, first_index = np.unique(keys[positions], return_index=True)
+        first_seen = dict(zip(candidate_keys.tolist(), positions[first_index].tolist()))
+
+        ordered = sorted(candidates.tolist(), key=lambda key: (-int(counts[key]), first_seen[key]))
+        return ordered[:num_colors]
+
+    def _extract_colors_python(self, img, num_colors=3):
+        """이미지에서 주요 색상 추출 (numpy 없을 때)"""
         # 픽셀 데이터 가져오기
         pixels = list(img.getdata())
         
@@ -1,3 +1,81 @@
-from django.test import TestCase
+from unittest import mock
+import os
+import random
+import tempfile
 
-# Create your tests here.
+from PIL import Image
+from django.test import SimpleTestCase
+
+from items import item_analyzer
+from items.item_analyzer import ItemAnalyzer
+
+
+def _image(width, height, palette, seed):
+    picker = random.Random(seed)
+    img = Image.new('RGB', (width, height))
+    img.putdata([picker.choice(palette) for _ in range(width * height)])
+    return img
+
+
+class ExtractColorsTest(SimpleTestCase):
+    """numpy 색상 추출이 기존 픽셀 루프와 같은 결과인지 테스트"""
+
+    def test_matches_python_implementation(self):
+        analyzer = ItemAnalyzer()
+        picker = random.Random(0)
+        images = [
+            _image(200, 150, [tuple(picker.randrange(256) for _ in range(3)) for _ in range(40)], seed)
+            for seed in range(5)
+        ]
+        # 동률: 같은 개수의 두 색 -> 먼저 나온 색이 앞
+        images.append(_image(10, 10, [(250, 10, 10), (10, 250, 10)], 1))
+        images.append(Image.new('RGB', (8, 8), (12, 200, 90)))
+
+        for img in images:
+            for num_colors in (1, 3, 5):
+                self.assertEqual(
+                    analyzer.extract_colors(img, num_colors),
+                    analyzer._extract_colors_python(img, num_colors),
+                )
+
+    def test_analyze_image_format(self):
+        img = _image(300, 300, [(200, 30, 30), (20, 20, 20)], 2)
+        with mock.patch.object(item_analyzer.Image, 'open', return_value=img):
+            result = ItemAnalyzer().analyze_image('item.jpg')
+
+        self.assertTrue(result['success'])
+        self.assertEqual(result['method'], 'pillow')
+        self.assertEqual({c['name'] for c in result['colors']}, {'red', 'black'})
+        self.assertEqual(set(result['dominant_color']), {'name', 'korean_name', 'hex', 'rgb', 'percentage'})
+        self.assertIsInstance(result['dominant_color']['rgb'][0], int)
+
+
+class OpenThumbnailTest(SimpleTestCase):
+    """축소 디코딩 썸네일 테스트"""
+
+    def test_non_rgb_sources_are_thumbnailed_to_rgb(self):
+        base = Image.new('RGB', (1600, 1200), (200, 120, 40))
+        analyzer = ItemAnalyzer()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for mode, ext in (('RGB', 'jpg'), ('L', 'jpg'), ('CMYK', 'jpg'), ('RGBA', 'png'), ('P', 'png')):
+                path = os.path.join(tmp_dir, f'item_{mode}.{ext}')
+                base.convert(mode).save(path)
+                img = analyzer.open_thumbnail(path)
+                self.assertEqual((img.mode, img.size), ('RGB', (200, 150)), mode)
+
+    def test_jpeg_is_decoded_at_reduced_scale(self):
+        """JPEG 은 원본 크기로 디코딩하지 않는지 (draft 후 RGB 변환) 테스트"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'gray.jpg')
+            Image.new('L', (3200, 2400), 128).save(path)
+            converted_sizes = []
+            original_convert = Image.Image.convert
+
+            def convert(img, *args, **kwargs):
+                converted_sizes.append(img.size)
+                return original_convert(img, *args, **kwargs)
+
+            with mock.patch.object(Image.Image, 'convert', convert):
+                ItemAnalyzer().open_thumbnail(path)
+        self.assertTrue(converted_sizes)
+        self.assertTrue(all(width <= 200 for width, _ in converted_sizes))
@@ -2,46 +2,22 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated, AllowAny
-from datetime import date, datetime, timedelta
+from datetime import date
 from django.conf import settings
 from django.core.cache import cache
-import requests
+import logging
 import random
-import json
-import os
-from .utils import get_korean_address
+from core import llm
+from .weather import WeatherService, parse_rain_amount, weather_icon
+from .catalogue import FOOD_COLOR_KEYWORDS, get_catalogue
 from .models import DailyRecommendation
-from config.weather_config import latlon_to_grid, get_weather_description, SKY_CODE, PTY_CODE
+from config.weather_config import get_weather_description, SKY_CODE, PTY_CODE
 
+logger = logging.getLogger(__name__)
 
-def summarize_fortune_with_llm(total_text: str, zodiac_sign: str, user_id: int = None) -> str:
-    """GMS GPT-5-nano를 사용해 종합운을 한 문장으로 요약"""
-    if not total_text:
-        print("[Fortune Summary] Empty total_text received")
-        return ''
-
-    # 캐시 키 생성 (오늘 날짜 + 별자리 + 유저ID 기반)
-    cache_key = f"fortune_summary_v2_{zodiac_sign}_{user_id}_{date.today()}"
-    cached_result = cache.get(cache_key)
-    if cached_result:
-        print(f"[Fortune Summary] Using cached result: {cached_result}")
-        return cached_result
-
-    # GMS API 설정 (OpenAI 모델용 URL 사용)
-    gms_api_key = getattr(settings, 'GMS_API_KEY', '')
-    gms_api_base = getattr(settings, 'GMS_OPENAI_BASE_URL', 'https://gms.ssafy.io/gmsapi/api.openai.com/v1')
 
-    print(f"[Fortune Summary] GMS API Key exists: {bool(gms_api_key)}, Base URL: {gms_api_base}")
-
-    if not gms_api_key:
-        print("[Fortune Summary] No GMS API key, using fallback")
-        return total_text.split('.')[0] + '.' if total_text else ''
-
-    try:
-        from openai import OpenAI
-        client = OpenAI(api_key=gms_api_key, base_url=gms_api_base)
-
-        prompt = f"""다음 오늘의 종합운세 텍스트를 읽고, 핵심 키워드를 뽑아서 **한 문장(30자 이내)**으로 요약해주세요.
+def _fortune_summary_prompt(total_text: str) -> str:
+    prompt = f"""다음 오늘의 종합운세 텍스트를 읽고, 핵심 키워드를 뽑아서 **한 문장(30자 이내)**으로 요약해주세요.
 
 종합운세:
 {total_text}
@@ -59,85 +35,110 @@ def summarize_fortune_with_llm(total_text: str, zodiac_sign: str, user_id: int =
 - "차분한 마음으로 중요한 결정을 내리세요"
 
 한 문장만 출력하세요:"""
+    return prompt
 
-        print(f"[Fortune Summary] Calling GMS API with gpt-5-nano...")
-        response = client.chat.completions.create(
-            model="gpt-5-nano",
-            messages=[{"role": "user", "content": prompt}],
-            max_completion_tokens=100
-        )
-        summary = response.choices[0].message.content.strip().strip('"').strip("'")
-        print(f"[Fortune Summary] GMS API success: {summary}")
+
+def _first_sentence(total_text: str) -> str:
+    """LLM 요약 실패 시 대체 문구 (종합운 첫 문장)"""
+    return total_text.split('.')[0] + '.' if total_text else ''
+
+
+def _fortune_summary_cache_key(zodiac_sign: str, user_id: int = None) -> str:
+    # 캐시 키 (오늘 날짜 + 별자리 + 유저ID 기반)
+    return f"fortune_summary_v2_{zodiac_sign}_{user_id}_{date.today()}"
+
+
+def _fortune_summary_params(total_text: str) -> dict:
+    return {
+        'model': "gpt-5-nano",
+        'messages': [{"role": "user", "content": _fortune_summary_prompt(total_text)}],
+        'max_completion_tokens': 100,
+    }
+
+
+def _clean_summary(text: str) -> str:
+    return text.strip().strip('"').strip("'")
+
+
+def summarize_fortune_with_llm(total_text: str, zodiac_sign: str, user_id: int = None) -> str:
+    """GMS GPT-5-nano를 사용해 종합운을 한 문장으로 요약"""
+    if not total_text:
+        return ''
+
+    cache_key = _fortune_summary_cache_key(zodiac_sign, user_id)
+    cached_result = cache.get(cache_key)
+    if cached_result:
+        return cached_result
+
+    # GMS API 설정 (OpenAI 모델용 URL 사용)
+    gms_api_key = getattr(settings, 'GMS_API_KEY', '')
+    gms_api_base = getattr(settings, 'GMS_OPENAI_BASE_URL', 'https://gms.ssafy.io/gmsapi/api.openai.com/v1')
+
+    if not gms_api_key:
+        logger.debug("GMS API 키 없음 - 첫 문장으로 요약")
+        return _first_sentence(total_text)
+
+    try:
+        # 공용 클라이언트 재사용, 동시 호출 한도 초과 시 LLMBusyError -> 첫 문장으로 대체
+        summary = _clean_summary(llm.chat_completion(
+            'fortune_summary', gms_api_key, gms_api_base, max_retries=0, **_fortune_summary_params(total_text)
+        ))
+        logger.debug("운세 요약 생성: %s", summary)
 
         # 캐시에 저장 (24시간)
         cache.set(cache_key, summary, 60 * 60 * 24)
 
         return summary
     except Exception as e:
-        print(f"[Fortune Summary LLM Error] {e}")
-        import traceback
-        traceback.print_exc()
+        logger.warning("운세 요약 LLM 오류: %s", e)
         # 실패 시 첫 문장 반환
-        fallback = total_text.split('.')[0] + '.' if total_text else ''
-        print(f"[Fortune Summary] Using fallback: {fallback}")
-        return fallback
+        return _first_sentence(total_text)
+
+
+async def asummarize_fortune_with_llm(total_text: str, zodiac_sign: str, user_id: int = None) -> str:
+    """summarize_fortune_with_llm 의 비동기 버전 (ASGI 뷰용)"""
+    if not total_text:
+        return ''
+
+    cache_key = _fortune_summary_cache_key(zodiac_sign, user_id)
+    cached_result = await cache.aget(cache_key)
+    if cached_result:
+        return cached_result
+
+    gms_api_key = getattr(settings, 'GMS_API_KEY', '')
+    gms_api_base = getattr(settings, 'GMS_OPENAI_BASE_URL', 'https://gms.ssafy.io/gmsapi/api.openai.com/v1')
+    if not gms_api_key:
+        return _first_sentence(total_text)
+
+    try:
+        summary = _clean_summary(await llm.achat_completion(
+            'fortune_summary', gms_api_key, gms_api_base, max_retries=0, **_fortune_summary_params(total_text)
+        ))
+        await cache.aset(cache_key, summary, 60 * 60 * 24)
+        return summary
+    except Exception as e:
+        logger.warning("운세 요약 LLM 오류: %s", e)
+        return _first_sentence(total_text)
 
 
 def load_ootd_data(gender=None):
-    """ootd.json 파일 로드 (성별에 따라 다른 파일)"""
-    # 성별에 따른 파일 선택
-    if gender == 'M':
-        filenames = ['ootd_male.json', 'ootd.json']
-    elif gender == 'F':
-        filenames = ['ootd_female.json', 'ootd.json']
-    else:
-        filenames = ['ootd.json']
-
-    for filename in filenames:
-        possible_paths = [
-            os.path.join(settings.BASE_DIR, filename),
-            os.path.join(settings.BASE_DIR, 'data', filename),
-        ]
-        for json_path in possible_paths:
-            if os.path.exists(json_path):
-                try:
-                    with open(json_path, 'r', encoding='utf-8') as f:
-                        return json.load(f)
-                except Exception:
-                    pass
-    return []
+    """ootd 데이터 (성별에 따라 다른 파일, 프로세스 전역 카탈로그에서 조회)"""
+    return list(get_catalogue().ootd_items(gender))
 
 
 def load_food_data():
-    """food.json 파일 로드 (인기 음식 75종)"""
-    possible_paths = [
-        os.path.join(settings.BASE_DIR, 'food.json'),
-        os.path.join(settings.BASE_DIR, 'data', 'food.json'),
-    ]
-    for json_path in possible_paths:
-        if os.path.exists(json_path):
-            try:
-                with open(json_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except Exception:
-                pass
-    return []
+    """food.json 데이터 (인기 음식 75종, 프로세스 전역 카탈로그에서 조회)"""
+    return list(get_catalogue().foods)
 
 
 def get_clothes_by_temp_and_category(temp, category, weather_condition="맑음", gender=None):
     """온도와 카테고리에 맞는 옷 필터링 (성별 반영)"""
-    ootd_data = load_ootd_data(gender)
-    matching_clothes = []
-    for item in ootd_data:
-        if item.get('category') != category:
-            continue
-        min_temp = item.get('min_temp', -50)
-        max_temp = item.get('max_temp', 50)
-        weather_conditions = item.get('weather_conditions', [])
-        if min_temp <= temp <= max_temp:
-            if not weather_conditions or weather_condition in weather_conditions:
-                matching_clothes.append(item)
-    return matching_clothes
+    return get_catalogue().clothes(temp, category, weather_condition, gender)
+
+
+def get_clothes_by_temp_range_and_category(temp_min, temp_max, category, weather_condition="맑음", gender=None):
+    """오늘 최저~최고 기온 중 어느 온도에서든 맞는 옷 필터링 (성별 반영)"""
+    return get_catalogue().clothes_for_range(temp_min, temp_max, category, weather_condition, gender)
 
 
 def get_lucky_color_korean_to_ootd(lucky_color):
@@ -167,20 +168,24 @@ def get_lucky_color_korean_to_ootd(lucky_color):
 
 
 def get_fortune_data_for_user(user):
-    """사용자 운세 데이터 계산"""
-    from fortune.services import FortuneCalculator
-    if not user.birth_date:
-        return None
-    calculator = FortuneCalculator()
-    return calculator.calculate_fortune(
-        birth_date=user.birth_date,
-        gender=user.gender,
-        birth_time=getattr(user, 'birth_time', None),
-        chinese_name=getattr(user, 'chinese_name', None),
-        calendar_type=getattr(user, 'calendar_type', 'solar'),
-        user_id=user.id,
-        session_key=None
-    )
+    """사용자 오늘 운세 데이터 (운세 생성/아이템 체크와 같은 read-through 캐시 공유)"""
+    from fortune.api_views import get_today_fortune
+    return get_today_fortune(user)
+
+
+def get_saved_recommendation(user, recommendation_type, recommendation_date):
+    """오늘 저장된 추천 (user+날짜 인덱스 한 번 조회, 응답에 필요한 컬럼만)"""
+    return DailyRecommendation.objects.filter(
+        user=user,
+        recommendation_date=recommendation_date,
+        recommendation_type=recommendation_type
+    ).only('recommendation_data', 'weather_data', 'fortune_context').first()
+
+
+def backfill_fortune_context(recommendation, fortune_context):
+    """fortune_context 없이 저장된 기존 추천에 운세 요약 채우기 (다음 조회부터 빠른 경로)"""
+    recommendation.fortune_context = fortune_context
+    recommendation.save(update_fields=['fortune_context'])
 
 
 class OOTDRecommendationAPIView(APIView):
@@ -188,6 +193,16 @@ class OOTDRecommendationAPIView(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
+        today = date.today()
+
+        # 오늘 추천이 이미 있으면 저장된 추천/날씨/운세 요약으로 바로 응답 (운세/날씨 조회 없음)
+        saved = get_saved_recommendation(request.user, 'OOTD', today)
+        # 날씨 조회 실패로 기본 날씨가 저장된 추천은 하루 내내 쓰지 않고 다시 조회
+        weather_failed = bool(saved and (saved.weather_data or {}).get('fallback'))
+        if saved and saved.fortune_context and not weather_failed:
+            weather_data = self._apply_test_temp(request, dict(saved.weather_data))
+            return self._response(weather_data, saved.fortune_context, saved.recommendation_data, today)
+
         # 운세 데이터 가져오기
         fortune_data = get_fortune_data_for_user(request.user)
         if not fortune_data:
@@ -196,10 +211,42 @@ class OOTDRecommendationAPIView(APIView):
                 'error': '생년월일 정보가 없습니다.'
             }, status=status.HTTP_400_BAD_REQUEST)
 
+        fortune_context = {
+            'lucky_colors': fortune_data.get('lucky_colors', [])[:3],  # 행운색
+            'fortune_summary': fortune_data.get('overall_fortune', {}).get('summary', ''),  # 운세 요약 (한줄)
+        }
+
+        if saved and not weather_failed:
+            # 운세 요약 없이 저장된 기존 추천 - 저장된 추천 사용, 운세 요약만 채움
+            backfill_fortune_context(saved, fortune_context)
+            weather_data = saved.weather_data or self._get_weather_info(request)
+            return self._response(self._apply_test_temp(request, dict(weather_data)), fortune_context, saved.recommendation_data, today)
+
         # 날씨 정보 가져오기
-        weather_data = self._get_weather_info(request)
+        weather_data = self._apply_test_temp(request, self._get_weather_info(request))
+
+        # 새로 생성하고 DB에 저장 (성별 반영)
+        outfit = self._generate_ootd(weather_data, fortune_context['lucky_colors'], getattr(request.user, 'gender', None))
+        if saved:
+            # 기본 날씨로 만든 추천을 새 날씨 기준으로 덮어씀 (이번에도 실패면 다음 조회에서 다시 시도)
+            saved.recommendation_data = outfit
+            saved.weather_data = weather_data
+            saved.fortune_context = fortune_context
+            saved.save(update_fields=['recommendation_data', 'weather_data', 'fortune_context'])
+            return self._response(weather_data, fortune_context, outfit, today)
+
+        DailyRecommendation.objects.create(
+            user=request.user,
+            recommendation_date=today,
+            recommendation_type='OOTD',
+            recommendation_data=outfit,
+            weather_data=weather_data,
+            fortune_context=fortune_context
+        )
+        return self._response(weather_data, fortune_context, outfit, today)
 
-        # 테스트용 온도 오버라이드
+    def _apply_test_temp(self, request, weather_data):
+        """테스트용 온도 오버라이드 (?test_temp=)"""
         test_temp = request.query_params.get('test_temp')
         if test_temp:
             try:
@@ -209,43 +256,14 @@ class OOTDRecommendationAPIView(APIView):
                 weather_data['temp_min'] = temp - 3
             except ValueError:
                 pass
+        return weather_data
 
-        # 행운색
-        lucky_colors = fortune_data.get('lucky_colors', [])[:3]
-
-        # 운세 요약 (한줄)
-        fortune_summary = fortune_data.get('overall_fortune', {}).get('summary', '')
-
-        # 오늘 날짜로 기존 추천이 있는지 확인
-        today = date.today()
-        existing_recommendation = DailyRecommendation.objects.filter(
-            user=request.user,
-            recommendation_date=today,
-            recommendation_type='OOTD'
-        ).first()
-
-        # 사용자 성별 가져오기
-        user_gender = getattr(request.user, 'gender', None)
-
-        if existing_recommendation:
-            # 기존 추천이 있으면 DB에서 가져오기
-            outfit = existing_recommendation.recommendation_data
-        else:
-            # 새로 생성하고 DB에 저장 (성별 반영)
-            outfit = self._generate_ootd(weather_data, lucky_colors, user_gender)
-            DailyRecommendation.objects.create(
-                user=request.user,
-                recommendation_date=today,
-                recommendation_type='OOTD',
-                recommendation_data=outfit,
-                weather_data=weather_data
-            )
-
+    def _response(self, weather_data, fortune_context, outfit, today):
         return Response({
             'success': True,
             'weather': weather_data,
-            'lucky_colors': lucky_colors,
-            'fortune_summary': fortune_summary,
+            'lucky_colors': fortune_context.get('lucky_colors', []),
+            'fortune_summary': fortune_context.get('fortune_summary', ''),
             'outfit': outfit,
             'date': str(today)
         })
@@ -256,216 +274,47 @@ class OOTDRecommendationAPIView(APIView):
         lon = float(request.query_params.get('lon', 127.3565))
         api_key = settings.KMA_API_KEY
 
-        # 디버그: API 키 확인
-        print(f"[KMA OOTD DEBUG] API Key exists: {bool(api_key)}, Key length: {len(api_key) if api_key else 0}")
-        print(f"[KMA OOTD DEBUG] lat={lat}, lon={lon}")
-
-        # 위경도 -> 격자 좌표 변환
-        nx, ny = latlon_to_grid(lat, lon)
-        print(f"[KMA OOTD DEBUG] Grid coords: nx={nx}, ny={ny}")
-
-        # 기상청 API용 시간 계산 (base_time: 0200, 0500, 0800, 1100, 1400, 1700, 2000, 2300)
-        # 한국 시간(KST = UTC+9) 사용
-        import pytz
-        kst = pytz.timezone('Asia/Seoul')
-        now = datetime.now(kst)
-        base_times = ['0200', '0500', '0800', '1100', '1400', '1700', '2000', '2300']
-        current_hour = now.hour * 100 + now.minute
-
-        print(f"[KMA OOTD DEBUG] Current KST time: {now.strftime('%Y-%m-%d %H:%M:%S')}")
-
-        # 현재 시간보다 이전의 가장 가까운 base_time 찾기 (API는 발표시간+10분 후 제공)
-        base_time = '2300'
-        base_date = now - timedelta(days=1)
-        for bt in base_times:
-            # 발표시간 + 10분 이후에 데이터 사용 가능
-            available_time = int(bt) + 10
-            if current_hour >= available_time:
-                base_time = bt
-                base_date = now
-
-        base_date_str = base_date.strftime('%Y%m%d')
-        print(f"[KMA OOTD DEBUG] base_date={base_date_str}, base_time={base_time}")
-
         try:
-            # 단기예보 API 호출
-            url = "http://apis.data.go.kr/1360000/VilageFcstInfoService_2.0/getVilageFcst"
-            params = {
-                'serviceKey': api_key,
-                'numOfRows': 300,
-                'pageNo': 1,
-                'dataType': 'JSON',
-                'base_date': base_date_str,
-                'base_time': base_time,
-                'nx': nx,
-                'ny': ny
-            }
-
-            print(f"[KMA OOTD DEBUG] Calling API...")
-            print(f"[KMA OOTD DEBUG] Request URL: {url}")
-            print(f"[KMA OOTD DEBUG] Request params (without key): base_date={base_date_str}, base_time={base_time}, nx={nx}, ny={ny}")
-            response = requests.get(url, params=params, timeout=10)
-            print(f"[KMA OOTD DEBUG] Response status: {response.status_code}")
-            print(f"[KMA OOTD DEBUG] Response content (first 500 chars): {response.text[:500]}")
-
-            try:
-                data = response.json()
-            except Exception as json_err:
-                print(f"[KMA OOTD DEBUG] JSON parse error: {json_err}")
-                print(f"[KMA OOTD DEBUG] Full response: {response.text}")
-                raise Exception(f"JSON parse error: {json_err}")
-
-            # 디버그: API 응답 구조 확인
-            result_code = data.get('response', {}).get('header', {}).get('resultCode', 'N/A')
-            result_msg = data.get('response', {}).get('header', {}).get('resultMsg', 'N/A')
-            print(f"[KMA OOTD DEBUG] API Result: code={result_code}, msg={result_msg}")
-
-            # 주소 가져오기
-            korean_address = get_korean_address(lat, lon)
-            city_name = korean_address if korean_address else '대전 유성구'
-
-            # 응답 파싱
-            items = data.get('response', {}).get('body', {}).get('items', {}).get('item', [])
-
-            if not items:
-                raise Exception("No weather data")
-
-            # 데이터 정리 (시간별로 그룹화)
-            weather_by_time = {}
-            for item in items:
-                fcst_date = item['fcstDate']
-                fcst_time = item['fcstTime']
-                category = item['category']
-                value = item['fcstValue']
-                key = f"{fcst_date}_{fcst_time}"
-
-                if key not in weather_by_time:
-                    weather_by_time[key] = {}
-                weather_by_time[key][category] = value
-
-            # 현재 시간에 가장 가까운 데이터 찾기
-            current_key = None
-            current_time_str = now.strftime('%Y%m%d_%H00')
-            for key in sorted(weather_by_time.keys()):
-                if key >= current_time_str:
-                    current_key = key
-                    break
-            if not current_key and weather_by_time:
-                current_key = sorted(weather_by_time.keys())[0]
-
-            current_data = weather_by_time.get(current_key, {})
-
-            # 오늘 최고/최저 기온 계산
-            today_str = now.strftime('%Y%m%d')
-            today_temps = []
-            for key, values in weather_by_time.items():
-                if key.startswith(today_str) and 'TMP' in values:
-                    try:
-                        today_temps.append(float(values['TMP']))
-                    except:
-                        pass
-
-            temp = float(current_data.get('TMP', 15))
-            temp_max = max(today_temps) if today_temps else temp + 3
-            temp_min = min(today_temps) if today_temps else temp - 3
-
-            # 날씨 설명 생성
-            sky = current_data.get('SKY', '1')
-            pty = current_data.get('PTY', '0')
-            description = get_weather_description(sky, pty)
-
-            # 습도
-            humidity = int(current_data.get('REH', 50))
-
-            # 강수확률과 강수량
-            rain_probability = int(current_data.get('POP', 0))
-            rain_amount_str = current_data.get('PCP', '강수없음')
-            if rain_amount_str == '강수없음':
-                rain_amount = 0
-            elif rain_amount_str == '1mm 미만':
-                rain_amount = 0.5
-            else:
-                try:
-                    rain_amount = float(rain_amount_str.replace('mm', ''))
-                except:
-                    rain_amount = 0
-
-            # 풍속
-            wind_speed = float(current_data.get('WSD', 0))
+            # 예보(같은 격자/발표 시각은 날씨 API와 공유)와 주소를 동시에 조회
+            lookup = WeatherService(api_key).lookup(lat, lon)
+            city_name = lookup.city if lookup.city else '대전 유성구'
+            weather = lookup.result()
 
+            current = weather.current
+            humidity = current.reh if current.reh is not None else 50
             weather_data = {
-                'temp': round(temp, 1),
-                'temp_max': round(temp_max),
-                'temp_min': round(temp_min),
-                'description': description,
+                'temp': round(weather.temp, 1),
+                'temp_max': round(weather.temp_max),
+                'temp_min': round(weather.temp_min),
+                'description': weather.description,
                 'humidity': humidity,
                 'city': city_name,
                 'current': {
-                    'rain_probability': rain_probability,
-                    'wind_speed': wind_speed,
-                    'rain_amount': rain_amount
+                    'rain_probability': current.pop,
+                    'wind_speed': current.wsd,
+                    'rain_amount': current.rain_amount
                 }
             }
 
             # 시간별 예보 (12시간)
-            hourly_forecast = []
-            sorted_keys = sorted(weather_by_time.keys())
-            start_idx = 0
-            for i, key in enumerate(sorted_keys):
-                if key >= current_time_str:
-                    start_idx = i
-                    break
-
-            for key in sorted_keys[start_idx:start_idx + 12]:
-                data = weather_by_time[key]
-                fcst_time = key.split('_')[1]
-                hour_str = f"{fcst_time[:2]}시"
-
-                sky_val = data.get('SKY', '1')
-                pty_val = data.get('PTY', '0')
-                weather_desc = get_weather_description(sky_val, pty_val)
-
-                # 아이콘 매핑 (기상청 코드 -> 간단한 아이콘)
-                if pty_val in ['1', '2', '4', '5', '6']:
-                    icon = '🌧️'
-                elif pty_val in ['3', '7']:
-                    icon = '🌨️'
-                elif sky_val == '1':
-                    icon = '☀️'
-                elif sky_val == '3':
-                    icon = '⛅'
-                else:
-                    icon = '☁️'
-
-                pop = int(data.get('POP', 0))
-                pcp_str = data.get('PCP', '강수없음')
-                if pcp_str == '강수없음':
-                    pcp = 0
-                elif pcp_str == '1mm 미만':
-                    pcp = 0.5
-                else:
-                    try:
-                        pcp = float(pcp_str.replace('mm', ''))
-                    except:
-                        pcp = 0
-
-                hourly_forecast.append({
-                    'time': hour_str,
-                    'temp': round(float(data.get('TMP', temp)), 1),
-                    'weather': weather_desc,
-                    'icon': icon,
-                    'sky': int(sky_val),  # 하늘상태: 1=맑음, 3=구름많음, 4=흐림
-                    'pty': int(pty_val),  # 강수형태: 0=없음, 1=비, 2=비/눈, 3=눈, 4=소나기
-                    'rain_probability': pop,
-                    'rain_amount': round(pcp, 1),
-                    'humidity': int(data.get('REH', humidity))
-                })
-
-            weather_data['hourly'] = hourly_forecast
+            weather_data['hourly'] = [
+                {
+                    'time': record.hour_label,
+                    'temp': round(record.tmp if record.tmp is not None else weather.temp, 1),
+                    'weather': get_weather_description(record.sky, record.pty),
+                    'icon': weather_icon(record.sky, record.pty),
+                    'sky': int(record.sky),  # 하늘상태: 1=맑음, 3=구름많음, 4=흐림
+                    'pty': int(record.pty),  # 강수형태: 0=없음, 1=비, 2=비/눈, 3=눈, 4=소나기
+                    'rain_probability': record.pop,
+                    'rain_amount': round(record.rain_amount, 1),
+                    'humidity': record.reh if record.reh is not None else humidity
+                }
+                for record in weather.hourly
+            ]
             return weather_data
 
         except Exception as e:
-            print(f"[KMA API Error] {e}")
+            logger.warning("OOTD 날씨 조회 실패: %s", e)
             return {
                 'temp': 15,
                 'temp_max': 18,
@@ -478,7 +327,8 @@ class OOTDRecommendationAPIView(APIView):
                     'wind_speed': 0,
                     'rain_amount': 0
                 },
-                'hourly': []
+                'hourly': [],
+                'fallback': True  # 기본값 표시 (저장된 추천을 다음 조회에서 다시 만듦)
             }
 
     def _generate_ootd(self, weather, lucky_colors, gender=None):
@@ -499,7 +349,12 @@ class OOTDRecommendationAPIView(APIView):
         tops = get_clothes_by_temp_and_category(current_temp, '상의', weather_condition, gender)
         bottoms = get_clothes_by_temp_and_category(current_temp, '하의', weather_condition, gender)
         outers = get_clothes_by_temp_and_category(current_temp, '아우터', weather_condition, gender)
-        accessories = get_clothes_by_temp_and_category(current_temp, '액세서리', weather_condition, gender)
+        # 액세서리는 하루 기온 범위 전체 기준 (아침/저녁 추위용 머플러, 장갑 등)
+        accessories = get_clothes_by_temp_range_and_category(
+            min(weather.get('temp_min', current_temp), current_temp),
+            max(weather.get('temp_max', current_temp), current_temp),
+            '액세서리', weather_condition, gender
+        )
 
         # 행운색 변환
         lucky_color_variants = []
@@ -591,6 +446,13 @@ class MenuRecommendationAPIView(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
+        today = date.today()
+
+        # 오늘 추천이 이미 있으면 저장된 추천/운세 요약으로 바로 응답 (운세 계산/LLM 요약 없음)
+        saved = get_saved_recommendation(request.user, 'MENU', today)
+        if saved and saved.fortune_context:
+            return self._response(saved.recommendation_data, saved.fortune_context, today)
+
         # 운세 데이터 가져오기
         fortune_data = get_fortune_data_for_user(request.user)
         if not fortune_data:
@@ -600,122 +462,103 @@ class MenuRecommendationAPIView(APIView):
             }, status=status.HTTP_400_BAD_REQUEST)
 
         lucky_color = fortune_data.get('lucky_colors', ['노란색'])[0]
-        lucky_colors = fortune_data.get('lucky_colors', [])[:3]
         zodiac_sign = fortune_data.get('zodiac_sign', '')
 
         # fortune_texts에서 종합운(total) 가져오기
         fortune_texts = fortune_data.get('fortune_texts', {})
         total_text = fortune_texts.get('total', '')
-        # LLM으로 종합운 한줄 요약 생성 (유저ID 포함하여 캐시 분리)
-        fortune_summary = summarize_fortune_with_llm(total_text, zodiac_sign, request.user.id)
+        fortune_context = {
+            'lucky_color': lucky_color,
+            'lucky_colors': fortune_data.get('lucky_colors', [])[:3],
+            # LLM으로 종합운 한줄 요약 생성 (유저ID 포함하여 캐시 분리)
+            'fortune_summary': summarize_fortune_with_llm(total_text, zodiac_sign, request.user.id),
+        }
 
-        # 오늘 날짜로 기존 추천이 있는지 확인
-        today = date.today()
-        existing_recommendation = DailyRecommendation.objects.filter(
-            user=request.user,
-            recommendation_date=today,
-            recommendation_type='MENU'
-        ).first()
-
-        if existing_recommendation:
-            # 기존 추천이 있으면 DB에서 가져오기
-            saved_data = existing_recommendation.recommendation_data
-            recommendations = saved_data.get('recommendations', [])
-            other_recommendations = saved_data.get('other_recommendations', [])
+        if saved:
+            # 운세 요약 없이 저장된 기존 추천 - 저장된 추천 사용, 운세 요약만 채움
+            backfill_fortune_context(saved, fortune_context)
+            return self._response(saved.recommendation_data, fortune_context, today)
+
+        # 새로 생성
+        all_foods = load_food_data()
+        matching_foods = self._get_food_by_color(lucky_color)
+
+        # 추천 음식 선택
+        if len(matching_foods) >= 2:
+            recommended_list = random.sample(matching_foods, 2)
+        elif len(matching_foods) == 1:
+            recommended_list = matching_foods
         else:
-            # 새로 생성
-            all_foods = load_food_data()
-            matching_foods = self._get_food_by_color(lucky_color, all_foods)
-
-            # 추천 음식 선택
-            if len(matching_foods) >= 2:
-                recommended_list = random.sample(matching_foods, 2)
-            elif len(matching_foods) == 1:
-                recommended_list = matching_foods
-            else:
-                recommended_list = random.sample(all_foods, min(2, len(all_foods)))
-
-            # 추천 형식화
-            recommendations = []
-            for idx, food in enumerate(recommended_list, 1):
-                recommendations.append({
-                    'rank': idx,
-                    'color': lucky_color,
-                    'menu': {
-                        'name': food.get('name_ko', ''),
-                        'category': food.get('type', '기타'),
-                        'icon': self._get_emoji_for_food(food),
-                        'desc': food.get('desc', f"행운의 {lucky_color} 에너지를 담은 음식입니다.")
-                    },
-                    'bg_gradient': self._get_gradient_for_color(lucky_color)
-                })
-
-            # 다른 추천
-            recommended_ids = [f.get('id') for f in recommended_list]
-            other_foods = [f for f in all_foods if f.get('id') not in recommended_ids]
-            other_list = random.sample(other_foods, min(6, len(other_foods))) if other_foods else []
-
-            other_recommendations = [
-                {
-                    'color': self._get_korean_color(food.get('color_category', '')),
-                    'menu': {
-                        'name': food.get('name_ko', ''),
-                        'category': food.get('type', '기타'),
-                        'icon': self._get_emoji_for_food(food),
-                    }
-                }
-                for food in other_list
-            ]
+            recommended_list = random.sample(all_foods, min(2, len(all_foods)))
+
+        # 추천 형식화
+        recommendations = []
+        for idx, food in enumerate(recommended_list, 1):
+            recommendations.append({
+                'rank': idx,
+                'color': lucky_color,
+                'menu': {
+                    'name': food.get('name_ko', ''),
+                    'category': food.get('type', '기타'),
+                    'icon': self._get_emoji_for_food(food),
+                    'desc': food.get('desc', f"행운의 {lucky_color} 에너지를 담은 음식입니다.")
+                },
+                'bg_gradient': self._get_gradient_for_color(lucky_color)
+            })
 
-            # DB에 저장
-            DailyRecommendation.objects.create(
-                user=request.user,
-                recommendation_date=today,
-                recommendation_type='MENU',
-                recommendation_data={
-                    'recommendations': recommendations,
-                    'other_recommendations': other_recommendations
+        # 다른 추천
+        recommended_ids = [f.get('id') for f in recommended_list]
+        other_foods = [f for f in all_foods if f.get('id') not in recommended_ids]
+        other_list = random.sample(other_foods, min(6, len(other_foods))) if other_foods else []
+
+        other_recommendations = [
+            {
+                'color': self._get_korean_color(food.get('color_category', '')),
+                'menu': {
+                    'name': food.get('name_ko', ''),
+                    'category': food.get('type', '기타'),
+                    'icon': self._get_emoji_for_food(food),
                 }
-            )
+            }
+            for food in other_list
+        ]
 
+        # DB에 저장
+        recommendation_data = {
+            'recommendations': recommendations,
+            'other_recommendations': other_recommendations
+        }
+        DailyRecommendation.objects.create(
+            user=request.user,
+            recommendation_date=today,
+            recommendation_type='MENU',
+            recommendation_data=recommendation_data,
+            fortune_context=fortune_context
+        )
+        return self._response(recommendation_data, fortune_context, today)
+
+    def _response(self, recommendation_data, fortune_context, today):
         return Response({
             'success': True,
-            'lucky_color': lucky_color,
-            'recommendations': recommendations,
-            'other_recommendations': other_recommendations,
+            'lucky_color': fortune_context.get('lucky_color', '노란색'),
+            'recommendations': recommendation_data.get('recommendations', []),
+            'other_recommendations': recommendation_data.get('other_recommendations', []),
             'fortune_data': {
-                'lucky_colors': lucky_colors,
-                'fortune_summary': fortune_summary,
+                'lucky_colors': fortune_context.get('lucky_colors', []),
+                'fortune_summary': fortune_context.get('fortune_summary', ''),
             },
             'date': str(today)
         })
 
-    def _get_food_by_color(self, lucky_color, foods):
-        """행운색에 맞는 음식 필터링"""
-        color_mapping = {
-            '노란색': ['yellow', 'gold', 'amber'],
-            '베이지색': ['beige', 'tan', 'cream'],
-            '검은색': ['black', 'dark'],
-            '빨간색': ['red', 'crimson'],
-            '주황색': ['orange', 'coral'],
-            '초록색': ['green', 'lime'],
-            '파란색': ['blue', 'navy', 'cyan'],
-            '보라색': ['purple', 'violet'],
-            '흰색': ['white', 'ivory', 'cream'],
-            '분홍색': ['pink', 'rose'],
-            '갈색': ['brown', 'chocolate'],
-            '회색': ['gray', 'grey', 'silver'],
-            '금색': ['gold', 'golden'],
-        }
-        target_keywords = color_mapping.get(lucky_color, [lucky_color.lower()])
-        matching = []
-        for food in foods:
-            food_color = food.get('color_category', '').lower()
-            for keyword in target_keywords:
-                if keyword in food_color:
-                    matching.append(food)
-                    break
-        return matching
+    def _get_food_by_color(self, lucky_color, foods=None):
+        """행운색에 맞는 음식 필터링 (foods 를 주면 그 목록에서, 아니면 카탈로그 인덱스 사용)"""
+        if foods is None:
+            return get_catalogue().foods_by_color(lucky_color)
+        target_keywords = FOOD_COLOR_KEYWORDS.get(lucky_color, [lucky_color.lower()])
+        return [
+            food for food in foods
+            if any(keyword in food.get('color_category', '').lower() for keyword in target_keywords)
+        ]
 
     def _get_emoji_for_food(self, food):
         """음식별 이모지 반환 (food.json에서 직접 가져오기)"""
@@ -772,184 +615,40 @@ class WeatherAPIView(APIView):
         lon = float(request.query_params.get('lon', 127.3565))
         api_key = settings.KMA_API_KEY
 
-        # 디버그: API 키 확인
-        print(f"[KMA DEBUG] API Key exists: {bool(api_key)}, Key length: {len(api_key) if api_key else 0}")
-        print(f"[KMA DEBUG] lat={lat}, lon={lon}")
-
-        # 위경도 -> 격자 좌표 변환
-        nx, ny = latlon_to_grid(lat, lon)
-        print(f"[KMA DEBUG] Grid coords: nx={nx}, ny={ny}")
-
-        # 기상청 API용 시간 계산 (한국 시간 사용)
-        import pytz
-        kst = pytz.timezone('Asia/Seoul')
-        now = datetime.now(kst)
-        base_times = ['0200', '0500', '0800', '1100', '1400', '1700', '2000', '2300']
-        current_hour = now.hour * 100 + now.minute
-
-        print(f"[KMA DEBUG] Current KST time: {now.strftime('%Y-%m-%d %H:%M:%S')}")
-
-        base_time = '2300'
-        base_date = now - timedelta(days=1)
-        for bt in base_times:
-            available_time = int(bt) + 10
-            if current_hour >= available_time:
-                base_time = bt
-                base_date = now
-
-        base_date_str = base_date.strftime('%Y%m%d')
-        print(f"[KMA DEBUG] base_date={base_date_str}, base_time={base_time}")
-
         try:
-            # 단기예보 API 호출
-            url = "http://apis.data.go.kr/1360000/VilageFcstInfoService_2.0/getVilageFcst"
-            params = {
-                'serviceKey': api_key,
-                'numOfRows': 300,
-                'pageNo': 1,
-                'dataType': 'JSON',
-                'base_date': base_date_str,
-                'base_time': base_time,
-                'nx': nx,
-                'ny': ny
-            }
-
-            print(f"[KMA DEBUG] Calling API...")
-            print(f"[KMA DEBUG] Request URL: {url}")
-            print(f"[KMA DEBUG] Request params (without key): base_date={base_date_str}, base_time={base_time}, nx={nx}, ny={ny}")
-            response = requests.get(url, params=params, timeout=10)
-            print(f"[KMA DEBUG] Response status: {response.status_code}")
-            print(f"[KMA DEBUG] Response content (first 500 chars): {response.text[:500]}")
-
-            try:
-                data = response.json()
-            except Exception as json_err:
-                print(f"[KMA DEBUG] JSON parse error: {json_err}")
-                print(f"[KMA DEBUG] Full response: {response.text}")
-                raise Exception(f"JSON parse error: {json_err}")
-
-            # 디버그: API 응답 구조 확인
-            result_code = data.get('response', {}).get('header', {}).get('resultCode', 'N/A')
-            result_msg = data.get('response', {}).get('header', {}).get('resultMsg', 'N/A')
-            print(f"[KMA DEBUG] API Result: code={result_code}, msg={result_msg}")
-
-            # 주소 가져오기
-            korean_address = get_korean_address(lat, lon)
-            city_name = korean_address if korean_address else '대전 유성구'
-
-            # 응답 파싱
-            items = data.get('response', {}).get('body', {}).get('items', {}).get('item', [])
-
-            if not items:
-                raise Exception("No weather data")
-
-            # 데이터 정리
-            weather_by_time = {}
-            for item in items:
-                fcst_date = item['fcstDate']
-                fcst_time = item['fcstTime']
-                category = item['category']
-                value = item['fcstValue']
-                key = f"{fcst_date}_{fcst_time}"
-
-                if key not in weather_by_time:
-                    weather_by_time[key] = {}
-                weather_by_time[key][category] = value
-
-            # 현재 시간에 가장 가까운 데이터
-            current_key = None
-            current_time_str = now.strftime('%Y%m%d_%H00')
-            for key in sorted(weather_by_time.keys()):
-                if key >= current_time_str:
-                    current_key = key
-                    break
-            if not current_key and weather_by_time:
-                current_key = sorted(weather_by_time.keys())[0]
-
-            current_data = weather_by_time.get(current_key, {})
-
-            # 오늘 최고/최저 기온
-            today_str = now.strftime('%Y%m%d')
-            today_temps = []
-            for key, values in weather_by_time.items():
-                if key.startswith(today_str) and 'TMP' in values:
-                    try:
-                        today_temps.append(float(values['TMP']))
-                    except:
-                        pass
-
-            temp = float(current_data.get('TMP', 15))
-            temp_max = max(today_temps) if today_temps else temp + 3
-            temp_min = min(today_temps) if today_temps else temp - 3
-
-            sky = current_data.get('SKY', '1')
-            pty = current_data.get('PTY', '0')
-            description = get_weather_description(sky, pty)
-
-            # 아이콘 매핑
-            if pty in ['1', '2', '4', '5', '6']:
-                icon = '🌧️'
-            elif pty in ['3', '7']:
-                icon = '🌨️'
-            elif sky == '1':
-                icon = '☀️'
-            elif sky == '3':
-                icon = '⛅'
-            else:
-                icon = '☁️'
+            # 예보(같은 격자/발표 시각은 OOTD 추천과 공유)와 주소를 동시에 조회
+            lookup = WeatherService(api_key).lookup(lat, lon)
+            city_name = lookup.city if lookup.city else '대전 유성구'
+            weather = lookup.result()
 
+            current = weather.current
             current_weather = {
-                'temp': round(temp, 1),
-                'temp_max': round(temp_max),
-                'temp_min': round(temp_min),
-                'description': description,
-                'humidity': int(current_data.get('REH', 50)),
-                'wind_speed': float(current_data.get('WSD', 0)),
-                'icon': icon,
-                'rain_probability': int(current_data.get('POP', 0)),
-                'rain_amount': self._parse_rain_amount(current_data.get('PCP', '강수없음'))
+                'temp': round(weather.temp, 1),
+                'temp_max': round(weather.temp_max),
+                'temp_min': round(weather.temp_min),
+                'description': weather.description,
+                'humidity': current.reh if current.reh is not None else 50,
+                'wind_speed': current.wsd,
+                'icon': weather_icon(current.sky, current.pty),
+                'rain_probability': current.pop,
+                'rain_amount': current.rain_amount
             }
 
             # 시간별 예보
-            hourly_forecast = []
-            sorted_keys = sorted(weather_by_time.keys())
-            start_idx = 0
-            for i, key in enumerate(sorted_keys):
-                if key >= current_time_str:
-                    start_idx = i
-                    break
-
-            for key in sorted_keys[start_idx:start_idx + 12]:
-                wdata = weather_by_time[key]
-                fcst_time = key.split('_')[1]
-                hour_str = f"{fcst_time[:2]}시"
-
-                sky_val = wdata.get('SKY', '1')
-                pty_val = wdata.get('PTY', '0')
-                weather_desc = get_weather_description(sky_val, pty_val)
-
-                if pty_val in ['1', '2', '4', '5', '6']:
-                    h_icon = '🌧️'
-                elif pty_val in ['3', '7']:
-                    h_icon = '🌨️'
-                elif sky_val == '1':
-                    h_icon = '☀️'
-                elif sky_val == '3':
-                    h_icon = '⛅'
-                else:
-                    h_icon = '☁️'
-
-                hourly_forecast.append({
-                    'time': hour_str,
-                    'temp': round(float(wdata.get('TMP', temp)), 1),
-                    'weather': weather_desc,
-                    'icon': h_icon,
-                    'sky': int(sky_val),  # 하늘상태: 1=맑음, 3=구름많음, 4=흐림
-                    'pty': int(pty_val),  # 강수형태: 0=없음, 1=비, 2=비/눈, 3=눈, 4=소나기
-                    'rain_probability': int(wdata.get('POP', 0)),
-                    'rain_amount': self._parse_rain_amount(wdata.get('PCP', '강수없음')),
-                    'humidity': int(wdata.get('REH', 50))
-                })
+            hourly_forecast = [
+                {
+                    'time': record.hour_label,
+                    'temp': round(record.tmp if record.tmp is not None else weather.temp, 1),
+                    'weather': get_weather_description(record.sky, record.pty),
+                    'icon': weather_icon(record.sky, record.pty),
+                    'sky': int(record.sky),  # 하늘상태: 1=맑음, 3=구름많음, 4=흐림
+                    'pty': int(record.pty),  # 강수형태: 0=없음, 1=비, 2=비/눈, 3=눈, 4=소나기
+                    'rain_probability': record.pop,
+                    'rain_amount': record.rain_amount,
+                    'humidity': record.reh if record.reh is not None else 50
+                }
+                for record in weather.hourly
+            ]
 
             return Response({
                 'success': True,
@@ -959,7 +658,7 @@ class WeatherAPIView(APIView):
             })
 
         except Exception as e:
-            print(f"[KMA Weather API Error] {e}")
+            logger.warning("날씨 조회 실패: %s", e)
             return Response({
                 'success': False,
                 'error': str(e)
@@ -967,15 +666,7 @@ class WeatherAPIView(APIView):
 
     def _parse_rain_amount(self, pcp_str):
         """강수량 문자열 파싱"""
-        if pcp_str == '강수없음':
-            return 0
-        elif pcp_str == '1mm 미만':
-            return 0.5
-        else:
-            try:
-                return float(pcp_str.replace('mm', ''))
-            except:
-                return 0
+        return parse_rain_amount(pcp_str)
 
     def post(self, request):
         """위치 기반 날씨 (POST로 좌표 전송)"""
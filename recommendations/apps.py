@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class RecommendationsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'recommendations'
+
+    def ready(self):
+        # OOTD/음식 카탈로그를 프로세스 시작 시 한 번 로드 (첫 요청 지연 방지)
+        from .catalogue import get_catalogue
+        get_catalogue()
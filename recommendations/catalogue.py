@@ -0,0 +1,269 @@
+"""
+OOTD/음식 카탈로그 (프로세스 전역, 불변)
+- ootd*.json, food.json 을 한 번만 읽어 인덱스를 만든 뒤 요청 간 공유
+- 옷: (성별, 카테고리, 날씨)별 온도 구간 트리 -> 온도/기온 범위 조회 O(log n + k)
+- 음식: 행운색(한글 이름)별 매칭 음식 목록을 미리 계산
+- 파일 mtime 이 바뀌면 다음 조회 때 다시 읽음 (확인 주기: settings.CATALOGUE_RELOAD_INTERVAL 초)
+"""
+import json
+import logging
+import os
+import threading
+import time
+from types import MappingProxyType
+from typing import Dict, Optional, Tuple
+
+from django.conf import settings
+
+# 성별별 ootd 파일 우선순위 (앞의 파일이 없거나 읽을 수 없으면 다음 파일)
+OOTD_FILENAMES = {
+    'M': ('ootd_male.json', 'ootd.json'),
+    'F': ('ootd_female.json', 'ootd.json'),
+    None: ('ootd.json',),
+}
+FOOD_FILENAMES = ('food.json',)
+
+# 행운색 -> 음식 color_category 키워드 (부분 문자열 매칭)
+FOOD_COLOR_KEYWORDS = {
+    '노란색': ['yellow', 'gold', 'amber'],
+    '베이지색': ['beige', 'tan', 'cream'],
+    '검은색': ['black', 'dark'],
+    '빨간색': ['red', 'crimson'],
+    '주황색': ['orange', 'coral'],
+    '초록색': ['green', 'lime'],
+    '파란색': ['blue', 'navy', 'cyan'],
+    '보라색': ['purple', 'violet'],
+    '흰색': ['white', 'ivory', 'cream'],
+    '분홍색': ['pink', 'rose'],
+    '갈색': ['brown', 'chocolate'],
+    '회색': ['gray', 'grey', 'silver'],
+    '금색': ['gold', 'golden'],
+}
+
+
+def _gender_key(gender):
+    return gender if gender in ('M', 'F') else None
+
+
+def _candidate_paths(filename):
+    return (
+        os.path.join(settings.BASE_DIR, filename),
+        os.path.join(settings.BASE_DIR, 'data', filename),
+    )
+
+
+def _load_first(filenames):
+    """파일 이름 우선순위대로 처음 읽히는 JSON 목록 반환"""
+    for filename in filenames:
+        for json_path in _candidate_paths(filename):
+            if os.path.exists(json_path):
+                try:
+                    with open(json_path, 'r', encoding='utf-8') as f:
+                        return json.load(f)
+                except Exception:
+                    pass
+    return []
+
+
+def _freeze(value):
+    """JSON 값을 읽기 전용으로 변환 (dict -> MappingProxyType, list -> tuple)"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+class _IntervalNode:
+    __slots__ = ('center', 'by_start', 'by_end', 'left', 'right')
+
+
+class IntervalIndex:
+    """
+    온도 구간 인덱스 (중심 구간 트리)
+    - 각 노드는 중심 온도를 포함하는 구간을 시작/끝 기준으로 정렬해 보관
+    - 한 온도 조회(stab)와 구간 겹침 조회 모두 O(log n + k)
+    - 결과는 원래 목록 순서로 반환
+    """
+
+    def __init__(self, items):
+        entries = [
+            (item.get('min_temp', -50), item.get('max_temp', 50), position, item)
+            for position, item in enumerate(items)
+        ]
+        self._root = self._build(entries)
+        self.size = len(entries)
+
+    @classmethod
+    def _build(cls, entries):
+        if not entries:
+            return None
+        endpoints = sorted(value for start, end, _, _ in entries for value in (start, end))
+        center = endpoints[len(endpoints) // 2]
+
+        here, left, right = [], [], []
+        for entry in entries:
+            if entry[1] < center:
+                left.append(entry)
+            elif entry[0] > center:
+                right.append(entry)
+            else:
+                here.append(entry)
+
+        node = _IntervalNode()
+        node.center = center
+        node.by_start = sorted(here, key=lambda entry: entry[0])
+        node.by_end = sorted(here, key=lambda entry: entry[1], reverse=True)
+        node.left = cls._build(left)
+        node.right = cls._build(right)
+        return node
+
+    def stab(self, temp):
+        """temp 가 [min_temp, max_temp] 안에 있는 항목"""
+        return self.overlap(temp, temp)
+
+    def overlap(self, low, high):
+        """[low, high] 와 겹치는 구간을 가진 항목 (그 날 기온 범위 안 어딘가에서 맞는 옷)"""
+        found = []
+        node = self._root
+        pending = []
+        while node is not None or pending:
+            if node is None:
+                node = pending.pop()
+            if high < node.center:
+                # 노드 구간은 모두 center 를 포함 -> 끝은 high 보다 큼, 시작만 확인
+                for entry in node.by_start:
+                    if entry[0] > high:
+                        break
+                    found.append(entry)
+                node = node.left
+            elif low > node.center:
+                for entry in node.by_end:
+                    if entry[1] < low:
+                        break
+                    found.append(entry)
+                node = node.right
+            else:
+                found.extend(node.by_start)
+                if node.right is not None:
+                    pending.append(node.right)
+                node = node.left
+        found.sort(key=lambda entry: entry[2])
+        return [entry[3] for entry in found]
+
+
+class Catalogue:
+    """불변 카탈로그 스냅샷"""
+
+    def __init__(self, ootd_by_gender: Dict[Optional[str], list], foods: list):
+        self.ootd = {gender: tuple(_freeze(item) for item in items) for gender, items in ootd_by_gender.items()}
+        self.foods = tuple(_freeze(food) for food in foods)
+
+        # (성별, 카테고리, 날씨)별 구간 인덱스
+        # 날씨 조건이 없는 옷은 모든 날씨 버킷에 포함, 목록에 없는 날씨는 None 버킷(조건 없는 옷만) 사용
+        self._clothes: Dict[Tuple[Optional[str], str, Optional[str]], IntervalIndex] = {}
+        for gender, items in self.ootd.items():
+            by_category = {}
+            for item in items:
+                by_category.setdefault(item.get('category'), []).append(item)
+            for category, category_items in by_category.items():
+                weathers = {weather for item in category_items for weather in item.get('weather_conditions') or ()}
+                for weather in list(weathers) + [None]:
+                    bucket = [
+                        item for item in category_items
+                        if not item.get('weather_conditions') or weather in item['weather_conditions']
+                    ]
+                    self._clothes[(gender, category, weather)] = IntervalIndex(bucket)
+
+        self._foods_by_color = {
+            lucky_color: self._match_foods(keywords)
+            for lucky_color, keywords in FOOD_COLOR_KEYWORDS.items()
+        }
+
+    def ootd_items(self, gender=None):
+        return self.ootd.get(_gender_key(gender), ())
+
+    def clothes(self, temp, category, weather_condition='맑음', gender=None):
+        """temp 에서 입을 수 있는 옷"""
+        index = self._clothes_index(category, weather_condition, gender)
+        return index.stab(temp) if index else []
+
+    def clothes_for_range(self, temp_min, temp_max, category, weather_condition='맑음', gender=None):
+        """temp_min~temp_max 사이 어느 온도에서든 입을 수 있는 옷"""
+        index = self._clothes_index(category, weather_condition, gender)
+        return index.overlap(temp_min, temp_max) if index else []
+
+    def _clothes_index(self, category, weather_condition, gender):
+        gender = _gender_key(gender)
+        index = self._clothes.get((gender, category, weather_condition))
+        if index is None:
+            index = self._clothes.get((gender, category, None))
+        return index
+
+    def foods_by_color(self, lucky_color):
+        """행운색에 맞는 음식 (food.json 순서 유지)"""
+        foods = self._foods_by_color.get(lucky_color)
+        if foods is None:
+            # 매핑에 없는 색은 색 이름 자체로 매칭 (드묾, 매번 계산)
+            foods = self._match_foods([lucky_color.lower()])
+        return list(foods)
+
+    def _match_foods(self, keywords):
+        return tuple(
+            food for food in self.foods
+            if any(keyword in food.get('color_category', '').lower() for keyword in keywords)
+        )
+
+
+logger = logging.getLogger(__name__)
+_lock = threading.Lock()
+_catalogue: Optional[Catalogue] = None
+_signature = None
+_checked_at = 0.0
+
+
+def _source_signature():
+    """모든 후보 파일의 (경로, mtime) -> 파일이 바뀌거나 새로 생기면 달라짐"""
+    filenames = {name for names in OOTD_FILENAMES.values() for name in names} | set(FOOD_FILENAMES)
+    signature = []
+    for filename in sorted(filenames):
+        for json_path in _candidate_paths(filename):
+            try:
+                signature.append((json_path, os.stat(json_path).st_mtime_ns))
+            except OSError:
+                signature.append((json_path, None))
+    return tuple(signature)
+
+
+def _build() -> Catalogue:
+    ootd_by_gender = {gender: _load_first(filenames) for gender, filenames in OOTD_FILENAMES.items()}
+    return Catalogue(ootd_by_gender, _load_first(FOOD_FILENAMES))
+
+
+def get_catalogue() -> Catalogue:
+    """현재 카탈로그 (처음 호출 시 로드, 확인 주기마다 파일 변경 여부 확인)"""
+    global _catalogue, _signature, _checked_at
+    now = time.monotonic()
+    catalogue = _catalogue
+    if catalogue is not None and now - _checked_at < getattr(settings, 'CATALOGUE_RELOAD_INTERVAL', 5):
+        return catalogue
+
+    with _lock:
+        if _catalogue is not None and now - _checked_at < getattr(settings, 'CATALOGUE_RELOAD_INTERVAL', 5):
+            return _catalogue
+        signature = _source_signature()
+        if _catalogue is None or signature != _signature:
+            if _catalogue is not None:
+                logger.info("카탈로그 파일 변경 감지 - 다시 로드")
+            _catalogue = _build()
+            _signature = signature
+        _checked_at = now
+        return _catalogue
+
+
+def reset_catalogue():
+    """다음 조회 때 다시 로드 (테스트용)"""
+    global _catalogue, _signature
+    with _lock:
+        _catalogue = None
+        _signature = None
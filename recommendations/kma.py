@@ -0,0 +1,233 @@
+"""
+기상청 단기예보(getVilageFcst) 조회 + 공유 캐시
+- 예보는 하루 8번(0200, 0500, ... 2300) 발표되고 발표 10분 후부터 제공
+- 같은 격자(nx, ny)·같은 발표 시각이면 모든 사용자/엔드포인트가 같은 응답을 받으므로
+  (nx, ny, base_date, base_time) 키로 Django 캐시에 저장
+- 캐시 만료: 다음 발표 시각 + 10분 + 유예 시간 (KMA_FORECAST_STALE_SECONDS)
+- 새 발표분이 아직 캐시에 없으면 직전 발표분을 바로 반환하고 백그라운드에서 갱신 (stale-while-revalidate)
+- 동시에 들어온 같은 키 요청은 한 번만 호출
+- 최근 요청된 격자를 기록해 두고 발표 직후 미리 조회 (manage.py prefetch_weather)
+"""
+import logging
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+
+import pytz
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+
+from core import http
+from fortune.singleflight import SingleFlight
+
+KST = pytz.timezone('Asia/Seoul')
+BASE_TIMES = ['0200', '0500', '0800', '1100', '1400', '1700', '2000', '2300']
+PUBLISH_DELAY = timedelta(minutes=10)  # 발표 후 API 제공까지 지연
+DEFAULT_FORECAST_URL = "http://apis.data.go.kr/1360000/VilageFcstInfoService_2.0/getVilageFcst"
+
+HOT_CELLS_KEY = 'kma:hot_cells'
+HOT_CELL_RECORD_INTERVAL = 60  # 프로세스별 격자당 공유 캐시 갱신 주기 (초)
+
+logger = logging.getLogger(__name__)
+_forecast_flight = SingleFlight('kma_forecast', lease_timeout=30, poll_interval=0.1)
+_hot_seen = {}  # (nx, ny) -> 마지막 기록 시각 (monotonic)
+
+
+def kst_now() -> datetime:
+    return datetime.now(KST)
+
+
+def base_slot(now: datetime) -> Tuple[str, str]:
+    """now 시점에 조회 가능한 가장 최근 발표 (base_date 'YYYYMMDD', base_time 'HHMM')"""
+    current_hour = now.hour * 100 + now.minute
+    base_time = '2300'
+    base_date = now - timedelta(days=1)
+    for bt in BASE_TIMES:
+        # 발표시간 + 10분 이후에 데이터 사용 가능
+        if current_hour >= int(bt) + 10:
+            base_time = bt
+            base_date = now
+    return base_date.strftime('%Y%m%d'), base_time
+
+
+def _slot_available_at(slot: Tuple[str, str]) -> datetime:
+    base_date, base_time = slot
+    published = KST.localize(datetime.strptime(base_date + base_time, '%Y%m%d%H%M'))
+    return published + PUBLISH_DELAY
+
+
+def previous_slot(slot: Tuple[str, str]) -> Tuple[str, str]:
+    """slot 직전 발표"""
+    return base_slot(_slot_available_at(slot) - timedelta(minutes=1))
+
+
+def next_slot_available_at(slot: Tuple[str, str]) -> datetime:
+    """slot 다음 발표가 제공되기 시작하는 시각 (발표 + 10분)"""
+    available = _slot_available_at(slot)
+    for hours in range(1, 25):
+        candidate = available + timedelta(hours=hours)
+        if base_slot(candidate) != slot:
+            return candidate
+    return available + timedelta(hours=3)
+
+
+def forecast_cache_key(nx: int, ny: int, slot: Tuple[str, str]) -> str:
+    return f"kma:fcst:{nx}:{ny}:{slot[0]}:{slot[1]}"
+
+
+def _cache_timeout(slot: Tuple[str, str], now: datetime) -> int:
+    """다음 발표 제공 시각까지 + 유예 시간 (그 사이 다음 요청은 이 값을 stale 로 사용)"""
+    fresh_seconds = (next_slot_available_at(slot) - now).total_seconds()
+    return max(60, int(fresh_seconds) + getattr(settings, 'KMA_FORECAST_STALE_SECONDS', 3 * 60 * 60))
+
+
+def fetch_forecast_items(api_key: str, nx: int, ny: int, slot: Tuple[str, str]) -> List[dict]:
+    """단기예보 API 직접 호출 -> item 목록 (응답 오류 시 예외)"""
+    params = {
+        'serviceKey': api_key,
+        'numOfRows': 300,
+        'pageNo': 1,
+        'dataType': 'JSON',
+        'base_date': slot[0],
+        'base_time': slot[1],
+        'nx': nx,
+        'ny': ny
+    }
+    url = getattr(settings, 'KMA_FORECAST_URL', '') or DEFAULT_FORECAST_URL
+    logger.debug("단기예보 호출: base_date=%s, base_time=%s, nx=%s, ny=%s", slot[0], slot[1], nx, ny)
+    # 공용 세션 (keep-alive), 연결 실패/5xx 는 1번 재시도
+    response = http.get(url, params=params, timeout=10, max_retries=1)
+
+    try:
+        data = response.json()
+    except Exception as json_err:
+        # 응답 본문 디코딩은 로그가 켜져 있을 때만
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning("JSON parse error (%s): %.500s", response.status_code, response.text)
+        raise Exception(f"JSON parse error: {json_err}")
+
+    header = data.get('response', {}).get('header', {})
+    items = data.get('response', {}).get('body', {}).get('items', {}).get('item', [])
+    if not items:
+        raise Exception(f"No weather data (code={header.get('resultCode', 'N/A')}, msg={header.get('resultMsg', 'N/A')})")
+    return items
+
+
+def _fetch_and_store(api_key: str, nx: int, ny: int, slot: Tuple[str, str]) -> List[dict]:
+    items = fetch_forecast_items(api_key, nx, ny, slot)
+    cache.set(forecast_cache_key(nx, ny, slot), items, _cache_timeout(slot, kst_now()))
+    return items
+
+
+def _refresh_in_background(api_key: str, nx: int, ny: int, slot: Tuple[str, str]):
+    """새 발표분 백그라운드 갱신 (워커 간 중복 방지: cache.add 임대)"""
+    lease_key = forecast_cache_key(nx, ny, slot) + ':refresh'
+    token = uuid.uuid4().hex
+    if not cache.add(lease_key, token, 30):
+        return
+
+    def refresh():
+        try:
+            _fetch_and_store(api_key, nx, ny, slot)
+        except Exception as e:
+            logger.warning("백그라운드 갱신 실패: %s", e)
+        finally:
+            if cache.get(lease_key) == token:
+                cache.delete(lease_key)
+            # 요청 스레드가 아니라 request_finished 정리가 없음 -> DB 캐시 연결을 직접 닫음
+            connection.close()
+
+    threading.Thread(target=refresh, name=f'kma-refresh-{nx}-{ny}', daemon=True).start()
+
+
+def is_forecast_cached(nx: int, ny: int, slot: Tuple[str, str]) -> bool:
+    return cache.get(forecast_cache_key(nx, ny, slot)) is not None
+
+
+def prefetch_forecast(api_key: str, nx: int, ny: int, slot: Tuple[str, str]) -> List[dict]:
+    """slot 예보를 조회해 공유 캐시에 저장 (실패 시 예외)"""
+    return _fetch_and_store(api_key, nx, ny, slot)
+
+
+def record_hot_cell(nx: int, ny: int):
+    """
+    요청된 격자 기록 (공유 캐시: (nx, ny) -> [마지막 요청 epoch, 기록 횟수])
+
+    같은 프로세스에서 같은 격자는 HOT_CELL_RECORD_INTERVAL 마다 한 번만 기록 (요청마다 캐시 쓰기 방지)
+    여러 워커가 동시에 갱신하면 일부 기록이 빠질 수 있음 (인기 격자 선정용이라 허용)
+    """
+    now = time.monotonic()
+    cell = (nx, ny)
+    last = _hot_seen.get(cell)
+    if last is not None and now - last < HOT_CELL_RECORD_INTERVAL:
+        return
+    _hot_seen[cell] = now
+
+    window = getattr(settings, 'KMA_HOT_CELL_WINDOW', 24 * 60 * 60)
+    epoch = time.time()
+    cells = cache.get(HOT_CELLS_KEY) or {}
+    _, count = cells.get(cell, (epoch, 0))
+    cells[cell] = (epoch, count + 1)
+    cells = {key: value for key, value in cells.items() if epoch - value[0] <= window}
+    cache.set(HOT_CELLS_KEY, cells, window)
+
+
+def hot_cells(limit: Optional[int] = None) -> List[Tuple[int, int]]:
+    """최근 KMA_HOT_CELL_WINDOW 안에 요청된 격자 (기록 횟수, 최근 요청 순)"""
+    window = getattr(settings, 'KMA_HOT_CELL_WINDOW', 24 * 60 * 60)
+    epoch = time.time()
+    cells = [
+        (cell, value) for cell, value in (cache.get(HOT_CELLS_KEY) or {}).items()
+        if epoch - value[0] <= window
+    ]
+    cells.sort(key=lambda entry: (entry[1][1], entry[1][0]), reverse=True)
+    return [cell for cell, _ in cells[:limit]]
+
+
+def get_forecast(api_key: str, nx: int, ny: int, now: Optional[datetime] = None) -> Tuple[Tuple[str, str], List[dict]]:
+    """
+    격자 (nx, ny)의 최신 단기예보 -> (발표 slot, item 목록) (공유 캐시 사용)
+
+    직전 발표분을 반환한 경우 slot 도 직전 발표 시각
+
+    Raises:
+        Exception: 캐시에도 없고 API 호출도 실패한 경우
+    """
+    now = now or kst_now()
+    slot = base_slot(now)
+    key = forecast_cache_key(nx, ny, slot)
+
+    items = cache.get(key)
+    if items is not None:
+        return slot, items
+
+    # 직전 발표분이 있으면 바로 사용하고 새 발표분은 백그라운드에서 갱신
+    prev = previous_slot(slot)
+    stale = cache.get(forecast_cache_key(nx, ny, prev))
+    if stale is not None:
+        logger.debug("직전 발표 예보 사용 (갱신 중): nx=%s, ny=%s, slot=%s", nx, ny, slot)
+        _refresh_in_background(api_key, nx, ny, slot)
+        return prev, stale
+
+    # 캐시 없음: 같은 격자 동시 요청은 한 번만 호출
+    errors = []
+
+    def compute():
+        try:
+            return _fetch_and_store(api_key, nx, ny, slot)
+        except Exception as e:
+            errors.append(e)
+            return None
+
+    items = _forecast_flight.do(key, compute, timeout=12)
+    if items is None:
+        raise errors[0] if errors else Exception("No weather data")
+    return slot, items
+
+
+def get_forecast_items(api_key: str, nx: int, ny: int, now: Optional[datetime] = None) -> List[dict]:
+    """격자 (nx, ny)의 최신 단기예보 item 목록"""
+    return get_forecast(api_key, nx, ny, now)[1]
@@ -0,0 +1,85 @@
+"""
+인기 격자 단기예보 미리 조회 (발표 직후 실행)
+- 최근 KMA_HOT_CELL_WINDOW 안에 요청된 격자(kma.record_hot_cell)를 요청 많은 순으로 최대 --budget 개
+- 현재 발표분이 공유 캐시에 없는 격자만 호출 (--force 면 모두)
+- 기상청 API 호출은 초당 --rate 회 이하
+- 공유 캐시(CACHE_BACKEND: Redis/Memcached/DB/파일 등) 필요: 웹 워커가 기록한 인기 격자를 읽고,
+  조회한 예보를 웹 워커가 읽어야 하므로 프로세스 전용 캐시(기본값 LocMemCache, DummyCache)면 오류로 종료
+
+cron 예) 발표(02, 05, ... 23시) + 10분 제공 -> 12분에 실행
+  12 2,5,8,11,14,17,20,23 * * * python manage.py prefetch_weather
+또는 --loop 로 상주하면서 발표마다 실행
+"""
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.management.base import BaseCommand, CommandError
+
+from recommendations import kma
+
+LOOP_MARGIN_SECONDS = 60  # 발표 제공 시각 이후 여유
+
+
+class Command(BaseCommand):
+    help = '최근 요청된 기상청 격자의 최신 단기예보를 공유 캐시에 미리 저장'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--budget', type=int, default=None, help='미리 조회할 최대 격자 수 (기본 KMA_PREFETCH_BUDGET)')
+        parser.add_argument('--rate', type=float, default=None, help='초당 최대 API 호출 수 (기본 KMA_PREFETCH_RATE, 0 이면 제한 없음)')
+        parser.add_argument('--force', action='store_true', help='이미 캐시된 격자도 다시 조회')
+        parser.add_argument('--loop', action='store_true', help='종료하지 않고 발표마다 반복 실행')
+
+    def handle(self, *args, **options):
+        api_key = settings.KMA_API_KEY
+        if not api_key:
+            raise CommandError('KMA_API_KEY 가 설정되지 않았습니다')
+        if isinstance(caches['default'], (LocMemCache, DummyCache)):
+            raise CommandError(
+                'CACHE_BACKEND 가 프로세스 전용 캐시입니다 - 웹 워커와 공유되는 캐시(Redis/Memcached/DB 등)를 설정하세요'
+            )
+
+        budget = options['budget'] if options['budget'] is not None else getattr(settings, 'KMA_PREFETCH_BUDGET', 50)
+        rate = options['rate'] if options['rate'] is not None else getattr(settings, 'KMA_PREFETCH_RATE', 2)
+        if budget < 1 or rate < 0:
+            raise CommandError('--budget 은 1 이상, --rate 는 0 이상이어야 합니다')
+
+        while True:
+            slot = kma.base_slot(kma.kst_now())
+            self._prefetch(api_key, slot, budget, rate, options['force'])
+            if not options['loop']:
+                return
+
+            wait_seconds = (kma.next_slot_available_at(slot) - kma.kst_now()).total_seconds() + LOOP_MARGIN_SECONDS
+            self.stdout.write(f'다음 발표까지 {wait_seconds / 60:.0f}분 대기')
+            time.sleep(max(1, wait_seconds))
+
+    def _prefetch(self, api_key, slot, budget, rate, force):
+        cells = kma.hot_cells(limit=budget)
+        interval = 1.0 / rate if rate else 0
+        fetched = skipped = failed = 0
+        next_call_at = 0.0
+
+        for nx, ny in cells:
+            if not force and kma.is_forecast_cached(nx, ny, slot):
+                skipped += 1
+                continue
+
+            # 초당 호출 한도
+            wait_seconds = next_call_at - time.monotonic()
+            if wait_seconds > 0:
+                time.sleep(wait_seconds)
+            next_call_at = time.monotonic() + interval
+
+            try:
+                kma.prefetch_forecast(api_key, nx, ny, slot)
+                fetched += 1
+            except Exception as e:
+                failed += 1
+                self.stderr.write(f'  ({nx}, {ny}) 조회 실패: {e}')
+
+        self.stdout.write(self.style.SUCCESS(
+            f'[{slot[0]} {slot[1]}] 격자 {len(cells)}개: 조회 {fetched}, 캐시 있음 {skipped}, 실패 {failed}'
+        ))
@@ -0,0 +1,18 @@
+# 저장된 추천을 그대로 응답할 수 있도록 생성 시점의 행운색/운세 요약 저장
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recommendations', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='dailyrecommendation',
+            name='fortune_context',
+            field=models.JSONField(blank=True, default=dict, verbose_name='응답용 운세 요약'),
+        ),
+    ]
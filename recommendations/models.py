@@ -43,6 +43,11 @@ class DailyRecommendation(models.Model):
         default=dict,
         verbose_name='날씨 정보'
     )
+    fortune_context = models.JSONField(
+        default=dict,
+        blank=True,
+        verbose_name='응답용 운세 요약'  # 행운색/한줄 요약 (저장된 추천 응답 시 운세 재계산 생략)
+    )
     user_feedback = models.IntegerField(
         validators=[MinValueValidator(1), MaxValueValidator(5)],
         null=True,
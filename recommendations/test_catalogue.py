@@ -0,0 +1,121 @@
+from pathlib import Path
+from unittest import mock
+import json
+import os
+import random
+import tempfile
+
+from django.test import SimpleTestCase, override_settings
+
+from recommendations import catalogue
+from recommendations.catalogue import IntervalIndex, get_catalogue, reset_catalogue
+
+
+def _linear_clothes(items, temp, category, weather_condition):
+    """기존 선형 탐색 방식 (비교 기준)"""
+    return [
+        item for item in items
+        if item.get('category') == category
+        and item.get('min_temp', -50) <= temp <= item.get('max_temp', 50)
+        and (not item.get('weather_conditions') or weather_condition in item.get('weather_conditions', []))
+    ]
+
+
+class CatalogueTest(SimpleTestCase):
+    """OOTD/음식 카탈로그 인덱스 테스트"""
+
+    def setUp(self):
+        reset_catalogue()
+        self.addCleanup(reset_catalogue)
+
+    def test_clothes_lookup_matches_linear_scan(self):
+        """인덱스 조회 결과가 선형 탐색과 같은지 (순서 포함) 테스트"""
+        cat = get_catalogue()
+        for gender in ('M', 'F', None):
+            items = cat.ootd_items(gender)
+            self.assertTrue(items)
+            for category in ('상의', '하의', '아우터', '액세서리'):
+                for weather in ('맑음', '흐림', '비', '눈'):
+                    for temp in range(-15, 41, 2):
+                        self.assertEqual(
+                            cat.clothes(temp, category, weather, gender),
+                            _linear_clothes(items, temp, category, weather),
+                        )
+
+    def test_foods_by_color(self):
+        """행운색별 음식 인덱스가 키워드 매칭과 같은지 테스트"""
+        cat = get_catalogue()
+        red = cat.foods_by_color('빨간색')
+        self.assertTrue(red)
+        self.assertEqual(red, [f for f in cat.foods if 'red' in f['color_category'].lower()])
+        self.assertEqual(cat.foods_by_color('multi'), [f for f in cat.foods if 'multi' in f['color_category'].lower()])
+
+    def test_items_are_read_only(self):
+        item = get_catalogue().ootd_items('M')[0]
+        with self.assertRaises(TypeError):
+            item['name'] = '변경'
+
+    def test_reloads_when_file_changes(self):
+        """파일 mtime 이 바뀌면 다시 로드하는지 테스트"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            food_path = Path(tmp_dir) / 'food.json'
+            food_path.write_text(json.dumps([{'id': 1, 'name_ko': '떡볶이', 'color_category': 'Red'}]))
+
+            with override_settings(BASE_DIR=Path(tmp_dir), CATALOGUE_RELOAD_INTERVAL=0):
+                self.assertEqual(len(get_catalogue().foods), 1)
+                self.assertIs(get_catalogue(), get_catalogue())
+
+                food_path.write_text(json.dumps([{'id': 1, 'color_category': 'Red'}, {'id': 2, 'color_category': 'Brown'}]))
+                stat = food_path.stat()
+                os.utime(food_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+                self.assertEqual(len(get_catalogue().foods), 2)
+                self.assertEqual(get_catalogue().ootd_items('M'), ())
+
+    def test_signature_checked_only_after_interval(self):
+        """확인 주기 안에서는 파일 stat 없이 같은 카탈로그를 반환하는지 테스트"""
+        get_catalogue()
+        with override_settings(CATALOGUE_RELOAD_INTERVAL=60), \
+                mock.patch.object(catalogue, '_source_signature') as signature:
+            for _ in range(10):
+                get_catalogue()
+        signature.assert_not_called()
+
+
+class IntervalIndexTest(SimpleTestCase):
+    """온도 구간 인덱스 테스트"""
+
+    def test_matches_linear_scan(self):
+        """온도 조회/범위 조회가 선형 탐색과 같은지 (대량 무작위 구간) 테스트"""
+        picker = random.Random(0)
+        items = []
+        for i in range(5000):
+            low = picker.randint(-20, 40)
+            items.append({'id': i, 'min_temp': low, 'max_temp': low + picker.randint(0, 15)})
+        items.append({'id': 'no-range'})  # 범위 없음 -> -50~50
+        index = IntervalIndex(items)
+
+        for _ in range(200):
+            temp = picker.uniform(-25, 55)
+            self.assertEqual(
+                index.stab(temp),
+                [item for item in items if item.get('min_temp', -50) <= temp <= item.get('max_temp', 50)],
+            )
+            low = picker.uniform(-25, 45)
+            high = low + picker.uniform(0, 12)
+            self.assertEqual(
+                index.overlap(low, high),
+                [item for item in items if item.get('min_temp', -50) <= high and item.get('max_temp', 50) >= low],
+            )
+
+    def test_range_query_on_catalogue(self):
+        """기온 범위 조회가 범위 안 각 온도 조회 결과를 모두 포함하는지 테스트"""
+        reset_catalogue()
+        self.addCleanup(reset_catalogue)
+        cat = get_catalogue()
+        in_range = cat.clothes_for_range(2, 12, '액세서리', '맑음', 'M')
+        for temp in range(2, 13):
+            for item in cat.clothes(temp, '액세서리', '맑음', 'M'):
+                self.assertIn(item, in_range)
+        self.assertEqual(cat.clothes(10, '상의', '황사', 'M'), [
+            item for item in cat.clothes(10, '상의', '맑음', 'M') if not item.get('weather_conditions')
+        ])
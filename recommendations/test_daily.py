@@ -0,0 +1,102 @@
+from datetime import date
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from recommendations import api_views
+from recommendations.models import DailyRecommendation
+
+FORTUNE = {
+    'lucky_colors': ['빨간색', '파란색', '흰색', '검은색'],
+    'overall_fortune': {'summary': '차분하게 움직이면 좋습니다'},
+    'fortune_texts': {'total': '좋은 하루'},
+    'zodiac_sign': '양자리',
+}
+WEATHER = {'temp': 12, 'temp_max': 15, 'temp_min': 8, 'description': '맑음', 'humidity': 40, 'city': '대전 유성구',
+           'current': {'rain_probability': 0, 'wind_speed': 1, 'rain_amount': 0}, 'hourly': []}
+
+
+class SavedRecommendationFastPathTest(TestCase):
+    """오늘 추천이 저장돼 있으면 운세/날씨/LLM 없이 응답하는지 테스트"""
+
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            username='daily', password='pw', email='daily@example.com', birth_date=date(1990, 1, 1)
+        )
+        self.factory = APIRequestFactory()
+        patches = {
+            'fortune': mock.patch.object(api_views, 'get_fortune_data_for_user', return_value=FORTUNE),
+            'weather': mock.patch.object(
+                api_views.OOTDRecommendationAPIView, '_get_weather_info', side_effect=lambda request: dict(WEATHER)
+            ),
+            'summary': mock.patch.object(api_views, 'summarize_fortune_with_llm', return_value='한줄 요약'),
+        }
+        self.mocks = {name: patcher.start() for name, patcher in patches.items()}
+        for patcher in patches.values():
+            self.addCleanup(patcher.stop)
+
+    def _get(self, view_class, path):
+        request = self.factory.get(path)
+        force_authenticate(request, user=self.user)
+        return view_class.as_view()(request).data
+
+    def _reset_mocks(self):
+        for mocked in self.mocks.values():
+            mocked.reset_mock()
+
+    def test_ootd_repeat_view_uses_saved_row(self):
+        first = self._get(api_views.OOTDRecommendationAPIView, '/api/recommendations/ootd/')
+        self.assertEqual(first['lucky_colors'], FORTUNE['lucky_colors'][:3])
+        self._reset_mocks()
+
+        with self.assertNumQueries(1):
+            again = self._get(api_views.OOTDRecommendationAPIView, '/api/recommendations/ootd/')
+        self.assertEqual(again, first)
+        self.mocks['fortune'].assert_not_called()
+        self.mocks['weather'].assert_not_called()
+
+    def test_menu_repeat_view_skips_llm(self):
+        first = self._get(api_views.MenuRecommendationAPIView, '/api/recommendations/menu/')
+        self.assertEqual(first['fortune_data']['fortune_summary'], '한줄 요약')
+        self._reset_mocks()
+
+        with self.assertNumQueries(1):
+            again = self._get(api_views.MenuRecommendationAPIView, '/api/recommendations/menu/')
+        self.assertEqual(again, first)
+        self.mocks['fortune'].assert_not_called()
+        self.mocks['summary'].assert_not_called()
+
+    def test_legacy_row_is_backfilled(self):
+        """운세 요약 없이 저장된 기존 추천은 저장된 추천을 쓰고 요약만 채우는지 테스트"""
+        outfit = {'top': '니트', 'accessories': []}
+        DailyRecommendation.objects.create(
+            user=self.user, recommendation_date=date.today(), recommendation_type='OOTD',
+            recommendation_data=outfit, weather_data=WEATHER
+        )
+
+        data = self._get(api_views.OOTDRecommendationAPIView, '/api/recommendations/ootd/')
+        self.assertEqual((data['outfit'], data['weather']), (outfit, WEATHER))
+        self.mocks['weather'].assert_not_called()
+        self.assertEqual(
+            DailyRecommendation.objects.get().fortune_context['fortune_summary'], FORTUNE['overall_fortune']['summary']
+        )
+
+    def test_fallback_weather_is_refetched(self):
+        """날씨 조회 실패 기본값으로 만든 추천은 다음 조회에서 새 날씨로 다시 만드는지 테스트"""
+        fallback = dict(WEATHER, temp=15, description='날씨 정보 없음', fallback=True)
+        self.mocks['weather'].side_effect = lambda request: dict(fallback)
+        first = self._get(api_views.OOTDRecommendationAPIView, '/api/recommendations/ootd/')
+        self.assertTrue(first['weather']['fallback'])
+
+        self.mocks['weather'].side_effect = lambda request: dict(WEATHER)
+        again = self._get(api_views.OOTDRecommendationAPIView, '/api/recommendations/ootd/')
+        self.assertEqual(again['weather'], WEATHER)
+        saved = DailyRecommendation.objects.get()
+        self.assertEqual((saved.weather_data, saved.recommendation_data), (WEATHER, again['outfit']))
+
+        self._reset_mocks()
+        with self.assertNumQueries(1):
+            self.assertEqual(self._get(api_views.OOTDRecommendationAPIView, '/api/recommendations/ootd/'), again)
+        self.mocks['weather'].assert_not_called()
@@ -0,0 +1,67 @@
+from unittest import mock
+
+import requests
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from recommendations import utils
+from recommendations.utils import get_korean_address, reset_geocode_cache
+
+
+def _kakao_response(region_2='유성구', region_3='어은동', status_code=200):
+    response = mock.Mock(status_code=status_code, text='')
+    documents = [{'address': {'region_2depth_name': region_2, 'region_3depth_name': region_3}}] if region_2 else []
+    response.json.return_value = {'documents': documents}
+    return response
+
+
+@override_settings(KAKAO_REST_API_KEY='test-key', GEOCODE_SEED_RADIUS_M=0)
+class GeocodeCacheTest(SimpleTestCase):
+    """좌표 -> 행정동 캐시 테스트"""
+
+    def setUp(self):
+        cache.clear()
+        reset_geocode_cache()
+        self.addCleanup(reset_geocode_cache)
+
+    def test_nearby_coordinates_share_one_call(self):
+        """약 100m 안의 좌표는 카카오 API 를 한 번만 호출하는지 테스트"""
+        with mock.patch.object(utils.http, 'get', return_value=_kakao_response()) as get:
+            self.assertEqual(get_korean_address(36.36211, 127.35612), '유성구 어은동')
+            self.assertEqual(get_korean_address(36.36188, 127.35638), '유성구 어은동')
+            reset_geocode_cache()  # 다른 워커: 공유 캐시 사용
+            self.assertEqual(get_korean_address(36.3621, 127.3562), '유성구 어은동')
+        self.assertEqual(get.call_count, 1)
+        self.assertIn('x=127.356&y=36.362', get.call_args[0][0])
+
+    def test_not_found_and_errors_are_cached(self):
+        """주소 없음/오류도 캐시해서 매 요청 3초 타임아웃을 반복하지 않는지 테스트"""
+        with mock.patch.object(utils.http, 'get', return_value=_kakao_response(region_2=None)) as get:
+            self.assertIsNone(get_korean_address(33.0, 126.0))
+            self.assertIsNone(get_korean_address(33.0, 126.0))
+        self.assertEqual(get.call_count, 1)
+
+        with mock.patch.object(utils.http, 'get', side_effect=requests.Timeout) as get:
+            self.assertIsNone(get_korean_address(35.0, 128.0))
+            self.assertIsNone(get_korean_address(35.0, 128.0))
+        self.assertEqual(get.call_count, 1)
+
+    @override_settings(KAKAO_REST_API_KEY='', GEOCODE_SEED_RADIUS_M=300)
+    def test_seed_centroids_answer_offline(self):
+        """행정동 중심점 반경 안이면 API 키 없이도 주소를 반환하는지 테스트"""
+        with mock.patch.object(utils.http, 'get') as get:
+            self.assertEqual(get_korean_address(36.3556, 127.3430), '유성구 봉명동')
+            self.assertIsNone(get_korean_address(36.0, 127.0))
+        get.assert_not_called()
+
+    @override_settings(GEOCODE_SEED_RADIUS_M=300)
+    def test_kakao_answer_wins_over_seed(self):
+        """중심점 반경 안이어도 카카오 답을 쓰고, 중심점 근사값은 카카오 실패 시에만 짧게 쓰는지 테스트"""
+        with mock.patch.object(utils.http, 'get', return_value=_kakao_response(region_3='궁동')) as get:
+            self.assertEqual(get_korean_address(36.3556, 127.3430), '유성구 궁동')
+        get.assert_called_once()
+
+        with mock.patch.object(utils.http, 'get', side_effect=requests.Timeout):
+            self.assertEqual(get_korean_address(36.3548, 127.3428), '유성구 봉명동')
+        # 근사값은 공유 캐시에 넣지 않음 (카카오 오류만 기록)
+        self.assertEqual(cache.get(utils.geocode_cache_key(36.355, 127.343))[0], '')
@@ -0,0 +1,257 @@
+from datetime import datetime
+from pathlib import Path
+from unittest import mock
+import json
+import tempfile
+import threading
+import time
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import SimpleTestCase, override_settings
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from config.weather_config import latlon_to_grid
+from recommendations import api_views, kma
+from recommendations import weather as weather_module
+from recommendations.weather import ParsedForecast, WeatherService
+
+FIXTURE_PATH = Path(__file__).resolve().parents[1] / 'benchmarks' / 'fixtures' / 'kma_vilage_fcst_300.json'
+
+
+def _fixture_items():
+    with open(FIXTURE_PATH, encoding='utf-8') as f:
+        return json.load(f)['response']['body']['items']['item']
+
+
+def _kst(*args):
+    return kma.KST.localize(datetime(*args))
+
+
+def _items(temp):
+    return [{'fcstDate': '20250601', 'fcstTime': '1200', 'category': 'TMP', 'fcstValue': str(temp)}]
+
+
+class KMAForecastCacheTest(SimpleTestCase):
+    """기상청 단기예보 공유 캐시 테스트"""
+
+    def setUp(self):
+        cache.clear()
+
+    def test_base_slot(self):
+        self.assertEqual(kma.base_slot(_kst(2025, 6, 1, 5, 9)), ('20250601', '0200'))
+        self.assertEqual(kma.base_slot(_kst(2025, 6, 1, 5, 10)), ('20250601', '0500'))
+        self.assertEqual(kma.base_slot(_kst(2025, 6, 1, 2, 0)), ('20250531', '2300'))
+        self.assertEqual(kma.previous_slot(('20250601', '0200')), ('20250531', '2300'))
+        self.assertEqual(kma.next_slot_available_at(('20250531', '2300')), _kst(2025, 6, 1, 2, 10))
+
+    def test_cached_per_grid_and_slot(self):
+        """같은 격자/발표 시각이면 한 번만 호출하고, TTL 은 다음 발표 + 유예 시간인지 테스트"""
+        now = _kst(2025, 6, 1, 9, 0)
+        with mock.patch.object(kma, 'fetch_forecast_items', return_value=_items(20)) as fetch, \
+                mock.patch.object(kma, 'kst_now', return_value=now), \
+                mock.patch.object(kma.cache, 'set', wraps=cache.set) as cache_set:
+            for _ in range(3):
+                self.assertEqual(kma.get_forecast_items('key', 67, 100, now), _items(20))
+            kma.get_forecast_items('key', 60, 127, now)
+
+        self.assertEqual(fetch.call_count, 2)
+        fetch.assert_any_call('key', 67, 100, ('20250601', '0800'))
+        # 다음 발표(11:00) 제공 시각 11:10 까지 2시간 10분 + 유예 3시간
+        self.assertEqual(cache_set.call_args_list[0][0][2], 130 * 60 + 3 * 60 * 60)
+
+    def test_stale_while_revalidate(self):
+        """새 발표분이 없으면 직전 예보를 반환하고 백그라운드에서 갱신하는지 테스트"""
+        cache.set(kma.forecast_cache_key(67, 100, ('20250601', '0800')), _items(18))
+        now = _kst(2025, 6, 1, 11, 15)
+        refreshed = threading.Event()
+
+        def fetch(*args):
+            refreshed.set()
+            return _items(22)
+
+        closed = threading.Event()
+        db_connection = mock.Mock(**{'close.side_effect': lambda: closed.set()})
+        with mock.patch.object(kma, 'fetch_forecast_items', side_effect=fetch), \
+                mock.patch.object(kma, 'kst_now', return_value=now), \
+                mock.patch.object(kma, 'connection', db_connection):
+            self.assertEqual(kma.get_forecast_items('key', 67, 100, now), _items(18))
+            self.assertTrue(refreshed.wait(2))
+            self.assertTrue(closed.wait(2))  # 갱신 스레드의 DB 연결 정리
+            for _ in range(50):
+                if cache.get(kma.forecast_cache_key(67, 100, ('20250601', '1100'))):
+                    break
+                threading.Event().wait(0.01)
+            self.assertEqual(kma.get_forecast_items('key', 67, 100, now), _items(22))
+
+    def test_failure_without_cache_raises(self):
+        with mock.patch.object(kma, 'fetch_forecast_items', side_effect=Exception('timeout')):
+            with self.assertRaisesMessage(Exception, 'timeout'):
+                kma.get_forecast_items('key', 67, 100, _kst(2025, 6, 1, 9, 0))
+        self.assertIsNone(cache.get(kma.forecast_cache_key(67, 100, ('20250601', '0800'))))
+
+
+class WeatherServiceTest(SimpleTestCase):
+    """공용 날씨 서비스 (한 번 파싱, 두 엔드포인트 공유) 테스트"""
+
+    def setUp(self):
+        cache.clear()
+        WeatherService.clear_parsed_cache()
+        self.addCleanup(WeatherService.clear_parsed_cache)
+        self.items = _fixture_items()
+        self.now = _kst(2025, 6, 1, 9, 0)
+
+    def test_parse_fixture(self):
+        """300행 예보를 시각별 레코드로 정리하고 오늘 최저/최고를 계산하는지 테스트"""
+        parsed = ParsedForecast(self.items)
+        self.assertEqual(parsed.keys, sorted(parsed.keys))
+        self.assertEqual(len(parsed.records), len({(i['fcstDate'], i['fcstTime']) for i in self.items}))
+
+        temps = [float(i['fcstValue']) for i in self.items if i['category'] == 'TMP' and i['fcstDate'] == '20250601']
+        snapshot = parsed.snapshot(self.now)
+        self.assertEqual((snapshot.temp_min, snapshot.temp_max), (min(temps), max(temps)))
+        self.assertEqual(snapshot.current.key, '20250601_0900')
+        self.assertEqual(snapshot.temp, float(next(
+            i['fcstValue'] for i in self.items
+            if i['category'] == 'TMP' and i['fcstDate'] == '20250601' and i['fcstTime'] == '0900'
+        )))
+        self.assertEqual(len(snapshot.hourly), 12)
+        self.assertEqual(snapshot.hourly[0].hour_label, '09시')
+
+    def test_endpoints_share_one_fetch(self):
+        """OOTD 날씨와 날씨 API 가 한 번 조회/파싱한 예보로 같은 값을 내는지 테스트"""
+        factory = APIRequestFactory()
+        with mock.patch.object(kma, 'fetch_forecast_items', return_value=self.items) as fetch, \
+                mock.patch.object(kma, 'kst_now', return_value=self.now), \
+                mock.patch.object(weather_module, 'get_korean_address', return_value='대전 유성구'), \
+                mock.patch('recommendations.weather.ParsedForecast', wraps=ParsedForecast) as parse:
+            ootd = api_views.OOTDRecommendationAPIView()._get_weather_info(
+                Request(factory.get('/api/recommendations/ootd/'))
+            )
+            weather = api_views.WeatherAPIView.as_view()(factory.get('/api/recommendations/weather/')).data
+
+        self.assertEqual(fetch.call_count, 1)
+        self.assertEqual(parse.call_count, 1)
+        self.assertTrue(weather['success'])
+        for field in ('temp', 'temp_max', 'temp_min', 'description', 'humidity'):
+            self.assertEqual(ootd[field], weather['current'][field])
+        self.assertEqual(ootd['current']['rain_probability'], weather['current']['rain_probability'])
+        self.assertEqual(
+            [(h['time'], h['temp'], h['sky'], h['pty']) for h in ootd['hourly']],
+            [(h['time'], h['temp'], h['sky'], h['pty']) for h in weather['hourly']],
+        )
+        self.assertEqual(len(weather['hourly']), 12)
+
+    def test_lookup_runs_weather_and_geocode_concurrently(self):
+        """예보/주소 조회가 동시에 실행되어 지연이 합이 아닌 최댓값인지 테스트"""
+        def slow_fetch(*args):
+            time.sleep(0.3)
+            return self.items
+
+        def slow_address(lat, lon):
+            time.sleep(0.3)
+            return '유성구 어은동'
+
+        with mock.patch.object(kma, 'fetch_forecast_items', side_effect=slow_fetch), \
+                mock.patch.object(weather_module, 'get_korean_address', side_effect=slow_address):
+            started = time.perf_counter()
+            lookup = WeatherService('key').lookup(36.3621, 127.3565, self.now, timeout=2)
+            elapsed = time.perf_counter() - started
+
+        self.assertEqual(lookup.city, '유성구 어은동')
+        self.assertEqual(lookup.result().current.key, '20250601_0900')
+        self.assertLess(elapsed, 0.55)
+
+    def test_fanout_tasks_clean_up_db_connections(self):
+        """풀 스레드 작업마다 앞뒤로 DB 연결을 정리하는지 테스트 (DB 캐시 연결이 스레드에 남지 않도록)"""
+        with mock.patch.object(kma, 'fetch_forecast_items', return_value=self.items), \
+                mock.patch.object(weather_module, 'get_korean_address', return_value='유성구 어은동'), \
+                mock.patch.object(weather_module, 'close_old_connections') as cleanup:
+            lookup = WeatherService('key').lookup(36.3621, 127.3565, self.now)
+        self.assertEqual(lookup.city, '유성구 어은동')
+        self.assertEqual(cleanup.call_count, 4)
+
+    def test_geocode_deadline_falls_back_to_cached_city(self):
+        """주소 변환이 제한 시간을 넘기면 기다리지 않고 캐시된 주소(없으면 None)를 쓰는지 테스트"""
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        with mock.patch.object(kma, 'fetch_forecast_items', return_value=self.items), \
+                mock.patch.object(weather_module, 'get_korean_address', side_effect=lambda lat, lon: release.wait(5)), \
+                mock.patch.object(weather_module, 'get_cached_korean_address', return_value='유성구 봉명동'):
+            started = time.perf_counter()
+            lookup = WeatherService('key').lookup(36.3621, 127.3565, self.now, timeout=0.2)
+            self.assertLess(time.perf_counter() - started, 1)
+        self.assertEqual(lookup.city, '유성구 봉명동')
+        self.assertEqual(lookup.result().current.key, '20250601_0900')
+
+    @override_settings(WEATHER_FANOUT_TIMEOUT=0.1)
+    def test_slow_forecast_outlives_geocode_deadline(self):
+        """예보가 주소 제한 시간보다 늦어도 기상청 타임아웃 안이면 기다려서 쓰는지 테스트"""
+        def slow_fetch(*args):
+            time.sleep(0.3)
+            return self.items
+
+        with mock.patch.object(kma, 'fetch_forecast_items', side_effect=slow_fetch), \
+                mock.patch.object(weather_module, 'get_korean_address', return_value='유성구 어은동'):
+            lookup = WeatherService('key').lookup(36.3621, 127.3565, self.now)
+        self.assertEqual(lookup.city, '유성구 어은동')
+        self.assertEqual(lookup.result().current.key, '20250601_0900')
+
+
+class PrefetchWeatherTest(SimpleTestCase):
+    """인기 격자 기록 + 발표 직후 미리 조회 테스트"""
+
+    def setUp(self):
+        cache.clear()
+        kma._hot_seen.clear()
+        self.addCleanup(kma._hot_seen.clear)
+
+    def test_hot_cells_ranked_and_throttled(self):
+        """격자 기록이 프로세스당 주기마다 한 번이고, 기록 횟수 순으로 반환되는지 테스트"""
+        kma.record_hot_cell(67, 100)
+        kma.record_hot_cell(67, 100)  # 주기 안 -> 무시
+        self.assertEqual(cache.get(kma.HOT_CELLS_KEY)[(67, 100)][1], 1)
+
+        kma._hot_seen.clear()  # 다른 워커
+        kma.record_hot_cell(67, 100)
+        kma.record_hot_cell(60, 127)
+        self.assertEqual(kma.hot_cells(), [(67, 100), (60, 127)])
+        self.assertEqual(kma.hot_cells(limit=1), [(67, 100)])
+
+    @mock.patch('django.conf.settings.KMA_API_KEY', 'key')
+    def test_prefetch_command_respects_budget_and_cache(self):
+        """예산 안의 인기 격자만, 이미 캐시된 격자는 건너뛰고 조회하는지 테스트"""
+        with tempfile.TemporaryDirectory() as cache_dir, override_settings(CACHES={'default': {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache', 'LOCATION': cache_dir,
+        }}):
+            for cell in [(67, 100), (67, 100), (60, 127), (60, 127), (98, 76)]:
+                kma._hot_seen.clear()
+                kma.record_hot_cell(*cell)
+
+            now = _kst(2025, 6, 1, 8, 12)
+            slot = ('20250601', '0800')
+            cache.set(kma.forecast_cache_key(60, 127, slot), _items(20))
+
+            with mock.patch.object(kma, 'fetch_forecast_items', return_value=_items(21)) as fetch, \
+                    mock.patch.object(kma, 'kst_now', return_value=now):
+                call_command('prefetch_weather', budget=2, rate=0, stdout=mock.Mock(), stderr=mock.Mock())
+
+            fetch.assert_called_once_with('key', 67, 100, slot)
+            self.assertTrue(kma.is_forecast_cached(67, 100, slot))
+            self.assertFalse(kma.is_forecast_cached(98, 76, slot))
+
+    @mock.patch('django.conf.settings.KMA_API_KEY', 'key')
+    def test_prefetch_command_requires_shared_cache(self):
+        """프로세스 전용 캐시(LocMemCache)면 아무 일 없이 끝나지 않고 오류를 내는지 테스트"""
+        with mock.patch.object(kma, 'fetch_forecast_items') as fetch:
+            with self.assertRaisesMessage(CommandError, 'CACHE_BACKEND'):
+                call_command('prefetch_weather', rate=0, stdout=mock.Mock(), stderr=mock.Mock())
+        fetch.assert_not_called()
+
+    def test_requests_record_grid_cell(self):
+        with mock.patch.object(kma, 'fetch_forecast_items', return_value=_fixture_items()):
+            WeatherService('key').forecast(36.3621, 127.3565, _kst(2025, 6, 1, 9, 0))
+        self.assertEqual(kma.hot_cells(), [latlon_to_grid(36.3621, 127.3565)])
@@ -1,42 +1,196 @@
-import requests
+"""
+좌표 -> 한글 행정동 변환 (카카오 coord2address + 캐시)
+- 좌표를 소수점 GEOCODE_PRECISION 자리(기본 3자리 ≈ 100m)로 묶어 같은 칸이면 같은 주소 사용
+- 조회 순서: 프로세스 캐시 -> 공유 캐시 -> 카카오 API
+- 오프라인 행정동 중심점(dong_centroids.json, 근사값)은 카카오 키가 없거나 실패/주소 없음일 때만 사용
+  (최근접 중심점이라 동 경계 부근은 틀릴 수 있음 -> 공유 캐시에는 넣지 않고 프로세스 캐시에 GEOCODE_SEED_TTL 동안만)
+- 주소 없음은 GEOCODE_NEGATIVE_TTL, API 오류/타임아웃은 GEOCODE_ERROR_TTL 동안 다시 호출하지 않음
+"""
+import json
+import logging
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+
 from django.conf import settings
+from django.core.cache import cache
 
-def get_korean_address(lat, lon):
-    """카카오 API로 좌표를 한글 행정동으로 변환"""
-    kakao_api_key = settings.KAKAO_REST_API_KEY
+from core import http
+
+SEED_FILENAME = 'dong_centroids.json'
+LOCAL_CACHE_SIZE = 4096
+SEED_CELL_DEGREES = 0.01  # 중심점 버킷 크기 (≈ 1km, 반경보다 커야 함)
+
+logger = logging.getLogger(__name__)
+_lock = threading.Lock()
+_local = OrderedDict()  # (lat, lon) -> (주소 또는 '', 만료 시각)
+_seed = None
+
+
+def _quantize(lat, lon):
+    precision = getattr(settings, 'GEOCODE_PRECISION', 3)
+    return round(float(lat), precision), round(float(lon), precision)
+
+
+def geocode_cache_key(lat, lon):
+    return f"geo:addr:{lat}:{lon}"
+
+
+def _seed_cell(lat, lon):
+    return math.floor(lat / SEED_CELL_DEGREES), math.floor(lon / SEED_CELL_DEGREES)
 
-    if not kakao_api_key or kakao_api_key == 'your-kakao-rest-api-key-here':
+
+def _load_seed():
+    """행정동 중심점 표 -> 약 1km 버킷별 (이름, 위도, 경도) 목록"""
+    global _seed
+    if _seed is not None:
+        return _seed
+
+    buckets = {}
+    for json_path in (os.path.join(settings.BASE_DIR, SEED_FILENAME), os.path.join(settings.BASE_DIR, 'data', SEED_FILENAME)):
+        if os.path.exists(json_path):
+            try:
+                with open(json_path, 'r', encoding='utf-8') as f:
+                    for row in json.load(f):
+                        lat, lon = float(row['lat']), float(row['lon'])
+                        buckets.setdefault(_seed_cell(lat, lon), []).append((row['name'], lat, lon))
+            except Exception as e:
+                logger.error("행정동 중심점 파일 로드 실패: %s", e)
+            break
+    _seed = buckets
+    return _seed
+
+
+def _seed_lookup(lat, lon):
+    """반경 GEOCODE_SEED_RADIUS_M 안에 있는 가장 가까운 행정동 중심점 이름"""
+    radius = getattr(settings, 'GEOCODE_SEED_RADIUS_M', 300)
+    buckets = _load_seed()
+    if not buckets or radius <= 0:
         return None
 
+    cell_lat, cell_lon = _seed_cell(lat, lon)
+    meters_per_lon = 111320 * math.cos(math.radians(lat))
+    best_name, best_distance = None, radius
+    for d_lat in (-1, 0, 1):
+        for d_lon in (-1, 0, 1):
+            for name, c_lat, c_lon in buckets.get((cell_lat + d_lat, cell_lon + d_lon), ()):
+                distance = math.hypot((lat - c_lat) * 110540, (lon - c_lon) * meters_per_lon)
+                if distance <= best_distance:
+                    best_name, best_distance = name, distance
+    return best_name
+
+
+def _local_get(key):
+    with _lock:
+        entry = _local.get(key)
+        if entry is None:
+            return None
+        if entry[1] < time.monotonic():
+            del _local[key]
+            return None
+        _local.move_to_end(key)
+        return entry[0]
+
+
+def _local_set(key, value, ttl):
+    with _lock:
+        _local[key] = (value, time.monotonic() + ttl)
+        _local.move_to_end(key)
+        while len(_local) > LOCAL_CACHE_SIZE:
+            _local.popitem(last=False)
+
+
+def _kakao_coord2address(lat, lon, kakao_api_key):
+    """카카오 API 호출 -> (주소 또는 None, 캐시 시간)"""
     try:
         # 카카오 로컬 API - 좌표 -> 주소 변환
         url = f"https://dapi.kakao.com/v2/local/geo/coord2address.json?x={lon}&y={lat}"
         headers = {"Authorization": f"KakaoAK {kakao_api_key}"}
-        response = requests.get(url, headers=headers, timeout=3)
+        response = http.get(url, headers=headers, timeout=3, max_retries=1)
 
         if response.status_code != 200:
-            print(f"[DEBUG] Kakao API Error: {response.status_code} {response.text}")
-
-        if response.status_code == 200:
-            data = response.json()
-            if data.get('documents'):
-                # 도로명 주소 우선, 없으면 지번 주소
-                doc = data['documents'][0]
-
-                # 행정동 정보 추출
-                if doc.get('address'):
-                    addr = doc['address']
-                    # 시/도, 시/군/구, 읍/면/동
-                    region_1 = addr.get('region_1depth_name', '')  # 시/도
-                    region_2 = addr.get('region_2depth_name', '')  # 시/군/구
-                    region_3 = addr.get('region_3depth_name', '')  # 읍/면/동
-
-                    result = f"{region_2} {region_3}" if region_3 else region_2
-                    print(f"[DEBUG] Kakao Address Found: {result}")
-                    return result
-
-        print(f"[DEBUG] Kakao Address Not Found for {lat}, {lon}")
-        return None
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning("카카오 API 오류: %s %.500s", response.status_code, response.text)
+            return None, getattr(settings, 'GEOCODE_ERROR_TTL', 60)
+
+        data = response.json()
+        if data.get('documents'):
+            # 도로명 주소 우선, 없으면 지번 주소
+            doc = data['documents'][0]
+
+            # 행정동 정보 추출
+            if doc.get('address'):
+                addr = doc['address']
+                # 시/도, 시/군/구, 읍/면/동
+                region_2 = addr.get('region_2depth_name', '')  # 시/군/구
+                region_3 = addr.get('region_3depth_name', '')  # 읍/면/동
+
+                result = f"{region_2} {region_3}" if region_3 else region_2
+                logger.debug("카카오 주소 찾음: %s", result)
+                return result, getattr(settings, 'GEOCODE_CACHE_TTL', 30 * 24 * 60 * 60)
+
+        logger.debug("카카오 주소 없음: %s, %s", lat, lon)
+        return None, getattr(settings, 'GEOCODE_NEGATIVE_TTL', 24 * 60 * 60)
     except Exception as e:
-        print(f"[ERROR] 카카오 API 주소 변환 실패: {e}")
-        return None
+        logger.warning("카카오 API 주소 변환 실패: %s", e)
+        return None, getattr(settings, 'GEOCODE_ERROR_TTL', 60)
+
+
+def _cached_address(lat, lon, key):
+    """Kakao 호출 없이 조회 -> 주소, '' (주소 없음으로 캐시됨) 또는 None (캐시 없음)"""
+    address = _local_get(key)
+    if address is not None:
+        return address
+
+    cached = cache.get(key)
+    if cached is not None:
+        # 공유 캐시 값: (주소 또는 '', 만료 epoch) -> 남은 시간만큼 프로세스 캐시에 보관
+        address, expires_at = cached
+        _local_set(key, address, max(1, expires_at - time.time()))
+        return address
+    return None
+
+
+def get_cached_korean_address(lat, lon):
+    """캐시에 있는 주소, 없으면 오프라인 중심점 근사값 (카카오 API 호출 없음)"""
+    lat, lon = _quantize(lat, lon)
+    return _cached_address(lat, lon, geocode_cache_key(lat, lon)) or _seed_lookup(lat, lon)
+
+
+def get_korean_address(lat, lon):
+    """카카오 API로 좌표를 한글 행정동으로 변환 (약 100m 단위 캐시, 없으면 None)"""
+    lat, lon = _quantize(lat, lon)
+    key = geocode_cache_key(lat, lon)
+
+    address = _cached_address(lat, lon, key)
+    if address:
+        return address
+    if address == '':
+        # 카카오 주소 없음/오류가 캐시된 칸 -> 근사값만 돌려주고 캐시는 그대로 둠
+        return _seed_lookup(lat, lon)
+
+    seed_ttl = getattr(settings, 'GEOCODE_SEED_TTL', 10 * 60)
+    kakao_api_key = settings.KAKAO_REST_API_KEY
+    if kakao_api_key and kakao_api_key != 'your-kakao-rest-api-key-here':
+        address, ttl = _kakao_coord2address(lat, lon, kakao_api_key)
+        cache.set(key, (address or '', time.time() + ttl), ttl)
+        _local_set(key, address or '', ttl)
+        if address:
+            return address
+        seed_ttl = min(seed_ttl, ttl)  # 오류면 카카오 재시도 시점보다 오래 근사값을 두지 않음
+
+    # 카카오 키 없음/실패/주소 없음 -> 오프라인 중심점 근사값 (프로세스 캐시에 짧게만)
+    address = _seed_lookup(lat, lon)
+    if address:
+        _local_set(key, address, seed_ttl)
+    return address
+
+
+def reset_geocode_cache():
+    """프로세스 캐시/중심점 표 초기화 (테스트용)"""
+    global _seed
+    with _lock:
+        _local.clear()
+        _seed = None
@@ -0,0 +1,257 @@
+"""
+날씨 서비스 (기상청 단기예보 조회 + 파싱 공용)
+- OOTD 추천과 날씨 API 가 같은 예보/같은 파싱 결과를 사용
+- item 목록을 한 번 훑어 시간대별 ForecastRecord 로 정리 (정렬도 한 번)
+- 파싱 결과는 (nx, ny, 발표 slot)별로 프로세스 안에서 재사용
+- 예보 조회와 주소 변환(카카오)은 동시에 실행 (주소 조회 제한 시간 WEATHER_FANOUT_TIMEOUT)
+"""
+import logging
+import threading
+from bisect import bisect_left
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import close_old_connections
+
+from config.weather_config import get_weather_description, latlon_to_grid
+
+from . import kma
+from .utils import get_cached_korean_address, get_korean_address
+
+PARSED_CACHE_SIZE = 256
+FANOUT_WORKERS = 16
+
+# 날씨/주소 동시 조회용 (제한 시간을 넘긴 작업은 계속 실행되어 캐시를 채움)
+logger = logging.getLogger(__name__)
+_fanout = ThreadPoolExecutor(max_workers=FANOUT_WORKERS, thread_name_prefix='weather-fanout')
+
+
+def _run_with_db_cleanup(func, *args):
+    """풀 스레드 작업 (요청 스레드가 아니라 request_finished 정리가 없으므로 앞뒤로 오래된/깨진 DB 연결 정리)"""
+    close_old_connections()
+    try:
+        return func(*args)
+    finally:
+        close_old_connections()
+
+
+def parse_rain_amount(pcp_str) -> float:
+    """강수량 문자열 파싱"""
+    if pcp_str == '강수없음':
+        return 0
+    elif pcp_str == '1mm 미만':
+        return 0.5
+    else:
+        try:
+            return float(pcp_str.replace('mm', ''))
+        except:
+            return 0
+
+
+def weather_icon(sky: str, pty: str) -> str:
+    """기상청 코드 -> 간단한 아이콘"""
+    if pty in ['1', '2', '4', '5', '6']:
+        return '🌧️'
+    elif pty in ['3', '7']:
+        return '🌨️'
+    elif sky == '1':
+        return '☀️'
+    elif sky == '3':
+        return '⛅'
+    return '☁️'
+
+
+class ForecastRecord:
+    """한 예보 시각의 값 (없는 항목은 None, 하늘/강수형태는 기상청 코드 문자열)"""
+    __slots__ = ('key', 'tmp', 'sky', 'pty', 'pop', 'reh', 'wsd', 'pcp')
+
+    def __init__(self, key: str):
+        self.key = key  # 'YYYYMMDD_HHMM'
+        self.tmp: Optional[float] = None
+        self.sky = '1'
+        self.pty = '0'
+        self.pop = 0
+        self.reh: Optional[int] = None
+        self.wsd = 0.0
+        self.pcp = '강수없음'
+
+    @property
+    def date(self) -> str:
+        return self.key[:8]
+
+    @property
+    def hour_label(self) -> str:
+        return f"{self.key[9:11]}시"
+
+    @property
+    def rain_amount(self) -> float:
+        return parse_rain_amount(self.pcp)
+
+
+# 사용하는 예보 항목 -> (ForecastRecord 속성, 변환 함수), 나머지 항목(UUU, VEC, SNO ...)은 건너뜀
+FIELDS = {
+    'TMP': ('tmp', float),
+    'SKY': ('sky', str),
+    'PTY': ('pty', str),
+    'POP': ('pop', int),
+    'REH': ('reh', int),
+    'WSD': ('wsd', float),
+    'PCP': ('pcp', str),
+}
+
+
+class ParsedForecast:
+    """발표 하나의 예보 (시각 순 ForecastRecord 목록 + 날짜별 최저/최고 기온)"""
+    __slots__ = ('records', 'keys', 'temp_range_by_date')
+
+    def __init__(self, items: List[dict]):
+        by_key: Dict[str, ForecastRecord] = {}
+        for item in items:
+            field = FIELDS.get(item['category'])
+            if field is None:
+                continue
+            key = f"{item['fcstDate']}_{item['fcstTime']}"
+            record = by_key.get(key)
+            if record is None:
+                record = by_key[key] = ForecastRecord(key)
+            try:
+                setattr(record, field[0], field[1](item['fcstValue']))
+            except (TypeError, ValueError):
+                pass  # 형식이 잘못된 값은 기본값 유지
+
+        self.records = [by_key[key] for key in sorted(by_key)]
+        self.keys = [record.key for record in self.records]
+
+        temp_range_by_date: Dict[str, Tuple[float, float]] = {}
+        for record in self.records:
+            if record.tmp is not None:
+                low, high = temp_range_by_date.get(record.date, (record.tmp, record.tmp))
+                temp_range_by_date[record.date] = (min(low, record.tmp), max(high, record.tmp))
+        self.temp_range_by_date = temp_range_by_date
+
+    def snapshot(self, now: datetime, hours: int = 12) -> 'WeatherSnapshot':
+        """now 기준 현재 예보, 오늘 최저/최고, 이후 hours 시간 예보"""
+        start = bisect_left(self.keys, now.strftime('%Y%m%d_%H00'))
+        if start >= len(self.records):
+            start = 0  # 모두 지난 예보면 첫 예보 사용
+        current = self.records[start] if self.records else ForecastRecord('')
+
+        temp = current.tmp if current.tmp is not None else 15.0
+        today_range = self.temp_range_by_date.get(now.strftime('%Y%m%d'))
+        temp_min, temp_max = today_range if today_range else (temp - 3, temp + 3)
+        return WeatherSnapshot(current, temp, temp_min, temp_max, self.records[start:start + hours])
+
+
+class WeatherSnapshot:
+    """현재 날씨 + 시간별 예보"""
+    __slots__ = ('current', 'temp', 'temp_min', 'temp_max', 'hourly')
+
+    def __init__(self, current: ForecastRecord, temp: float, temp_min: float, temp_max: float, hourly: List[ForecastRecord]):
+        self.current = current
+        self.temp = temp
+        self.temp_min = temp_min
+        self.temp_max = temp_max
+        self.hourly = hourly
+
+    @property
+    def description(self) -> str:
+        return get_weather_description(self.current.sky, self.current.pty)
+
+
+class WeatherLookup:
+    """날씨/주소 동시 조회 결과 (city 는 항상 채워짐, 날씨 실패는 result() 에서 예외)"""
+    __slots__ = ('city', 'weather', 'error')
+
+    def __init__(self, city: Optional[str], weather: Optional[WeatherSnapshot], error: Optional[BaseException]):
+        self.city = city
+        self.weather = weather
+        self.error = error
+
+    def result(self) -> WeatherSnapshot:
+        if self.weather is None:
+            raise self.error or Exception("No weather data")
+        return self.weather
+
+
+class WeatherService:
+    """기상청 단기예보 조회 (공유 캐시) + 파싱 결과 재사용"""
+
+    _lock = threading.Lock()
+    _parsed: "OrderedDict[Tuple[int, int, Tuple[str, str]], ParsedForecast]" = OrderedDict()
+
+    def __init__(self, api_key: Optional[str] = None):
+        self.api_key = api_key if api_key is not None else settings.KMA_API_KEY
+
+    def forecast(self, lat: float, lon: float, now: Optional[datetime] = None) -> ParsedForecast:
+        """위경도의 최신 예보 (파싱 결과는 격자/발표 시각별로 재사용)"""
+        nx, ny = latlon_to_grid(lat, lon)
+        now = now or kma.kst_now()
+        kma.record_hot_cell(nx, ny)
+
+        # 현재 발표분을 이미 파싱했으면 캐시 조회도 생략 (발표분 내용은 바뀌지 않음)
+        parsed = self._get_parsed((nx, ny, kma.base_slot(now)))
+        if parsed is not None:
+            return parsed
+
+        slot, items = kma.get_forecast(self.api_key, nx, ny, now)
+        key = (nx, ny, slot)
+        parsed = self._get_parsed(key)
+        if parsed is not None:
+            return parsed
+
+        parsed = ParsedForecast(items)
+        with self._lock:
+            self._parsed[key] = parsed
+            while len(self._parsed) > PARSED_CACHE_SIZE:
+                self._parsed.popitem(last=False)
+        return parsed
+
+    def snapshot(self, lat: float, lon: float, now: Optional[datetime] = None, hours: int = 12) -> WeatherSnapshot:
+        """현재 날씨 + 시간별 예보 (예보가 없으면 예외)"""
+        now = now or kma.kst_now()
+        parsed = self.forecast(lat, lon, now)
+        if not parsed.records:
+            raise Exception("No weather data")
+        return parsed.snapshot(now, hours)
+
+    def lookup(self, lat: float, lon: float, now: Optional[datetime] = None, hours: int = 12,
+               timeout: Optional[float] = None) -> WeatherLookup:
+        """
+        예보와 주소를 동시에 조회 (지연 = 둘 중 느린 쪽)
+
+        제한 시간(timeout, 기본 WEATHER_FANOUT_TIMEOUT)은 주소 조회에만 적용:
+        주소가 그 안에 오지 않으면 캐시된 주소, 그것도 없으면 None
+        예보는 기상청 호출 자체의 타임아웃/재시도(kma.fetch_forecast_items)까지 기다림
+        """
+        now = now or kma.kst_now()
+        if timeout is None:
+            timeout = getattr(settings, 'WEATHER_FANOUT_TIMEOUT', 5)
+
+        weather_future = _fanout.submit(_run_with_db_cleanup, self.snapshot, lat, lon, now, hours)
+        address_future = _fanout.submit(_run_with_db_cleanup, get_korean_address, lat, lon)
+        wait([address_future], timeout=timeout)
+
+        if address_future.done() and address_future.exception() is None:
+            city = address_future.result()
+        else:
+            logger.info("주소 변환 제한 시간 초과 (%ss) - 캐시된 주소 사용", timeout)
+            city = get_cached_korean_address(lat, lon)
+
+        error = weather_future.exception()  # 예보가 끝날 때까지 대기
+        return WeatherLookup(city, None if error else weather_future.result(), error)
+
+    @classmethod
+    def _get_parsed(cls, key) -> Optional[ParsedForecast]:
+        with cls._lock:
+            parsed = cls._parsed.get(key)
+            if parsed is not None:
+                cls._parsed.move_to_end(key)
+            return parsed
+
+    @classmethod
+    def clear_parsed_cache(cls):
+        with cls._lock:
+            cls._parsed.clear()
@@ -1,3 +1,4 @@
+import logging
 import secrets
 import string
 import random
@@ -23,6 +24,7 @@ from .serializers import (
 )
 
 User = get_user_model()
+logger = logging.getLogger(__name__)
 
 
 class RegisterAPIView(APIView):
@@ -322,7 +324,7 @@ Fortune Life 팀''',
             }, status=status.HTTP_404_NOT_FOUND)
 
         except Exception as e:
-            print(f"[SendPasswordResetCodeAPIView] Error: {e}")
+            logger.exception("비밀번호 재설정 코드 전송 실패: %s", e)
             return Response({
                 'success': False,
                 'error': '이메일 전송에 실패했습니다. 잠시 후 다시 시도해주세요.'
@@ -423,7 +425,7 @@ Fortune Life 팀''',
             }, status=status.HTTP_404_NOT_FOUND)
 
         except Exception as e:
-            print(f"[VerifyCodeAndResetPasswordAPIView] Error: {e}")
+            logger.exception("비밀번호 재설정 실패: %s", e)
             return Response({
                 'success': False,
                 'error': '임시 비밀번호 발송에 실패했습니다. 잠시 후 다시 시도해주세요.'